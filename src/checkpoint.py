@@ -0,0 +1,159 @@
+"""
+Module Name: checkpoint.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Periodic checkpointing of the backtracking search so long solves can be resumed after
+the process is stopped or killed.
+
+Module Summary:
+The search state of `assign_groups_iterative` is just the option index chosen for each placed group
+plus the option the next group will be tried from; room bookings and the symmetry-breaking state are
+rebuilt from it on resume. A checkpoint file holds that state together with a fingerprint of the
+search tree (groups in order with every field the constraints read, each group's candidate rooms
+with theirs, time gap, symmetry on/off), so a checkpoint cannot be resumed against different input.
+
+File format: the magic bytes b"RATCKPT1" followed by zlib-compressed JSON. Files are written to a
+temporary name and renamed, so a crash mid-write never leaves a corrupt checkpoint.
+
+Key Functions:
+- Checkpointer: `on_step` hook that saves every N seconds and on SIGTERM
+- load_checkpoint: Reads a checkpoint and verifies it matches the current search
+- search_fingerprint: Identifies the search tree a state belongs to
+
+Dependencies:
+- hashlib, json, zlib, signal, time
+
+Known/Suspected Errors:
+- None known at this time.
+"""
+
+import hashlib
+import json
+import os
+import signal
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+from .group import Group
+from .room import Room
+
+MAGIC = b"RATCKPT1"
+
+class SearchInterrupted(Exception):
+    """
+    SearchInterrupted
+        Raised from inside the search after a final checkpoint was written on SIGTERM.
+    """
+
+def search_fingerprint(groups: List[Group], rooms: List[Room], time_gap: int,
+                       candidates: Optional[Dict[str, List[Room]]], symmetry: bool) -> str:
+    """
+    search_fingerprint
+        Hashes everything that determines the shape and order of the search tree, including every
+        group and room field a constraint reads, so edited input is not mistaken for the same search.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{time_gap}|{symmetry}".encode())
+    for group in groups:
+        options = candidates[group.id] if candidates is not None else rooms
+        digest.update(("\n" + _group_key(group) + ":" + ",".join(_room_key(room) for room in options)).encode())
+    return digest.hexdigest()
+
+def _group_key(group: Group) -> str:
+    recurrence = group.recurrence.sort_key if group.recurrence is not None else None
+    return repr((group.id, group.start.isoformat(), group.end.isoformat(), group.size, group.wheelchair_access,
+                 group.projector, group.computer, group.floor_preference, recurrence, group.cohort, group.site))
+
+def _room_key(room: Room) -> str:
+    return repr((room.id, room.capacity, room.wheelchair_access, room.projector, room.computer,
+                 room.floor_level, room.site))
+
+class Checkpointer:
+    def __init__(self, path: str, fingerprint: str, every_seconds: float = 60.0):
+        """
+        __init__
+            Prepares a checkpoint writer. Call `install_signal_handler` to also save on SIGTERM.
+
+        Parameters:
+            path (str) - checkpoint file to (over)write
+            fingerprint (str) - `search_fingerprint` of the search being checkpointed
+            every_seconds (float) - minimum time between periodic checkpoints
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.every_seconds = every_seconds
+        self.saved = 0
+        self._due = time.monotonic() + every_seconds
+        self._stop_requested = False
+        self._previous_handler = None
+
+    def __call__(self, stack: List[int], next_option: int):
+        """
+        __call__
+            The `on_step` hook: saves when the interval has passed, and on a pending SIGTERM saves
+            and stops the search with SearchInterrupted.
+        """
+        if self._stop_requested:
+            self.save(stack, next_option)
+            raise SearchInterrupted(self.path)
+        if time.monotonic() >= self._due:
+            self.save(stack, next_option)
+            self._due = time.monotonic() + self.every_seconds
+
+    def save(self, stack: List[int], next_option: int):
+        state = {"fingerprint": self.fingerprint, "stack": stack, "next": next_option}
+        temporary = self.path + ".tmp"
+        with open(temporary, "wb") as file:
+            file.write(MAGIC + zlib.compress(json.dumps(state, separators=(",", ":")).encode(), 9))
+        os.replace(temporary, self.path)
+        self.saved += 1
+
+    def install_signal_handler(self):
+        """
+        install_signal_handler
+            Makes SIGTERM request a final checkpoint; the search stops at its next step, where its
+            state is consistent.
+        """
+        def request_stop(signum, frame):
+            self._stop_requested = True
+        self._previous_handler = signal.signal(signal.SIGTERM, request_stop)
+
+    def remove_signal_handler(self):
+        if self._previous_handler is not None:
+            signal.signal(signal.SIGTERM, self._previous_handler)
+            self._previous_handler = None
+
+    def discard(self):
+        """
+        discard
+            Deletes the checkpoint file once the search has finished.
+        """
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+def load_checkpoint(path: str, fingerprint: str) -> Tuple[List[int], int]:
+    """
+    load_checkpoint
+        Reads a checkpoint written by Checkpointer.
+
+    Parameters:
+        path (str) - checkpoint file
+        fingerprint (str) - `search_fingerprint` of the search about to be resumed
+
+    Return Value:
+        Tuple[List[int], int] - the `resume` argument for `assign_groups_iterative`
+
+    Exceptions:
+        FileNotFoundError - if the file does not exist
+        ValueError - if the file is not a checkpoint or belongs to a different input
+    """
+    with open(path, "rb") as file:
+        data = file.read()
+    if not data.startswith(MAGIC):
+        raise ValueError(f"'{path}' is not a checkpoint file")
+    try:
+        state = json.loads(zlib.decompress(data[len(MAGIC):]))
+    except (zlib.error, ValueError):
+        raise ValueError(f"Checkpoint '{path}' is corrupt")
+    if state.get("fingerprint") != fingerprint:
+        raise ValueError(f"Checkpoint '{path}' was written for different input or settings")
+    return list(state["stack"]), int(state["next"])
@@ -0,0 +1,126 @@
+"""
+Module Name: chunked_loader.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Parses and validates very large CSV files in parallel by splitting them into
+byte ranges on line boundaries and handing each range to a worker process.
+
+Module Summary:
+The serial path (`read_csv` + `parse_rows`) converts every row on a single core. For exports with
+millions of rows this module instead:
+- Splits the file body into byte ranges that each start at the beginning of a line.
+- Parses every range with `parse_group`/`parse_room` in a `ProcessPoolExecutor`.
+- Merges the ranges back in file order, so duplicate checks and sorting in `finalize_input`
+  see exactly the same list as the serial path.
+Rows that fail validation are sent back raw and re-parsed in the parent with their global row
+index, so error messages and line numbers are identical to the serial ones.
+
+Key Functions:
+- load_rows_chunked: Drop-in parallel replacement for `parse_rows(read_csv(filename), parse_fn)`
+- split_byte_ranges: Computes line-aligned byte ranges for a file
+
+Dependencies:
+- concurrent.futures, csv, io, os
+
+Known/Suspected Errors:
+- Quoted fields containing line breaks are not supported (a range could start inside them).
+  None of the tool's input formats use such fields.
+"""
+
+import csv
+import io
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+CHUNKED_MIN_BYTES = 16 * 1024 * 1024  # files at least this large are parsed in parallel
+MIN_CHUNK_BYTES = 1024 * 1024
+
+def load_rows_chunked(filename: str, parse_fn: Callable, workers: Optional[int] = None,
+                      chunk_bytes: Optional[int] = None) -> Tuple[list, List[str]]:
+    """
+    load_rows_chunked
+        Reads and parses a CSV file in parallel chunks.
+
+    Parameters:
+        filename (str) - path to the CSV file
+        parse_fn (Callable) - `parse_group` or `parse_room` (must be a module-level function)
+        workers (int, optional) - number of worker processes (defaults to the CPU count)
+        chunk_bytes (int, optional) - target size of each range (defaults to a few per worker)
+
+    Return Value:
+        Tuple[list, List[str]] - the valid objects and the error messages, identical to `parse_rows`
+
+    Exceptions:
+        FileNotFoundError - if the file does not exist
+    """
+    from concurrent.futures import ProcessPoolExecutor  # pulls in multiprocessing; only needed here
+
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(filename)
+    if chunk_bytes is None:
+        chunk_bytes = max(MIN_CHUNK_BYTES, size // (workers * 4) + 1)
+
+    fieldnames, ranges = split_byte_ranges(filename, chunk_bytes)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = list(pool.map(_parse_chunk, [(filename, start, end, fieldnames, parse_fn) for start, end in ranges]))
+
+    parsed, errors = [], []
+    offset = 0
+    for objects, failed, row_count in chunks:
+        parsed.extend(objects)
+        for local_index, row in failed:
+            try:
+                parse_fn(row, offset + local_index)
+            except ValueError as e:
+                errors.append(str(e))
+        offset += row_count
+    return parsed, errors
+
+def split_byte_ranges(filename: str, chunk_bytes: int) -> Tuple[List[str], List[Tuple[int, int]]]:
+    """
+    split_byte_ranges
+        Reads the header and splits the rest of the file into ranges of roughly `chunk_bytes`,
+        each extended to the end of the line it stops in.
+
+    Parameters:
+        filename (str) - path to the CSV file
+        chunk_bytes (int) - target size of each range
+
+    Return Value:
+        Tuple[List[str], List[Tuple[int, int]]] - header field names and (start, end) byte offsets
+    """
+    with open(filename, 'rb') as f:
+        header = f.readline()
+        fieldnames = next(csv.reader([header.decode('utf-8')]), [])
+        body_start = f.tell()
+        size = os.fstat(f.fileno()).st_size
+
+        ranges = []
+        start = body_start
+        while start < size:
+            f.seek(min(start + chunk_bytes, size))
+            f.readline()  # move to the start of the next line
+            end = min(f.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return fieldnames, ranges
+
+def _parse_chunk(task: Tuple[str, int, int, List[str], Callable]) -> Tuple[list, List[Tuple[int, Dict]], int]:
+    """
+    _parse_chunk
+        Worker: parses one byte range. Returns the valid objects, the (chunk-local index, raw row)
+        pairs that failed, and the number of rows seen so the parent can compute global indices.
+    """
+    filename, start, end, fieldnames, parse_fn = task
+    with open(filename, 'rb') as f:
+        f.seek(start)
+        text = f.read(end - start).decode('utf-8')
+
+    objects, failed = [], []
+    row_count = 0
+    for local_index, row in enumerate(csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)):
+        row_count += 1
+        try:
+            objects.append(parse_fn(row, local_index))
+        except ValueError:
+            failed.append((local_index, row))
+    return objects, failed, row_count
@@ -3,12 +3,13 @@ Module Name: constraints.py
 Project Name: Room Assignment Tool (Imperative Solution)
 File Purpose: Defines all constraint-checking logic used to validate whether a group
 can be assigned to a given room based on equipment, capacity, accessibility,
-schedule conflicts, and floor preference.
+schedule conflicts, site pinning and floor preference.
 """
 
 from datetime import timedelta
 from .group import Group
 from .room import Room
+from .recurrence import bookings_conflict
 
 def is_valid_assignment(group: Group, room: Room, time_gap: int) -> bool:
     """
@@ -24,6 +25,7 @@ def is_valid_assignment(group: Group, room: Room, time_gap: int) -> bool:
         bool - True if all constraints pass; otherwise, False.
     """
     return all([
+        check_site(group, room),
         check_floor_preference(group, room),
         check_room_capacity(group, room),
         check_wheelchair_access(group, room),
@@ -31,10 +33,32 @@ def is_valid_assignment(group: Group, room: Room, time_gap: int) -> bool:
         check_time_overlap(group, room, time_gap)
     ])
 
+def is_compatible(group: Group, room: Room, soft_floor: bool = False) -> bool:
+    """
+    is_compatible
+        Combines the static (schedule-independent) constraint checks. The result for a
+        given group and room never changes during a solve, so it can be computed once.
+
+    Parameters:
+        group (Group) - The group being assigned.
+        room (Room) - The room being considered for assignment.
+        soft_floor (bool) - Skip the floor check, for solvers that score the floor preference
+                            instead of enforcing it (see scoring.py).
+
+    Return Value:
+        bool - True if site, floor, capacity, accessibility and equipment checks pass.
+    """
+    return check_site(group, room) and \
+           (soft_floor or check_floor_preference(group, room)) and \
+           check_room_capacity(group, room) and \
+           check_wheelchair_access(group, room) and \
+           check_equipment(group, room)
+
 def check_time_overlap(group: Group, room: Room, time_gap: int) -> bool:
     """
     check_time_overlap
         Ensures no schedule conflicts exist for the room, including a time buffer.
+        Recurring bookings are compared on their patterns (see recurrence.py).
 
     Parameters:
         group (Group) - The group to be scheduled.
@@ -48,11 +72,47 @@ def check_time_overlap(group: Group, room: Room, time_gap: int) -> bool:
     new_start = group.start
     new_end = group.end
 
-    for existing_start, existing_end, _ in room.schedule:
-        if (new_start < existing_end + buffer) and (new_end > existing_start - buffer):
+    recurrence = group.recurrence
+
+    for existing_start, existing_end, existing in room.schedule:
+        if recurrence is None and existing.recurrence is None:
+            if (new_start < existing_end + buffer) and (new_end > existing_start - buffer):
+                return False
+        elif bookings_conflict(new_start, new_end, recurrence,
+                               existing_start, existing_end, existing.recurrence, buffer):
             return False
     return True
 
+def groups_conflict(group: Group, other: Group, time_gap: int) -> bool:
+    """
+    groups_conflict
+        Pairwise form of `check_time_overlap`: checks whether two groups could not share a room.
+
+    Parameters:
+        group (Group) - The group to be scheduled.
+        other (Group) - A group already booked in the room.
+        time_gap (int) - The buffer in minutes between bookings.
+
+    Return Value:
+        bool - True if the bookings (or any of their occurrences) come within the gap.
+    """
+    return bookings_conflict(group.start, group.end, group.recurrence,
+                             other.start, other.end, other.recurrence, timedelta(minutes=time_gap))
+
+def check_site(group: Group, room: Room) -> bool:
+    """
+    check_site
+        Keeps groups pinned to a site (building or campus) in that site's rooms.
+
+    Parameters:
+        group (Group) - The group, possibly pinned to a site.
+        room (Room) - The room being checked.
+
+    Return Value:
+        bool - True if the group is not pinned or the room is on its site.
+    """
+    return not group.site or group.site == room.site
+
 def check_floor_preference(group: Group, room: Room) -> bool:
     """
     check_floor_preference
@@ -0,0 +1,171 @@
+"""
+Module Name: diagnose.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Explains why an input has no assignment by extracting a small set of groups that
+cannot be satisfied together, with the rooms they compete for and the resource that runs out.
+
+Module Summary:
+Feasibility is monotone in the set of groups: removing a group never makes a feasible input
+infeasible. So an infeasible set can be shrunk by deleting groups and keeping every deletion after
+which the remaining groups are still infeasible. The shrinking:
+- starts from the groups that break the matching bound, when it fails (one cheap check that often
+  isolates the conflict already), otherwise from all groups;
+- deletes chunks of groups first, halving the chunk size down to single groups, so large
+  irrelevant parts of a 2,000-row file go in a few checks;
+- decides each check with the matching bound first and the symmetry-breaking search only when it
+  passes;
+- caches verdicts and reuses them for subsets and supersets: a subset of a feasible set is
+  feasible, and a superset of an infeasible one is infeasible.
+After the last single-group pass, every remaining group is needed: dropping any one of them makes
+the rest satisfiable, so the core is minimal (though not necessarily the smallest one possible).
+
+Key Functions:
+- find_infeasible_core: Returns the core, or None if the input is feasible
+- InfeasibleCore: Core groups, their compatible rooms, time window and an explanation
+
+Dependencies:
+- solver.py and symmetry.py for the feasibility checks
+- sites.py when travel rules between sites are given
+
+Known/Suspected Errors:
+- A single check can still take exponential time when the matching bound passes on an infeasible
+  subset, as for any full solve.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, FrozenSet, List, Optional
+from .group import Group
+from .room import Room
+from .solver import assign_groups_iterative, build_candidates, find_matching_violation
+from .symmetry import build_symmetry, canonical_order
+
+@dataclass
+class InfeasibleCore:
+    groups: List[Group]
+    rooms: List[Room]
+    start: datetime
+    end: datetime
+    reason: str
+
+class _FeasibilityCache:
+    def __init__(self, rooms: List[Room], time_gap: int, transitions=None):
+        self.rooms = rooms
+        self.time_gap = time_gap
+        self.transitions = transitions
+        self.feasible: List[FrozenSet[str]] = []
+        self.infeasible: List[FrozenSet[str]] = []
+        self.checks = 0
+
+    def is_infeasible(self, groups: List[Group]) -> bool:
+        """
+        is_infeasible
+            Decides whether the groups have no assignment, from the cache when a known subset is
+            infeasible or a known superset is feasible.
+        """
+        key = frozenset(group.id for group in groups)
+        if any(known <= key for known in self.infeasible):
+            return True
+        if any(key <= known for known in self.feasible):
+            return False
+
+        self.checks += 1
+        order = canonical_order(groups)
+        candidates = build_candidates(order, self.rooms)
+        if find_matching_violation(order, candidates, self.time_gap) is not None:
+            infeasible = True
+        elif self.transitions is not None:
+            from .sites import cohort_links, solve_jointly
+            infeasible = solve_jointly(order, self.rooms, self.time_gap, self.transitions, None,
+                                       cohort_links(order)) is None
+        else:
+            infeasible = assign_groups_iterative(order, self.rooms, self.time_gap, candidates=candidates,
+                                                 symmetry=build_symmetry(order, self.rooms)) is None
+        for room in self.rooms:
+            room.clear_schedule()
+
+        (self.infeasible if infeasible else self.feasible).append(key)
+        return infeasible
+
+def find_infeasible_core(groups: List[Group], rooms: List[Room], time_gap: int,
+                         transitions=None) -> Optional[InfeasibleCore]:
+    """
+    find_infeasible_core
+        Finds a minimal set of groups that cannot all be assigned (see the module summary).
+
+    Parameters:
+        groups (List[Group]) - All groups of the input
+        rooms (List[Room]) - All rooms of the input (their schedules are cleared)
+        time_gap (int) - Minimum time gap (in minutes) required between group schedules
+        transitions (TransitionRules, optional) - Travel gaps between sites for cohorts (see sites.py)
+
+    Return Value:
+        Optional[InfeasibleCore] - The core and its explanation, or None if every group can be assigned
+    """
+    for room in rooms:
+        room.clear_schedule()
+    cache = _FeasibilityCache(rooms, time_gap, transitions)
+    if not cache.is_infeasible(groups):
+        return None
+
+    start = find_matching_violation(groups, build_candidates(groups, rooms), time_gap) or list(groups)
+    core = _shrink(start, cache.is_infeasible)
+    return _explain(sorted(core, key=lambda g: (g.start, g.id)), rooms, time_gap, transitions is not None)
+
+def _shrink(core: List[Group], is_infeasible: Callable[[List[Group]], bool]) -> List[Group]:
+    """
+    _shrink
+        Deletion-based shrinking: drops chunks of groups while the rest stays infeasible, halving the
+        chunk size down to single groups.
+    """
+    chunk = max(1, len(core) // 2)
+    while True:
+        position = 0
+        while position < len(core):
+            trial = core[:position] + core[position + chunk:]
+            if trial and is_infeasible(trial):
+                core = trial
+            else:
+                position += chunk
+        if chunk == 1:
+            return core
+        chunk //= 2
+
+def _explain(core: List[Group], rooms: List[Room], time_gap: int, travel: bool = False) -> InfeasibleCore:
+    """
+    _explain
+        Names the resource the core runs out of: the requirements all its groups share, and the
+        rooms that meet each group's requirements. When the groups all overlap at one instant there
+        are simply too few such rooms; otherwise the rooms cannot be shared out over the time.
+    """
+    candidates = build_candidates(core, rooms)
+    usable: Dict[str, Room] = {room.id: room for group in core for room in candidates[group.id]}
+    core_rooms = [room for room in rooms if room.id in usable]
+
+    needs = [f"capacity {min(group.size for group in core)}+"]
+    for feature, label in (("wheelchair_access", "wheelchair access"), ("projector", "a projector"),
+                           ("computer", "computers")):
+        if all(getattr(group, feature) for group in core):
+            needs.append(label)
+    sites = {group.site for group in core}
+    if len(sites) == 1 and "" not in sites:
+        needs.append(f"site {sites.pop()}")
+    floors = {group.floor_preference for group in core}
+    if len(floors) == 1 and -1 not in floors:
+        needs.append(f"floor {floors.pop()}")
+    need = ", ".join(needs)
+
+    count = len(core)
+    overlapping = max(g.start for g in core) < min(g.end for g in core) + timedelta(minutes=time_gap)
+    if not core_rooms:
+        reason = f"no room offers {need}"
+    elif overlapping and len(core_rooms) < count:
+        exist = "such rooms exist" if len(core_rooms) > 1 else "such room exists"
+        reason = f"{count} groups in this window need a room with {need}, but only {len(core_rooms)} {exist}"
+    else:
+        reason = (f"the {count} groups cannot share their {len(core_rooms)} compatible rooms "
+                  f"while keeping the {time_gap}-minute gap between bookings")
+        if travel and len({room.site for room in core_rooms}) > 1:
+            reason += " and the travel time between sites"
+
+    return InfeasibleCore(core, core_rooms, min(g.start for g in core), max(g.last_end for g in core), reason)
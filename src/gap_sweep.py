@@ -0,0 +1,156 @@
+"""
+Module Name: gap_sweep.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Finds the largest time gap (changeover buffer) for which a complete
+assignment still exists, using a binary search over repeated solves.
+
+Module Summary:
+Feasibility is monotone in the time gap: an assignment that works with a gap of g minutes
+also works with any smaller gap. This module binary-searches the gap between 0 and the
+length of the whole schedule, and speeds up each probe by:
+- Computing the statically compatible rooms of every group once (`build_candidates`).
+- Warm-starting each solve by trying the room each group received in the last feasible
+  assignment first.
+- Searching with an explicit stack (`assign_groups_iterative`), so large inputs do not hit
+  the recursion limit, and with symmetry breaking between interchangeable rooms and groups.
+- Rejecting a gap without searching when too many groups collide at one instant
+  (`passes_matching_bound`), which keeps infeasible probes from exhausting the search tree.
+- Raising the lower bound to the smallest gap actually left between bookings in a feasible
+  assignment, which skips probes the assignment already answers.
+
+Key Functions:
+- sweep_time_gap: Runs the search and returns the best gap, its assignment and every probe.
+- achieved_gap: Smallest buffer between consecutive bookings of an assignment.
+
+Dependencies:
+- solver.py for `assign_groups_iterative`, `build_candidates` and `passes_matching_bound`
+- symmetry.py for the group order and symmetry breaking of each probe
+- time for per-probe timing
+
+Known/Suspected Errors:
+- None known at this time.
+"""
+
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+from .group import Group
+from .room import Room
+from .solver import assign_groups_iterative, build_candidates, passes_matching_bound
+from .symmetry import build_symmetry, canonical_order
+
+@dataclass
+class GapProbe:
+    gap: int
+    feasible: bool
+    seconds: float
+
+@dataclass
+class GapSweepResult:
+    best_gap: Optional[int]
+    assignment: Optional[List[Room]]
+    probes: List[GapProbe] = field(default_factory=list)
+
+def sweep_time_gap(groups: List[Group], rooms: List[Room], min_gap: int = 0) -> GapSweepResult:
+    """
+    sweep_time_gap
+        Binary-searches the largest time gap that still admits a complete assignment.
+
+    Parameters:
+        groups (List[Group]) - Groups to assign (sorted as produced by `preprocess_data`)
+        rooms (List[Room]) - Available rooms (schedules are cleared and modified in-place)
+        min_gap (int) - Smallest gap to consider, in minutes
+
+    Return Value:
+        GapSweepResult - best gap (None if even `min_gap` is infeasible), the rooms holding the
+                         assignment for that gap, and the list of probes in the order they ran.
+                         A best gap equal to the schedule length means any larger gap works too.
+    """
+    result = GapSweepResult(best_gap=None, assignment=None)
+    groups = canonical_order(groups)
+    candidates = build_candidates(groups, rooms)
+    best_hint: Dict[str, str] = {}
+
+    low, high = min_gap, max(min_gap, schedule_length(groups))
+    while low <= high:
+        # The first probe checks the lower bound itself; afterwards probe the midpoint
+        gap = low if result.best_gap is None else (low + high + 1) // 2
+        feasible = _probe(groups, rooms, gap, candidates, best_hint, result)
+
+        if feasible:
+            result.best_gap = gap
+            best_hint = {group.id: room.id for room in rooms for _, _, group in room.schedule}
+            low = max(gap, min(achieved_gap(rooms), high)) + 1
+            if low - 1 > gap:
+                result.best_gap = low - 1
+        elif result.best_gap is None:
+            break  # Not even the smallest gap can be satisfied
+        else:
+            high = gap - 1
+
+    if result.best_gap is not None:
+        _restore(groups, rooms, best_hint)
+        result.assignment = rooms
+    return result
+
+def _probe(groups: List[Group], rooms: List[Room], gap: int, candidates: Dict[str, List[Room]],
+           hint: Dict[str, str], result: GapSweepResult) -> bool:
+    """
+    _probe
+        Solves once for the given gap, trying each group's hinted room first, and records timing.
+    """
+    ordered = {
+        group_id: sorted(options, key=lambda r: r.id != hint.get(group_id))
+        for group_id, options in candidates.items()
+    }
+    for room in rooms:
+        room.clear_schedule()
+
+    started = time.perf_counter()
+    feasible = passes_matching_bound(groups, candidates, gap) and \
+        assign_groups_iterative(groups, rooms, gap, candidates=ordered,
+                                symmetry=build_symmetry(groups, rooms)) is not None
+    result.probes.append(GapProbe(gap, feasible, time.perf_counter() - started))
+    return feasible
+
+def _restore(groups: List[Group], rooms: List[Room], placement: Dict[str, str]):
+    """
+    _restore
+        Rebuilds room schedules from a group ID -> room ID mapping.
+    """
+    by_id = {room.id: room for room in rooms}
+    for room in rooms:
+        room.clear_schedule()
+    for group in groups:
+        by_id[placement[group.id]].add_booking(group.start, group.end, group)
+
+def schedule_length(groups: List[Group]) -> int:
+    """
+    schedule_length
+        Minutes between the earliest start and the latest end. Any gap at least this large
+        forbids every room from being shared, so larger gaps never need to be probed.
+    """
+    if not groups:
+        return 0
+    span = max(g.last_end for g in groups) - min(g.start for g in groups)
+    return int(span.total_seconds() // 60)
+
+def achieved_gap(rooms: List[Room]) -> int:
+    """
+    achieved_gap
+        Computes the smallest buffer, in whole minutes, between consecutive bookings in any room,
+        looking at every occurrence of recurring bookings.
+
+    Parameters:
+        rooms (List[Room]) - Rooms holding a complete assignment
+
+    Return Value:
+        int - The smallest buffer, or a very large number if no room holds two bookings
+    """
+    smallest = None
+    for room in rooms:
+        bookings = sorted(occurrence for _, _, group in room.schedule for occurrence in group.occurrences())
+        for (_, prev_end), (next_start, _) in zip(bookings, bookings[1:]):
+            minutes = int((next_start - prev_end).total_seconds() // 60)
+            smallest = minutes if smallest is None else min(smallest, minutes)
+    return smallest if smallest is not None else 10 ** 9
@@ -7,6 +7,9 @@ such as time, equipment, accessibility, and capacity.
 Module Summary:
 This module defines the Group data structure which includes:
 - Read-only access to group attributes (start, end, size, etc.)
+- An optional recurrence pattern; Start/End then describe the first occurrence
+- An optional cohort (e.g. a class of students) linking consecutive sessions of the same people
+- An optional site the group is pinned to (empty: any site)
 - Input validation for temporal and size logic
 - Static method to convert CSV-derived dictionary input into a Group object
 
@@ -23,6 +26,8 @@ Known/Suspected Errors:
 
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterator, Optional, Tuple
+from .recurrence import Recurrence
 
 @dataclass
 class Group:
@@ -34,6 +39,9 @@ class Group:
     _projector: bool
     _computer: bool
     _floor_preference: int
+    _recurrence: Optional[Recurrence] = None
+    _cohort: str = ""
+    _site: str = ""
 
     def __post_init__(self):
         """
@@ -71,4 +79,33 @@ class Group:
     def computer(self): return self._computer
 
     @property
-    def floor_preference(self): return self._floor_preference
\ No newline at end of file
+    def floor_preference(self): return self._floor_preference
+
+    @property
+    def recurrence(self): return self._recurrence
+
+    @property
+    def cohort(self): return self._cohort
+
+    @property
+    def site(self): return self._site
+
+    @property
+    def last_end(self):
+        """
+        last_end
+            End of the final occurrence (the plain end time for a one-off group).
+        """
+        if self._recurrence is None:
+            return self._end
+        return self._end + (self._recurrence.count - 1) * self._recurrence.period
+
+    def occurrences(self) -> Iterator[Tuple[datetime, datetime]]:
+        """
+        occurrences
+            Yields the (start, end) of every occurrence, skipping excluded dates.
+        """
+        if self._recurrence is None:
+            yield self._start, self._end
+        else:
+            yield from self._recurrence.occurrences(self._start, self._end)
\ No newline at end of file
@@ -1,62 +1,70 @@
 """
 Module Name: input_reader.py
 Project Name: Room Assignment Tool (Imperative Solution)
-File Purpose: Handles CLI interface and CSV parsing. Converts and validates all input into structured Group and Room objects.
+File Purpose: Handles CSV loading and parsing. Converts and validates all input into structured Group and Room objects.
 
 Module Summary:
-This module provides high-level input processing and validation logic. It handles CLI parsing, CSV loading,
+This module provides high-level input processing and validation logic. It handles CSV loading,
 conversion of raw CSV entries into valid `Group` and `Room` objects, and provides safety-checked defaults.
 All validation logic is self-contained, and errors are raised or reported in a user-friendly manner.
 
+Both input files are read and parsed concurrently: the groups pipeline runs in a worker thread while
+the rooms pipeline runs in the calling thread (`load_input_async` offers the same for asyncio callers).
+Files larger than `CHUNKED_MIN_BYTES` are instead split into line-aligned chunks and parsed across
+processes by chunked_loader.py. Validation does not stop at the first bad row: every row error and
+duplicate ID is collected, with its line number, and reported together in one InputValidationError.
+
+Heavy modules (asyncio, multiprocessing) are only imported by the code paths that use them, so
+loading small files stays cheap for short-lived CLI invocations.
+
 Key Functions:
-- load_and_prepare_input: Top-level data entry function, handles CLI + preprocessing
+- load_and_prepare_input: Top-level data entry function, reports errors and exits on failure
+- load_input: Reads and parses the rooms and groups files concurrently
+- load_input_async: Same as load_input, for callers running an asyncio event loop
 - preprocess_data: Validates and converts raw input dictionaries
 - read_csv: Loads CSV into dictionaries
+- iter_groups: Streams groups one row at a time, for memory-bounded solving
 - parse_bool, parse_int, parse_time: Field validation helpers
 
 Dependencies:
-- group.py, room.py
-- csv, datetime, sys
+- group.py, room.py, validators.py, chunked_loader.py, recurrence.py
+- csv, datetime, os, sys, threading
 
 Known/Suspected Errors:
 - None known at this time.
 """
 
 import csv
+import os
 import sys
+import threading
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, Iterator, List, Dict, Tuple
 from .group import Group
 from .room import Room
-from .validators import parse_bool, parse_int, parse_time, check_duplicates
+from .validators import parse_bool, parse_int, parse_time, check_duplicates, InputValidationError
+from .chunked_loader import load_rows_chunked, CHUNKED_MIN_BYTES
+from .recurrence import parse_recurrence
 
 DEFAULT_TIME_GAP = 10  # in minutes
 
-def load_and_prepare_input() -> tuple[list[Group], list[Room], int]:
+def load_and_prepare_input(rooms_file: str, groups_file: str) -> tuple[list[Group], list[Room]]:
     """
     load_and_prepare_input
-        Handles full pipeline: CLI args, CSV loading, validation, and conversion into objects.
+        Handles full pipeline: CSV loading, validation, and conversion into objects.
+
+    Parameters:
+        rooms_file (str) - path to the rooms CSV
+        groups_file (str) - path to the groups CSV
 
     Return Value:
-        tuple[list[Group], list[Room], int] - groups, rooms, time_gap (minutes)
+        tuple[list[Group], list[Room]] - groups, rooms
 
     Exceptions:
         SystemExit - On any parsing or validation error
     """
     try:
-        args = sys.argv[1:]
-        if len(args) < 2:
-            raise ValueError("Usage: <rooms_file.csv> <groups_file.csv> [time_gap_minutes]")
-
-        rooms_file = args[0]
-        groups_file = args[1]
-        time_gap = int(args[2]) if len(args) >= 3 else DEFAULT_TIME_GAP
-
-        raw_rooms = read_csv(rooms_file)
-        raw_groups = read_csv(groups_file)
-
-        groups, rooms = preprocess_data(raw_groups, raw_rooms)
-        return groups, rooms, time_gap
+        return load_input(rooms_file, groups_file)
 
     except ValueError as e:
         print("Error:", e)
@@ -68,6 +76,85 @@ def load_and_prepare_input() -> tuple[list[Group], list[Room], int]:
         print(f"Unexpected error: {e}")
         sys.exit(1)
 
+def load_input(rooms_file: str, groups_file: str) -> tuple[list[Group], list[Room]]:
+    """
+    load_input
+        Runs the groups pipeline (read, then parse every row) in a worker thread while the rooms
+        pipeline runs here, then applies the checks that need both results.
+
+    Parameters:
+        rooms_file (str) - path to the rooms CSV
+        groups_file (str) - path to the groups CSV
+
+    Return Value:
+        tuple[list[Group], list[Room]] - validated and sorted objects
+
+    Exceptions:
+        FileNotFoundError - if either file is missing
+        InputValidationError - listing every invalid row and duplicate ID in both files
+    """
+    outcome = {}
+
+    def load_groups():
+        try:
+            outcome["groups"] = load_rows(groups_file, parse_group)
+        except BaseException as e:
+            outcome["error"] = e
+
+    worker = threading.Thread(target=load_groups)
+    worker.start()
+    try:
+        rooms, room_errors = load_rows(rooms_file, parse_room)
+    finally:
+        worker.join()
+    if "error" in outcome:
+        raise outcome["error"]
+
+    groups, group_errors = outcome["groups"]
+    return finalize_input(groups, rooms, group_errors + room_errors)
+
+async def load_input_async(rooms_file: str, groups_file: str) -> tuple[list[Group], list[Room]]:
+    """
+    load_input_async
+        Runs the rooms and groups pipelines concurrently in threads without blocking the event loop,
+        then applies the checks that need both results.
+
+    Parameters:
+        rooms_file (str) - path to the rooms CSV
+        groups_file (str) - path to the groups CSV
+
+    Return Value:
+        tuple[list[Group], list[Room]] - validated and sorted objects
+
+    Exceptions:
+        FileNotFoundError - if either file is missing
+        InputValidationError - listing every invalid row and duplicate ID in both files
+    """
+    import asyncio  # only needed by asyncio callers, and slow to import
+
+    (groups, group_errors), (rooms, room_errors) = await asyncio.gather(
+        asyncio.to_thread(load_rows, groups_file, parse_group),
+        asyncio.to_thread(load_rows, rooms_file, parse_room)
+    )
+    return finalize_input(groups, rooms, group_errors + room_errors)
+
+def load_rows(filename: str, parse_fn: Callable) -> Tuple[list, List[str]]:
+    """
+    load_rows
+        Reads one CSV and parses its rows. Large files are parsed in parallel chunks across
+        processes when more than one CPU is available.
+
+    Parameters:
+        filename (str) - path to the CSV file
+        parse_fn (Callable) - `parse_group` or `parse_room`
+
+    Return Value:
+        Tuple[list, List[str]] - the valid objects and the error messages, both in input order
+    """
+    if (os.cpu_count() or 1) > 1 and os.path.getsize(filename) >= CHUNKED_MIN_BYTES:
+        return load_rows_chunked(filename, parse_fn)
+    return parse_rows(read_csv(filename), parse_fn)
+
 def read_csv(filename: str) -> List[Dict[str, str]]:
     """
     read_csv
@@ -82,6 +169,32 @@ def read_csv(filename: str) -> List[Dict[str, str]]:
     with open(filename, newline='', encoding='utf-8') as csvfile:
         return list(csv.DictReader(csvfile))
 
+def iter_groups(filename: str) -> Iterator[Group]:
+    """
+    iter_groups
+        Parses the groups file lazily, one row at a time, so only the rows being solved are held
+        in memory. The file must be sorted by Start.
+
+    Parameters:
+        filename (str) - path to the groups CSV
+
+    Return Value:
+        Iterator[Group] - groups in file order
+
+    Exceptions:
+        FileNotFoundError - if the file does not exist
+        ValueError - at the first invalid row, or the first row that starts before the previous one
+    """
+    with open(filename, newline='', encoding='utf-8') as csvfile:
+        previous = None
+        for index, row in enumerate(csv.DictReader(csvfile)):
+            group = parse_group(row, index)
+            if previous is not None and group.start < previous:
+                raise ValueError(f"Group {group.id} (line {index + 2}) starts before the previous group; "
+                                 "streamed input must be sorted by Start")
+            previous = group.start
+            yield group
+
 def preprocess_data(raw_groups: List[Dict], raw_rooms: List[Dict]) -> tuple[list[Group], list[Room]]:
     """
     preprocess_data
@@ -95,13 +208,61 @@ def preprocess_data(raw_groups: List[Dict], raw_rooms: List[Dict]) -> tuple[list
         tuple[list[Group], list[Room]] - validated and sorted objects
 
     Exceptions:
-        ValueError - if any validation fails
+        InputValidationError (a ValueError) - listing every validation failure
+    """
+    groups, group_errors = parse_rows(raw_groups, parse_group)
+    rooms, room_errors = parse_rows(raw_rooms, parse_room)
+    return finalize_input(groups, rooms, group_errors + room_errors)
+
+def parse_rows(raw_rows: List[Dict], parse_fn: Callable) -> Tuple[list, List[str]]:
+    """
+    parse_rows
+        Parses every row, collecting the error message of each invalid row instead of stopping.
+
+    Parameters:
+        raw_rows (List[Dict]) - Raw dicts from CSV
+        parse_fn (Callable) - `parse_group` or `parse_room`
+
+    Return Value:
+        Tuple[list, List[str]] - the valid objects and the error messages, both in input order
     """
-    groups = [parse_group(row, i) for i, row in enumerate(raw_groups)]
-    rooms = [parse_room(row, i) for i, row in enumerate(raw_rooms)]
+    parsed, errors = [], []
+    for i, row in enumerate(raw_rows):
+        try:
+            parsed.append(parse_fn(row, i))
+        except ValueError as e:
+            errors.append(str(e))
+    return parsed, errors
 
-    check_duplicates(groups, lambda g: g.id, "Group")
-    check_duplicates(rooms, lambda r: r.id, "Room")
+def finalize_input(groups: List[Group], rooms: List[Room], errors: List[str]) -> tuple[list[Group], list[Room]]:
+    """
+    finalize_input
+        Adds duplicate-ID and unknown-site errors to the row errors, raises if there are any, and
+        sorts the objects.
+
+    Parameters:
+        groups (List[Group]) - successfully parsed groups
+        rooms (List[Room]) - successfully parsed rooms
+        errors (List[str]) - row errors collected so far
+
+    Return Value:
+        tuple[list[Group], list[Room]] - groups sorted by start time (larger first on ties),
+                                         rooms sorted by capacity
+
+    Exceptions:
+        InputValidationError - if any error was collected
+    """
+    errors = list(errors)
+    for items, key_fn, label in ((groups, lambda g: g.id, "Group"), (rooms, lambda r: r.id, "Room")):
+        try:
+            check_duplicates(items, key_fn, label)
+        except ValueError as e:
+            errors.append(str(e))
+    sites = {room.site for room in rooms}
+    errors.extend(f"Group {group.id} is pinned to unknown site '{group.site}'"
+                  for group in groups if group.site and group.site not in sites)
+    if errors:
+        raise InputValidationError(errors)
 
     groups = sorted(groups, key=lambda g: (g.start, -g.size))
     rooms = sorted(rooms, key=lambda r: r.capacity)
@@ -123,19 +284,22 @@ def parse_group(row: Dict[str, str], index: int) -> Group:
         ValueError - If any field fails validation
     """
     try:
+        start = parse_time(row["Start"], "Start")
         return Group(
             _group_id=row["GroupID"],
-            _start=parse_time(row["Start"], "Start"),
+            _start=start,
             _end=parse_time(row["End"], "End"),
             _size=parse_int(row["Size"], "Size", 1),
             _wheelchair_access=parse_bool(row["WheelchairAccess"], "WheelchairAccess"),
             _projector=parse_bool(row["Projector"], "Projector"),
             _computer=parse_bool(row["Computer"], "Computer"),
-            _floor_preference=parse_int(row["FloorPreference"], "FloorPreference", -1)
+            _floor_preference=parse_int(row["FloorPreference"], "FloorPreference", -1),
+            _recurrence=parse_recurrence(row.get("Recurrence") or "", "Recurrence", start),
+            _cohort=(row.get("Cohort") or "").strip(),
+            _site=(row.get("Site") or "").strip()
         )
     except Exception as e:
-        group_id = row.get("GroupID", f"(line {index + 2})")
-        raise ValueError(f"Invalid group entry {group_id}: {e}")
+        raise ValueError(f"Invalid group entry {row.get('GroupID', '?')} (line {index + 2}): {e}")
 
 def parse_room(row: Dict[str, str], index: int) -> Room:
     """
@@ -159,8 +323,8 @@ def parse_room(row: Dict[str, str], index: int) -> Room:
             _wheelchair_access=parse_bool(row["WheelchairAccess"], "WheelchairAccess"),
             _projector=parse_bool(row["Projector"], "Projector"),
             _computer=parse_bool(row["Computer"], "Computer"),
-            _floor_level=parse_int(row["FloorLevel"], "FloorLevel", 0)
+            _floor_level=parse_int(row["FloorLevel"], "FloorLevel", 0),
+            _site=(row.get("Site") or "").strip()
         )
     except Exception as e:
-        room_id = row.get("RoomID", f"(line {index + 2})")
-        raise ValueError(f"Invalid room entry {room_id}: {e}")
\ No newline at end of file
+        raise ValueError(f"Invalid room entry {row.get('RoomID', '?')} (line {index + 2}): {e}")
\ No newline at end of file
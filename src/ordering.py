@@ -0,0 +1,111 @@
+"""
+Module Name: ordering.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Value-ordering heuristics that decide which compatible room the solver tries first
+for each group.
+
+Module Summary:
+`assign_groups` tries rooms in the order of the candidate lists it is given. Every strategy here
+builds those lists once, before the search, from precomputed demand counts, so ordering adds no
+work inside the backtracking loop. Available strategies:
+- "capacity": smallest room first (the order `preprocess_data` sorts rooms in).
+- "tightest-fit": least spare capacity, then fewest features the group does not need.
+- "rarity": keep rooms with scarce features (e.g. accessible computer labs) for the groups that
+  need them, by penalising every unneeded feature by its demand-to-supply ratio.
+- "least-constraining": prefer the room that removes the fewest options from upcoming groups whose
+  times conflict with this one; groups with few options left count more.
+
+Key Functions:
+- order_candidates: Builds the candidate lists for a strategy
+- STRATEGIES: Names accepted by `order_candidates`
+
+Dependencies:
+- solver.py for `build_candidates`
+
+Known/Suspected Errors:
+- None known at this time.
+"""
+
+from datetime import timedelta
+from typing import Callable, Dict, List
+from .group import Group
+from .room import Room
+from .solver import build_candidates
+
+FEATURES = ("wheelchair_access", "projector", "computer")
+
+def order_candidates(groups: List[Group], rooms: List[Room], time_gap: int,
+                     strategy: str = "capacity") -> Dict[str, List[Room]]:
+    """
+    order_candidates
+        Computes each group's compatible rooms, ordered by the chosen strategy.
+
+    Parameters:
+        groups (List[Group]) - Groups in the order the solver will assign them
+        rooms (List[Room]) - Available rooms
+        time_gap (int) - Minimum time gap (in minutes) between bookings
+        strategy (str) - One of STRATEGIES
+
+    Return Value:
+        Dict[str, List[Room]] - Ordered candidate rooms keyed by group ID, for `assign_groups`
+
+    Exceptions:
+        ValueError - If the strategy name is unknown
+    """
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown ordering strategy '{strategy}' (expected one of {', '.join(STRATEGIES)})")
+
+    candidates = build_candidates(groups, rooms)
+    score = STRATEGIES[strategy](groups, rooms, time_gap, candidates)
+    return {group.id: sorted(candidates[group.id], key=lambda room: score(group, room)) for group in groups}
+
+def _capacity(groups, rooms, time_gap, candidates) -> Callable:
+    position = {room.id: i for i, room in enumerate(rooms)}
+    return lambda group, room: position[room.id]
+
+def _tightest_fit(groups, rooms, time_gap, candidates) -> Callable:
+    return lambda group, room: (room.capacity - group.size, _unneeded_features(group, room))
+
+def _rarity(groups, rooms, time_gap, candidates) -> Callable:
+    # Demand-to-supply ratio of each feature: high when many groups compete for few rooms
+    weight = {}
+    for feature in FEATURES:
+        supply = sum(1 for room in rooms if getattr(room, feature))
+        demand = sum(1 for group in groups if getattr(group, feature))
+        weight[feature] = demand / supply if supply else 0.0
+
+    def score(group, room):
+        wasted = sum(weight[f] for f in FEATURES if getattr(room, f) and not getattr(group, f))
+        return (wasted, room.capacity - group.size)
+    return score
+
+def _least_constraining(groups, rooms, time_gap, candidates) -> Callable:
+    # For each group, sum up how much each room is wanted by conflicting groups assigned after it
+    processing_order = {group.id: i for i, group in enumerate(groups)}
+    pressure: Dict[str, Dict[str, float]] = {group.id: {} for group in groups}
+    buffer = timedelta(minutes=time_gap)
+
+    by_start = sorted(groups, key=lambda g: g.start)
+    for i, group in enumerate(by_start):
+        for other in by_start[i + 1:]:
+            if other.start >= group.end + buffer:
+                break
+            first, later = sorted((group, other), key=lambda g: processing_order[g.id])
+            if not candidates[later.id]:
+                continue
+            weight = 1.0 / len(candidates[later.id])
+            counts = pressure[first.id]
+            for room in candidates[later.id]:
+                counts[room.id] = counts.get(room.id, 0.0) + weight
+
+    return lambda group, room: (pressure[group.id].get(room.id, 0.0), room.capacity - group.size)
+
+def _unneeded_features(group: Group, room: Room) -> int:
+    return sum(1 for f in FEATURES if getattr(room, f) and not getattr(group, f))
+
+STRATEGIES: Dict[str, Callable] = {
+    "capacity": _capacity,
+    "tightest-fit": _tightest_fit,
+    "rarity": _rarity,
+    "least-constraining": _least_constraining,
+}
@@ -7,6 +7,8 @@ either to a CSV file or directly to the console.
 Module Summary:
 - Converts finalized room-group assignments into output-ready dictionaries.
 - Writes formatted assignment data to either a CSV file or standard output.
+- Streams assignments to a CSV file as they are finalized (AssignmentStream), for windowed solving.
+- Writes the per-group soft-constraint scores of optimized runs next to the assignments.
 
 Dependencies:
 - csv module for file output
@@ -29,20 +31,22 @@ def write_output(filename=None, assignments=None):
         assignments (List[Room]) - list of Room objects with group schedules to output
 
     Output Format:
-        GroupID, RoomID, Start, End - either printed or written in CSV header order
+        GroupID, RoomID, Start, End - either printed or written in CSV header order.
+        Recurring groups produce one line per occurrence, all in the same room.
 
     Raises:
         None explicitly, but may throw file I/O errors if path is invalid
     """
     output = []
     for room in assignments:
-        for start, end, group in room.schedule:
-            output.append({
-                'GroupID': group.id,
-                'RoomID': room.id,
-                'Start': start,
-                'End': end
-            })
+        for _, _, group in room.schedule:
+            for start, end in group.occurrences():
+                output.append({
+                    'GroupID': group.id,
+                    'RoomID': room.id,
+                    'Start': start,
+                    'End': end
+                })
 
     if filename:
         with open(filename, mode='w', newline='') as file:
@@ -54,3 +58,49 @@ def write_output(filename=None, assignments=None):
         print("\nRoom Assignments:")
         for assignment in sorted(output, key=lambda a: a["GroupID"]):
             print(f"{assignment['GroupID']} --> {assignment['RoomID']} : {assignment['Start']} - {assignment['End']}")
+
+def write_score_breakdown(filename, breakdown, total):
+    """
+    write_score_breakdown
+        Writes the per-group score terms of an optimized assignment (see scoring.py) to a CSV file,
+        followed by a TOTAL row.
+
+    Parameters:
+        filename (str) - the path to write the CSV output to
+        breakdown (List[Dict[str, str]]) - rows from `score_breakdown`
+        total (float) - the total weighted score
+    """
+    fieldnames = ['GroupID', 'RoomID', 'Floor', 'CapacityFit', 'RoomChange', 'Score']
+    with open(filename, mode='w', newline='') as file:
+        writer = csv.DictWriter(file, fieldnames=fieldnames)
+        writer.writeheader()
+        writer.writerows(breakdown)
+        writer.writerow({'GroupID': 'TOTAL', 'Score': f"{total:.3f}"})
+    print(f"Score breakdown written to '{filename}'")
+
+class AssignmentStream:
+    """
+    AssignmentStream
+        Writes assignments to a CSV file one group at a time, in the same format as `write_output`,
+        so results never need to be held in memory. Use as a context manager.
+    """
+    def __init__(self, filename):
+        self.filename = filename
+        self.written = 0
+        self._file = open(filename, mode='w', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=['GroupID', 'RoomID', 'Start', 'End'])
+        self._writer.writeheader()
+
+    def write(self, group, room):
+        for start, end in group.occurrences():
+            self._writer.writerow({'GroupID': group.id, 'RoomID': room.id, 'Start': start, 'End': end})
+        self.written += 1
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,144 @@
+"""
+Module Name: profiling.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Optional profiling of the load, solve and write phases, enabled with `--profile DIR`
+or the ROOM_ASSIGN_PROFILE environment variable.
+
+Module Summary:
+For every profiled phase two files are written to the chosen directory:
+- `<phase>-<pid>.prof`: cProfile statistics, readable with `pstats`, snakeviz, etc.
+- `<phase>-<pid>.collapsed`: one "frame;frame;frame count" line per distinct stack, the input
+  format of flamegraph.pl, speedscope and similar tools. Stacks come from a sampling profiler
+  (SIGPROF timer) where the platform supports it; otherwise caller/callee pairs from cProfile are
+  written, weighted by time in microseconds.
+When profiling is disabled `phase` hands back a shared no-op context manager and cProfile is never
+imported, so the normal path pays nothing.
+
+Key Functions:
+- make_profiler: Returns a Profiler if profiling was requested, otherwise None
+- phase: Context manager wrapping one phase
+
+Dependencies:
+- cProfile, pstats, signal (imported only when profiling is enabled)
+
+Known/Suspected Errors:
+- None known at this time.
+"""
+
+import os
+import sys
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+from typing import Optional
+
+PROFILE_ENV = "ROOM_ASSIGN_PROFILE"
+SAMPLE_INTERVAL = 0.001  # seconds of CPU time between samples
+
+_DISABLED = nullcontext()
+
+class Profiler:
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        phase
+            Profiles the body of the `with` block and writes its .prof and .collapsed files.
+        """
+        import cProfile
+
+        sampler = _StackSampler() if _StackSampler.available() else None
+        profile = cProfile.Profile()
+        if sampler:
+            sampler.start()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            if sampler:
+                sampler.stop()
+            self._write(name, profile, sampler)
+
+    def _write(self, name: str, profile, sampler):
+        base = os.path.join(self.directory, f"{name}-{os.getpid()}")
+        profile.dump_stats(base + ".prof")
+        stacks = sampler.stacks if sampler and sampler.stacks else _call_pairs(profile)
+        with open(base + ".collapsed", "w", encoding="utf-8") as file:
+            for stack, count in sorted(stacks.items()):
+                file.write(f"{stack} {count}\n")
+        print(f"Profile for '{name}' written to '{base}.prof' and '{base}.collapsed'")
+
+def make_profiler(directory: Optional[str] = None) -> Optional[Profiler]:
+    """
+    make_profiler
+        Creates a profiler writing to `directory`, or to the directory named by ROOM_ASSIGN_PROFILE
+        when no directory is given.
+
+    Return Value:
+        Optional[Profiler] - None when profiling is not enabled
+    """
+    directory = directory or os.environ.get(PROFILE_ENV)
+    return Profiler(directory) if directory else None
+
+def phase(profiler: Optional[Profiler], name: str):
+    """
+    phase
+        Returns a context manager profiling one phase, or a no-op one if `profiler` is None.
+    """
+    return _DISABLED if profiler is None else profiler.phase(name)
+
+class _StackSampler:
+    """
+    _StackSampler
+        Records the Python stack of the main thread every SAMPLE_INTERVAL seconds of CPU time.
+    """
+    def __init__(self):
+        self.stacks = Counter()
+        self._previous = None
+
+    @staticmethod
+    def available() -> bool:
+        import signal
+        import threading
+        return hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF") and \
+            threading.current_thread() is threading.main_thread()
+
+    def start(self):
+        import signal
+        self._previous = signal.signal(signal.SIGPROF, self._sample)
+        signal.setitimer(signal.ITIMER_PROF, SAMPLE_INTERVAL, SAMPLE_INTERVAL)
+
+    def stop(self):
+        import signal
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous)
+
+    def _sample(self, signum, frame):
+        names = []
+        while frame is not None:
+            code = frame.f_code
+            names.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        self.stacks[";".join(reversed(names))] += 1
+
+def _call_pairs(profile) -> Counter:
+    """
+    _call_pairs
+        Fallback for platforms without SIGPROF: two-frame "caller;callee" stacks from cProfile,
+        weighted by the time spent in the callee (in microseconds).
+    """
+    import pstats
+
+    pairs = Counter()
+    stats = pstats.Stats(profile, stream=sys.stderr).stats
+    for (filename, _, function), (_, _, total_time, _, callers) in stats.items():
+        callee = f"{os.path.basename(filename)}:{function}"
+        for (caller_file, _, caller_function), caller_stats in callers.items():
+            caller = f"{os.path.basename(caller_file)}:{caller_function}"
+            pairs[f"{caller};{callee}"] += max(1, int(caller_stats[2] * 1_000_000))
+        if not callers:
+            pairs[callee] += max(1, int(total_time * 1_000_000))
+    return pairs
@@ -0,0 +1,187 @@
+"""
+Module Name: recurrence.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Compact storage of recurring bookings (e.g. a weekly course) and conflict checks
+performed directly on the recurrence pattern instead of on expanded occurrences.
+
+Module Summary:
+A recurring group is stored once: its first occurrence (the group's Start/End), a period, an
+occurrence count and the indices of skipped occurrences. Two bookings conflict if some pair of
+their occurrences overlaps once both are widened by the time gap. For series with periods P and Q,
+the offset between any two occurrences is always a multiple of gcd(P, Q), so only the few offsets
+inside the overlap window need checking, and for each one the matching occurrence pairs follow
+from a linear Diophantine equation. The cost depends on the length of the booking rather than
+the number of occurrences.
+
+Input format (the optional `Recurrence` column of the groups file), RRULE-like:
+    FREQ=WEEKLY;INTERVAL=1;UNTIL=2025-04-25;EXDATE=2025-03-10,2025-03-17
+FREQ is DAILY or WEEKLY, INTERVAL defaults to 1, exactly one of UNTIL (a date) or COUNT is required,
+and EXDATE optionally lists dates on which the occurrence is skipped.
+
+Key Functions:
+- Recurrence: The compact pattern
+- parse_recurrence: Builds a Recurrence from the column value
+- bookings_conflict: Periodic interval overlap test between two (possibly recurring) bookings
+
+Dependencies:
+- datetime, math
+
+Known/Suspected Errors:
+- None known at this time.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from math import gcd
+from typing import FrozenSet, Iterator, Optional, Tuple
+
+FREQUENCIES = {"DAILY": 1, "WEEKLY": 7}  # period in days
+
+@dataclass(frozen=True)
+class Recurrence:
+    period: timedelta
+    count: int
+    exceptions: FrozenSet[int] = frozenset()
+
+    def occurrences(self, start: datetime, end: datetime) -> Iterator[Tuple[datetime, datetime]]:
+        """
+        occurrences
+            Yields the (start, end) of every occurrence that is not skipped.
+        """
+        for k in range(self.count):
+            if k not in self.exceptions:
+                yield start + k * self.period, end + k * self.period
+
+    @property
+    def sort_key(self) -> Tuple:
+        return (self.period, self.count, tuple(sorted(self.exceptions)))
+
+def parse_recurrence(val: str, field: str, start: datetime) -> Optional[Recurrence]:
+    """
+    parse_recurrence
+        Parses an RRULE-like recurrence string anchored at the group's first start.
+
+    Parameters:
+        val (str) - The raw string value from input; empty means the group does not recur.
+        field (str) - The name of the field being parsed (used for error messages).
+        start (datetime) - Start of the first occurrence.
+
+    Return Value:
+        Optional[Recurrence] - The pattern, or None for a one-off booking.
+
+    Exceptions:
+        ValueError - If the rule is malformed or an EXDATE is not an occurrence date.
+    """
+    val = (val or "").strip()
+    if not val:
+        return None
+
+    try:
+        parts = dict(part.split("=", 1) for part in val.upper().split(";") if part.strip())
+    except ValueError:
+        raise ValueError(f"Invalid recurrence '{val}' in field '{field}' (expected KEY=VALUE pairs separated by ';')")
+    parts = {key.strip(): value.strip() for key, value in parts.items()}
+
+    unknown = set(parts) - {"FREQ", "INTERVAL", "UNTIL", "COUNT", "EXDATE"}
+    if unknown:
+        raise ValueError(f"Unknown recurrence key(s) {sorted(unknown)} in field '{field}'")
+    if parts.get("FREQ") not in FREQUENCIES:
+        raise ValueError(f"Invalid FREQ in field '{field}' (expected one of {', '.join(FREQUENCIES)})")
+    if ("UNTIL" in parts) == ("COUNT" in parts):
+        raise ValueError(f"Recurrence in field '{field}' needs exactly one of UNTIL or COUNT")
+
+    interval = _positive_int(parts.get("INTERVAL", "1"), "INTERVAL", field)
+    period_days = FREQUENCIES[parts["FREQ"]] * interval
+    if "COUNT" in parts:
+        count = _positive_int(parts["COUNT"], "COUNT", field)
+    else:
+        until = _date(parts["UNTIL"], "UNTIL", field)
+        days = (until - start.date()).days
+        if days < 0:
+            raise ValueError(f"UNTIL {until} in field '{field}' is before the first occurrence")
+        count = days // period_days + 1
+
+    exceptions = set()
+    for raw in filter(None, (d.strip() for d in parts.get("EXDATE", "").split(","))):
+        days = (_date(raw, "EXDATE", field) - start.date()).days
+        if days % period_days or not 0 <= days // period_days < count:
+            raise ValueError(f"EXDATE {raw} in field '{field}' is not an occurrence date")
+        exceptions.add(days // period_days)
+    if len(exceptions) == count:
+        raise ValueError(f"Recurrence in field '{field}' skips every occurrence")
+
+    return Recurrence(timedelta(days=period_days), count, frozenset(exceptions))
+
+def bookings_conflict(a_start: datetime, a_end: datetime, a_rec: Optional[Recurrence],
+                      b_start: datetime, b_end: datetime, b_rec: Optional[Recurrence],
+                      buffer: timedelta) -> bool:
+    """
+    bookings_conflict
+        Checks whether any occurrence of booking a comes within `buffer` of any occurrence of b,
+        using the same rule as `check_time_overlap` for single bookings.
+
+    Parameters:
+        a_start, a_end (datetime) - first occurrence of booking a
+        a_rec (Recurrence, optional) - pattern of a, None for a one-off booking
+        b_start, b_end (datetime) - first occurrence of booking b
+        b_rec (Recurrence, optional) - pattern of b, None for a one-off booking
+        buffer (timedelta) - required gap between bookings
+
+    Return Value:
+        bool - True if the bookings conflict
+    """
+    if a_rec is None and b_rec is None:
+        return a_start < b_end + buffer and a_end > b_start - buffer
+
+    # Quick rejection on the overall spans of the two series
+    if a_start >= _last(b_end, b_rec) + buffer or _last(a_end, a_rec) <= b_start - buffer:
+        return False
+
+    seconds = lambda delta: int(delta.total_seconds())
+    p = seconds(a_rec.period) if a_rec else seconds(b_rec.period)
+    q = seconds(b_rec.period) if b_rec else p
+    n1, n2 = (a_rec.count if a_rec else 1), (b_rec.count if b_rec else 1)
+    skip1 = a_rec.exceptions if a_rec else frozenset()
+    skip2 = b_rec.exceptions if b_rec else frozenset()
+
+    # Occurrences i of a and j of b conflict iff lo < i*p - j*q < hi
+    offset = seconds(b_start - a_start)
+    lo = offset - seconds(a_end - a_start) - seconds(buffer)
+    hi = offset + seconds(b_end - b_start) + seconds(buffer)
+
+    g = gcd(p, q)
+    p_step, q_step = p // g, q // g
+    p_inverse = pow(p_step, -1, q_step) if q_step > 1 else 0
+    x = (lo // g + 1) * g
+    while x < hi:
+        # i*p_step - j*q_step = x/g  =>  i = i0 + t*q_step, j = j0 + t*p_step
+        i0 = (x // g) * p_inverse % q_step if q_step > 1 else 0
+        j0 = (i0 * p - x) // q
+        t_low = max(_ceil_div(-i0, q_step), _ceil_div(-j0, p_step))
+        t_high = min((n1 - 1 - i0) // q_step, (n2 - 1 - j0) // p_step)
+        for t in range(t_low, t_high + 1):
+            if i0 + t * q_step not in skip1 and j0 + t * p_step not in skip2:
+                return True
+        x += g
+    return False
+
+def _last(end: datetime, rec: Optional[Recurrence]) -> datetime:
+    return end if rec is None else end + (rec.count - 1) * rec.period
+
+def _ceil_div(a: int, b: int) -> int:
+    return -(-a // b)
+
+def _positive_int(val: str, key: str, field: str) -> int:
+    try:
+        number = int(val)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise ValueError(f"Invalid {key} '{val}' in field '{field}' (expected a positive integer)")
+    return number
+
+def _date(val: str, key: str, field: str):
+    try:
+        return datetime.strptime(val, "%Y-%m-%d").date()
+    except ValueError:
+        raise ValueError(f"Invalid {key} date '{val}' in field '{field}' (expected format YYYY-MM-DD)")
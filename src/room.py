@@ -6,7 +6,7 @@ and manage its booking schedule based on group assignment.
 
 Module Summary:
 This module defines the Room data structure which includes:
-- Read-only access to its core attributes
+- Read-only access to its core attributes, including the site (building or campus) it belongs to
 - Schedule management functions (add, remove, clear)
 - Conversion from raw dictionary (CSV row)
 
@@ -35,6 +35,7 @@ class Room:
     _projector: bool
     _computer: bool
     _floor_level: int
+    _site: str = ""
     _schedule: List[Tuple[datetime, datetime, Group]] = field(default_factory=list)
 
     def __post_init__(self):
@@ -68,6 +69,9 @@ class Room:
     @property
     def floor_level(self): return self._floor_level
 
+    @property
+    def site(self): return self._site
+
     @property
     def schedule(self):
         """
@@ -3,25 +3,429 @@ Module Name: room_assign_tool.py
 Project Name: Room Assignment Tool (Imperative Solution)
 File Purpose: Entry point for CLI execution. Handles top-level orchestration of reading input, solving, and output.
 
+Subcommands:
+- solve     Assign groups to rooms and write assignments.csv (the default when no subcommand is given)
+- validate  Only load and validate the input files
+- query     Find free compatible rooms or the next free slot
+- bench     Time the load and solve phases over several runs
+- diagnose  Explain an infeasible input with a minimal set of conflicting groups
+
+`solve --profile DIR` (or the ROOM_ASSIGN_PROFILE environment variable) profiles each phase.
+`solve --checkpoint FILE` saves the search state periodically and on SIGTERM; `--resume FILE` continues it.
+`solve --optimize` treats floor preferences as soft and maximizes the weighted preference score.
+`solve --windowed` streams a start-sorted groups file through time windows with bounded memory.
+
+Each subcommand imports the modules it needs when it runs, so short invocations such as `validate`
+do not pay for the solver, the query index or the optional engines.
+
 ID Block
 Group Member(s): Miko Bengo
 Course: COMP 3649 - Programming Paradigms
 Instructor: Marc Schroeder
 """
 
-from src.input_reader import load_and_prepare_input
-from src.solver import assign_groups
-from src.output_writer import write_output
+import argparse
+import sys
+from src.input_reader import load_and_prepare_input, DEFAULT_TIME_GAP
+
+SUBCOMMANDS = ("solve", "validate", "query", "bench", "diagnose")
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] not in SUBCOMMANDS and argv[0] not in ("-h", "--help"):
+        argv = ["solve"] + argv  # original form: <rooms_file.csv> <groups_file.csv> [time_gap_minutes]
+
+    args = build_parser().parse_args(argv)
+    args.handler(args)
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    build_parser
+        Declares the subcommands and their arguments.
+    """
+    parser = argparse.ArgumentParser(prog="room_assign_tool", description="Assign groups to rooms.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    solve = commands.add_parser("solve", help="assign groups to rooms (default)")
+    _add_input_arguments(solve)
+    solve.add_argument("--gap-sweep", action="store_true", help="find the largest feasible time gap instead")
+    solve.add_argument("--order", help="room ordering strategy: capacity, tightest-fit, rarity or least-constraining")
+    solve.add_argument("--optimize", action="store_true",
+                       help="treat preferences as soft and maximize their weighted score")
+    solve.add_argument("--weights", metavar="NAME=W,...", default="",
+                       help="score weights for --optimize: floor, capacity_fit, room_changes (default 1 each)")
+    solve.add_argument("--windowed", action="store_true",
+                       help="stream a start-sorted groups file in time windows, keeping memory bounded")
+    solve.add_argument("--window-size", metavar="N", type=int, default=5000,
+                       help="groups after which a --windowed window is closed even without a free cut (default 5000)")
+    solve.add_argument("--transitions", metavar="FILE",
+                       help="CSV of travel gaps (FromSite,ToSite,Gap) for cohorts changing site")
+    solve.add_argument("--checkpoint", metavar="FILE", help="periodically save the search state to FILE")
+    solve.add_argument("--checkpoint-every", metavar="SECONDS", type=float, default=60.0,
+                       help="seconds between checkpoints (default 60)")
+    solve.add_argument("--resume", metavar="FILE", help="continue the search saved in FILE (keeps checkpointing to it)")
+    solve.add_argument("--profile", metavar="DIR",
+                       help="write cProfile and collapsed-stack files per phase to DIR (or set ROOM_ASSIGN_PROFILE)")
+    solve.set_defaults(handler=run_solve)
+
+    validate = commands.add_parser("validate", help="check the input files without solving")
+    validate.add_argument("rooms_file")
+    validate.add_argument("groups_file")
+    validate.set_defaults(handler=run_validate)
+
+    query = commands.add_parser("query", help="find free compatible rooms")
+    query.add_argument("rooms_file")
+    bookings = query.add_mutually_exclusive_group()
+    bookings.add_argument("--assignments", help="assignments CSV written by a previous run")
+    bookings.add_argument("--groups", help="groups CSV to solve before answering")
+    query.add_argument("--start", help="window start, YYYY-MM-DD HH:MM")
+    query.add_argument("--end", help="window end, YYYY-MM-DD HH:MM")
+    query.add_argument("--length", type=int, help="find the next free slot of this many minutes instead")
+    query.add_argument("--after", help="earliest start for --length, YYYY-MM-DD HH:MM (default: now)")
+    query.add_argument("--gap", type=int, default=DEFAULT_TIME_GAP, help="buffer in minutes around bookings")
+    query.add_argument("--size", type=int, default=1)
+    query.add_argument("--wheelchair", action="store_true")
+    query.add_argument("--projector", action="store_true")
+    query.add_argument("--computer", action="store_true")
+    query.add_argument("--floor", type=int, default=-1)
+    query.set_defaults(handler=run_query)
+
+    bench = commands.add_parser("bench", help="time the load and solve phases")
+    _add_input_arguments(bench)
+    bench.add_argument("--order", help="room ordering strategy, as for solve")
+    bench.add_argument("--repeat", type=int, default=5, help="number of timed runs")
+    bench.set_defaults(handler=run_bench)
+
+    diagnose = commands.add_parser("diagnose", help="find a minimal set of groups that cannot be satisfied")
+    _add_input_arguments(diagnose)
+    diagnose.add_argument("--transitions", metavar="FILE", help="travel gaps between sites, as for solve")
+    diagnose.set_defaults(handler=run_diagnose)
+
+    return parser
+
+def _add_input_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("rooms_file")
+    parser.add_argument("groups_file")
+    parser.add_argument("time_gap", nargs="?", type=int, default=DEFAULT_TIME_GAP,
+                        help=f"minutes between bookings (default {DEFAULT_TIME_GAP})")
 
-def main():
-    groups, rooms, time_gap = load_and_prepare_input()
-    result = assign_groups(groups, rooms, time_gap)
+def solve_input(groups, rooms, time_gap, strategy=None, checkpoint_path=None, checkpoint_every=60.0, resume_path=None,
+                transitions=None):
+    """
+    solve_input
+        Runs the solver with symmetry breaking and, optionally, an ordering strategy. With a
+        checkpoint or resume path, the search state is saved periodically and on SIGTERM.
+        Inputs with rooms on several sites, or with travel rules, are solved per site (see sites.py).
+
+    Return Value:
+        Optional[List[Room]] - the rooms holding the assignment, or None if none exists
+
+    Exceptions:
+        ValueError - if the ordering strategy is unknown, the checkpoint does not match the input, or
+                     checkpointing is requested for a multi-site input
+        SearchInterrupted - if SIGTERM stopped the search after a final checkpoint
+    """
+    if transitions is not None or len({room.site for room in rooms}) > 1:
+        if checkpoint_path or resume_path:
+            raise ValueError("Checkpointing is not supported for inputs with several sites")
+        from src.sites import solve_sharded
+        return solve_sharded(groups, rooms, time_gap, transitions, strategy)
+
+    from src.solver import assign_groups_iterative
+    from src.symmetry import build_symmetry, canonical_order
+
+    groups = canonical_order(groups)
+    candidates = None
+    if strategy:
+        from src.ordering import order_candidates
+        candidates = order_candidates(groups, rooms, time_gap, strategy)
+    symmetry = build_symmetry(groups, rooms)
+
+    checkpoint_path = checkpoint_path or resume_path
+    if not checkpoint_path:
+        return assign_groups_iterative(groups, rooms, time_gap, candidates=candidates, symmetry=symmetry)
+
+    from src.checkpoint import Checkpointer, load_checkpoint, search_fingerprint
+
+    fingerprint = search_fingerprint(groups, rooms, time_gap, candidates, symmetry=True)
+    resume = load_checkpoint(resume_path, fingerprint) if resume_path else None
+    checkpointer = Checkpointer(checkpoint_path, fingerprint, checkpoint_every)
+    checkpointer.install_signal_handler()
+    try:
+        result = assign_groups_iterative(groups, rooms, time_gap, candidates=candidates, symmetry=symmetry,
+                                         resume=resume, on_step=checkpointer)
+    finally:
+        checkpointer.remove_signal_handler()
+    checkpointer.discard()  # the search finished, so there is nothing left to resume
+    return result
+
+def run_solve(args):
+    from src.output_writer import write_output
+    from src.profiling import make_profiler, phase
+    from src.checkpoint import SearchInterrupted
+
+    profiler = make_profiler(args.profile)
+    if args.windowed:
+        run_windowed(args, profiler)
+        return
+    with phase(profiler, "load"):
+        groups, rooms = load_and_prepare_input(args.rooms_file, args.groups_file)
+    if args.gap_sweep:
+        run_gap_sweep(groups, rooms, args, profiler)
+        return
+    if args.optimize:
+        run_optimize(groups, rooms, args, profiler)
+        return
+
+    try:
+        transitions = None
+        if args.transitions:
+            from src.sites import load_transition_rules
+            transitions = load_transition_rules(args.transitions)
+        with phase(profiler, "solve"):
+            result = solve_input(groups, rooms, args.time_gap, args.order,
+                                 args.checkpoint, args.checkpoint_every, args.resume, transitions)
+    except ValueError as e:
+        print("Error:", e)
+        sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Error: File not found - {e.filename}")
+        sys.exit(1)
+    except SearchInterrupted as e:
+        print(f"Search stopped; state saved to '{e}'. Continue with --resume {e}")
+        sys.exit(1)
 
     if result:
-        write_output(None, result)              # to terminal
-        write_output("assignments.csv", result) # to file
+        with phase(profiler, "write"):
+            write_output(None, result)              # to terminal
+            write_output("assignments.csv", result) # to file
     else:
         print("Error: Constraints cannot be satisfied with the provided input.")
+        print("Run the 'diagnose' subcommand with the same arguments to find the conflicting groups.")
+
+def run_windowed(args, profiler=None):
+    """
+    run_windowed
+        Streams the groups file through `solve_windowed`, writing bookings to assignments.csv.partial
+        as they are finalized; it replaces assignments.csv only once every group is placed. Only the
+        rooms file is loaded up front.
+    """
+    import os
+    from src.input_reader import iter_groups, load_rows, finalize_input, parse_room
+    from src.output_writer import AssignmentStream
+    from src.profiling import phase
+    from src.windowed import solve_windowed
+
+    if args.gap_sweep or args.optimize or args.checkpoint or args.resume or args.transitions:
+        print("Error: --windowed cannot be combined with --gap-sweep, --optimize, --transitions, --checkpoint or --resume")
+        sys.exit(1)
+    try:
+        rooms, errors = load_rows(args.rooms_file, parse_room)
+        _, rooms = finalize_input([], rooms, errors)
+        with phase(profiler, "solve"), AssignmentStream("assignments.csv.partial") as output:
+            result = solve_windowed(iter_groups(args.groups_file), rooms, args.time_gap, output.write,
+                                    max(1, args.window_size), args.order)
+    except ValueError as e:
+        print("Error:", e)
+        if os.path.exists("assignments.csv.partial"):
+            print("The bookings finalized before the error are in 'assignments.csv.partial' (incomplete).")
+        sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Error: File not found - {e.filename}")
+        sys.exit(1)
+
+    print(f"Solved {result.groups} groups in {result.windows} windows "
+          f"(at most {result.peak_live} groups in memory).")
+    if not result.feasible:
+        print(f"Error: Constraints cannot be satisfied for the window starting {result.failed_at:%Y-%m-%d %H:%M}.")
+        if not result.exact:
+            print("Windows were split at --window-size, so a larger window size may still find a solution.")
+        print(f"The {output.written} groups placed before it are in '{output.filename}' (incomplete); "
+              "assignments.csv was left unchanged.")
+        sys.exit(1)
+    os.replace(output.filename, "assignments.csv")
+    print("Assignments written to 'assignments.csv'")
+
+def run_optimize(groups, rooms, args, profiler=None):
+    """
+    run_optimize
+        Solves with soft preferences, then writes the assignments and their score breakdown.
+    """
+    from src.output_writer import write_output, write_score_breakdown
+    from src.profiling import phase
+    from src.scoring import optimize_assignment, parse_weights
+
+    if args.checkpoint or args.resume or args.order or args.transitions:
+        print("Error: --optimize cannot be combined with --order, --transitions, --checkpoint or --resume")
+        sys.exit(1)
+    try:
+        weights = parse_weights(args.weights)
+    except ValueError as e:
+        print("Error:", e)
+        sys.exit(1)
+
+    with phase(profiler, "solve"):
+        result = optimize_assignment(groups, rooms, args.time_gap, weights)
+    if result is None:
+        print("Error: Constraints cannot be satisfied with the provided input.")
+        return
+
+    with phase(profiler, "write"):
+        write_output(None, result.rooms)
+        write_output("assignments.csv", result.rooms)
+        write_score_breakdown("assignments_scores.csv", result.breakdown, result.score)
+    print(f"Total score: {result.score:.3f} ({result.moves} improving moves)")
+
+def run_validate(args):
+    groups, rooms = load_and_prepare_input(args.rooms_file, args.groups_file)
+    print(f"Input is valid: {len(rooms)} rooms, {len(groups)} groups.")
+
+def run_diagnose(args):
+    """
+    run_diagnose
+        Reports a minimal set of groups that cannot all be assigned: their time window, the rooms
+        they compete for and the resource that runs out.
+    """
+    from src.diagnose import find_infeasible_core
+
+    groups, rooms = load_and_prepare_input(args.rooms_file, args.groups_file)
+    try:
+        transitions = None
+        if args.transitions:
+            from src.sites import load_transition_rules
+            transitions = load_transition_rules(args.transitions)
+    except ValueError as e:
+        print("Error:", e)
+        sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Error: File not found - {e.filename}")
+        sys.exit(1)
+
+    core = find_infeasible_core(groups, rooms, args.time_gap, transitions)
+    if core is None:
+        print("Input is satisfiable: every group can be assigned.")
+        return
+
+    print(f"Constraints cannot be satisfied. Minimal conflicting set "
+          f"({len(core.groups)} group(s), {len(core.rooms)} room(s)):")
+    print(f"  Time window : {core.start:%Y-%m-%d %H:%M} - {core.end:%Y-%m-%d %H:%M}")
+    print(f"  Reason      : {core.reason}")
+    print(f"  Rooms       : {', '.join(room.id for room in core.rooms) or '(none)'}")
+    print("  Groups      :")
+    for group in core.groups:
+        print(f"    {group.id} {group.start:%Y-%m-%d %H:%M} - {group.end:%H:%M}, size {group.size}")
+    sys.exit(1)
+
+def run_gap_sweep(groups, rooms, args, profiler=None):
+    """
+    run_gap_sweep
+        Searches for the largest feasible time gap, reports every probe and writes the
+        assignment found for that gap.
+    """
+    from src.gap_sweep import sweep_time_gap
+    from src.output_writer import write_output
+    from src.profiling import phase
+
+    if args.optimize or args.order or args.transitions or args.checkpoint or args.resume:
+        print("Error: --gap-sweep cannot be combined with --optimize, --order, --transitions, --checkpoint or --resume")
+        sys.exit(1)
+
+    with phase(profiler, "gap_sweep"):
+        sweep = sweep_time_gap(groups, rooms)
+
+    print("Time gap sweep:")
+    for probe in sweep.probes:
+        verdict = "feasible" if probe.feasible else "infeasible"
+        print(f"  gap {probe.gap:>5} min : {verdict:<10} ({probe.seconds:.4f} s)")
+
+    if sweep.best_gap is None:
+        print("Error: Constraints cannot be satisfied with the provided input.")
+        return
+
+    print(f"Maximum feasible time gap: {sweep.best_gap} minutes")
+    with phase(profiler, "write"):
+        write_output(None, sweep.assignment)
+        write_output("assignments.csv", sweep.assignment)
+
+def run_query(args):
+    """
+    run_query
+        Answers a free-room query from the command line, e.g.
+            query rooms.csv --assignments assignments.csv --start "2025-02-07 10:00" --end "2025-02-07 11:00"
+            query rooms.csv --groups groups.csv --length 60 --after "2025-02-07 08:00" --projector --floor 2
+        Existing bookings come from a previous output file (--assignments) or from solving a groups
+        file first (--groups); with neither, every room is treated as empty.
+    """
+    from datetime import datetime
+    from src.input_reader import read_csv, preprocess_data
+    from src.room_index import RoomIndex, RoomRequirements
+    from src.validators import parse_time
+
+    try:
+        if args.length is None and not (args.start and args.end):
+            raise ValueError("Give either --start and --end, or --length")
+
+        raw_groups = read_csv(args.groups) if args.groups else []
+        groups, rooms = preprocess_data(raw_groups, read_csv(args.rooms_file))
+        if groups and solve_input(groups, rooms, args.gap) is None:
+            raise ValueError("Constraints cannot be satisfied with the provided input.")
+
+        index = RoomIndex(rooms)
+        if args.assignments:
+            for row in read_csv(args.assignments):
+                index.add_booking(row["RoomID"], datetime.fromisoformat(row["Start"]), datetime.fromisoformat(row["End"]))
+
+        needs = RoomRequirements(args.size, args.wheelchair, args.projector, args.computer, args.floor)
+        if args.length is not None:
+            after = parse_time(args.after, "--after") if args.after else datetime.now().replace(second=0, microsecond=0)
+            slot = index.next_free_slot(args.length, after, args.gap, needs)
+            if slot is None:
+                print("No compatible room.")
+            else:
+                room, start, end = slot
+                print(f"{room.id} : {start} - {end}")
+        else:
+            free = index.free_rooms(parse_time(args.start, "--start"), parse_time(args.end, "--end"), args.gap, needs)
+            print("Free rooms:" if free else "No free compatible room.")
+            for room in free:
+                print(f"{room.id} (capacity {room.capacity}, floor {room.floor_level})")
+
+    except (ValueError, KeyError) as e:
+        print("Error:", e)
+        sys.exit(1)
+    except FileNotFoundError as e:
+        print(f"Error: File not found - {e.filename}")
+        sys.exit(1)
+
+def run_bench(args):
+    """
+    run_bench
+        Loads and solves the input `--repeat` times and reports the fastest and mean time per phase.
+    """
+    import time
+
+    timings = {"load": [], "solve": []}
+    result = None
+    for _ in range(max(1, args.repeat)):
+        started = time.perf_counter()
+        groups, rooms = load_and_prepare_input(args.rooms_file, args.groups_file)
+        loaded = time.perf_counter()
+        try:
+            result = solve_input(groups, rooms, args.time_gap, args.order)
+        except ValueError as e:
+            print("Error:", e)
+            sys.exit(1)
+        timings["load"].append(loaded - started)
+        timings["solve"].append(time.perf_counter() - loaded)
+
+    print(f"Benchmark over {len(timings['load'])} runs ({'feasible' if result else 'infeasible'}):")
+    for phase, samples in timings.items():
+        print(f"  {phase:<6} min {min(samples) * 1000:9.3f} ms   mean {sum(samples) / len(samples) * 1000:9.3f} ms")
 
 if __name__ == "__main__":
+    if getattr(sys, "frozen", False):
+        # Worker processes of a frozen build (build.ps1) start in this script; freeze_support() runs
+        # them instead of the CLI. Only imported when frozen, to keep startup cheap otherwise.
+        import multiprocessing
+        multiprocessing.freeze_support()
     main()
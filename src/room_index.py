@@ -0,0 +1,174 @@
+"""
+Module Name: room_index.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Answers "which rooms are free?" questions at interactive speed, without running
+a full solve, using per-room sorted booking timelines and a feature index.
+
+Module Summary:
+The index is built from a list of rooms (with or without the schedules of a previous solve) and can
+take further bookings afterwards, e.g. walk-ins confirmed at the front desk. It supports:
+- `free_rooms`: compatible rooms with no booking within the gap of [start, end).
+- `next_free_slot`: the earliest slot of a given length, in any compatible room, from a given time.
+Room requirements are matched through a feature index (sets of room IDs per equipment flag and
+floor, plus a capacity-sorted list), and each room's bookings are kept sorted so a window can be
+tested with a binary search. Time conflicts follow the same rule as `check_time_overlap`.
+
+Key Functions:
+- RoomIndex: The index itself
+- RoomRequirements: What the group needs (same meaning as the Group fields)
+
+Dependencies:
+- bisect for the sorted timelines
+- room.py for the indexed rooms
+
+Known/Suspected Errors:
+- Bookings in one room are assumed not to overlap (true for any assignment produced by the solver).
+"""
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+from .room import Room
+
+@dataclass(frozen=True)
+class RoomRequirements:
+    size: int = 1
+    wheelchair_access: bool = False
+    projector: bool = False
+    computer: bool = False
+    floor_preference: int = -1
+
+class RoomIndex:
+    FEATURES = ("wheelchair_access", "projector", "computer")
+
+    def __init__(self, rooms: List[Room]):
+        """
+        __init__
+            Indexes the rooms' attributes and any bookings already in their schedules
+            (every occurrence of recurring bookings).
+
+        Parameters:
+            rooms (List[Room]) - Rooms to index; their order is kept as the tie-break order
+        """
+        self._rooms: Dict[str, Room] = {room.id: room for room in rooms}
+        self._order: Dict[str, int] = {room.id: i for i, room in enumerate(rooms)}
+        self._by_feature: Dict[str, Set[str]] = {
+            feature: {room.id for room in rooms if getattr(room, feature)} for feature in self.FEATURES
+        }
+        self._by_floor: Dict[int, Set[str]] = {}
+        for room in rooms:
+            self._by_floor.setdefault(room.floor_level, set()).add(room.id)
+        self._by_capacity: List[Tuple[int, str]] = sorted((room.capacity, room.id) for room in rooms)
+
+        self._starts: Dict[str, List[datetime]] = {room.id: [] for room in rooms}
+        self._ends: Dict[str, List[datetime]] = {room.id: [] for room in rooms}
+        for room in rooms:
+            for _, _, group in room.schedule:
+                for start, end in group.occurrences():
+                    self.add_booking(room.id, start, end)
+
+    def add_booking(self, room_id: str, start: datetime, end: datetime):
+        """
+        add_booking
+            Records a booking in the room's timeline, keeping it sorted.
+
+        Parameters:
+            room_id (str) - ID of a room in the index
+            start (datetime) - booking start
+            end (datetime) - booking end
+
+        Exceptions:
+            KeyError - if the room is not indexed
+        """
+        starts, ends = self._starts[room_id], self._ends[room_id]
+        position = bisect_right(starts, start)
+        starts.insert(position, start)
+        ends.insert(position, end)
+
+    def compatible_rooms(self, needs: RoomRequirements) -> List[Room]:
+        """
+        compatible_rooms
+            Looks up the rooms meeting the capacity, accessibility, equipment and floor requirements.
+
+        Parameters:
+            needs (RoomRequirements) - what the group requires
+
+        Return Value:
+            List[Room] - matching rooms, in index order
+        """
+        first = bisect_left(self._by_capacity, (needs.size, ""))
+        matches = {room_id for _, room_id in self._by_capacity[first:]}
+        for feature in self.FEATURES:
+            if getattr(needs, feature):
+                matches &= self._by_feature[feature]
+        if needs.floor_preference != -1:
+            matches &= self._by_floor.get(needs.floor_preference, set())
+        return [self._rooms[room_id] for room_id in sorted(matches, key=self._order.__getitem__)]
+
+    def is_free(self, room_id: str, start: datetime, end: datetime, time_gap: int) -> bool:
+        """
+        is_free
+            Checks whether [start, end) can be booked in the room, keeping `time_gap` minutes
+            away from every existing booking.
+        """
+        buffer = timedelta(minutes=time_gap)
+        ends = self._ends[room_id]
+        position = bisect_right(ends, start - buffer)  # first booking ending after start - gap
+        return position == len(ends) or self._starts[room_id][position] >= end + buffer
+
+    def free_rooms(self, start: datetime, end: datetime, time_gap: int,
+                   needs: RoomRequirements = RoomRequirements()) -> List[Room]:
+        """
+        free_rooms
+            Lists the compatible rooms that are free for [start, end) with the given gap.
+
+        Parameters:
+            start (datetime) - window start
+            end (datetime) - window end
+            time_gap (int) - buffer in minutes required around existing bookings
+            needs (RoomRequirements) - what the group requires
+
+        Return Value:
+            List[Room] - free compatible rooms, in index order
+        """
+        return [room for room in self.compatible_rooms(needs) if self.is_free(room.id, start, end, time_gap)]
+
+    def next_free_slot(self, length: int, after: datetime, time_gap: int,
+                       needs: RoomRequirements = RoomRequirements()) -> Optional[Tuple[Room, datetime, datetime]]:
+        """
+        next_free_slot
+            Finds the earliest slot of `length` minutes starting at or after `after` in any
+            compatible room. Ties go to the room that comes first in the index.
+
+        Parameters:
+            length (int) - slot length in minutes
+            after (datetime) - earliest acceptable start
+            time_gap (int) - buffer in minutes required around existing bookings
+            needs (RoomRequirements) - what the group requires
+
+        Return Value:
+            Optional[Tuple[Room, datetime, datetime]] - room, slot start and slot end, or None if
+                                                        no room is compatible
+        """
+        best = None
+        for room in self.compatible_rooms(needs):
+            start = self._earliest_start(room.id, after, timedelta(minutes=length), timedelta(minutes=time_gap))
+            if best is None or start < best[1]:
+                best = (room, start)
+        if best is None:
+            return None
+        return best[0], best[1], best[1] + timedelta(minutes=length)
+
+    def _earliest_start(self, room_id: str, after: datetime, length: timedelta, buffer: timedelta) -> datetime:
+        """
+        _earliest_start
+            Walks the free gaps of one room from `after` until one fits the slot and buffers.
+        """
+        starts, ends = self._starts[room_id], self._ends[room_id]
+        start = after
+        position = bisect_right(ends, start - buffer)
+        while position < len(starts) and starts[position] < start + length + buffer:
+            start = max(start, ends[position] + buffer)
+            position += 1
+        return start
@@ -0,0 +1,303 @@
+"""
+Module Name: scoring.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Soft constraints (preferences) with weighted scores, and an optimizing engine that
+finds a feasible assignment and then improves its total score by local search.
+
+Module Summary:
+Hard constraints (capacity, accessibility, equipment, time conflicts) stay in constraints.py and are
+never traded away. In optimize mode the floor preference is no longer hard: a group that prefers
+floor 2 may be placed on another floor when floor 2 is full, and is scored by how close it gets.
+Every placed group earns, per weight:
+- floor: 1 on the preferred floor (or with no preference), 1 / (1 + floors away) otherwise
+- capacity_fit: group size / room capacity, so a snug room scores close to 1
+- room_changes: 1 if the group's previous session in the same cohort used the same room, 0.5 if
+  the cohort moves to another room on the same site, 0 if it changes site (a cohort's first
+  session, and groups without a cohort, score 1)
+The optimizer maximizes the weighted total. It first builds a feasible assignment with the
+backtracking solver, trying each group's rooms best score first, then applies improving moves:
+relocating a group to a free room, or swapping it with the single group blocking a better room.
+A move only changes the terms of the moved groups and of their cohort successors, so its score
+delta is computed from those groups alone.
+
+Key Functions:
+- optimize_assignment: Runs the optimizer and returns the rooms, total score and breakdown
+- Weights / parse_weights: Term weights and their command-line form
+- score_breakdown: Per-group scores of an assignment
+
+Dependencies:
+- constraints.py for the hard checks
+- solver.py and symmetry.py for the initial assignment
+
+Known/Suspected Errors:
+- Local search stops at a local optimum; the result is not guaranteed to be the best possible score.
+"""
+
+from dataclasses import dataclass, fields
+from typing import Dict, List, Optional, Tuple
+from .group import Group
+from .room import Room
+from .constraints import is_compatible, groups_conflict
+from .solver import assign_groups_iterative, passes_matching_bound
+from .symmetry import build_symmetry, canonical_order
+
+EPSILON = 1e-9  # smallest score gain that counts as an improvement
+
+@dataclass(frozen=True)
+class Weights:
+    floor: float = 1.0
+    capacity_fit: float = 1.0
+    room_changes: float = 1.0
+
+@dataclass
+class OptimizeResult:
+    rooms: List[Room]
+    score: float
+    breakdown: List[Dict[str, str]]
+    moves: int
+
+def parse_weights(val: str) -> Weights:
+    """
+    parse_weights
+        Parses weights given as comma-separated NAME=NUMBER pairs, e.g. "floor=2,room_changes=0.5".
+        Weights that are not mentioned keep their default of 1.
+
+    Parameters:
+        val (str) - The raw string value from the command line
+
+    Return Value:
+        Weights - The parsed weights
+
+    Exceptions:
+        ValueError - If a name is unknown or a value is not a non-negative number
+    """
+    names = [f.name for f in fields(Weights)]
+    values = {}
+    for part in filter(None, (p.strip() for p in (val or "").split(","))):
+        name, _, number = (s.strip() for s in part.partition("="))
+        if name not in names:
+            raise ValueError(f"Unknown weight '{name}' (expected one of {', '.join(names)})")
+        try:
+            values[name] = float(number)
+        except ValueError:
+            raise ValueError(f"Invalid value '{number}' for weight '{name}' (expected a number)")
+        if values[name] < 0:
+            raise ValueError(f"Weight '{name}' must not be negative")
+    return Weights(**values)
+
+def floor_score(group: Group, room: Room) -> float:
+    if group.floor_preference == -1:
+        return 1.0
+    return 1.0 / (1 + abs(group.floor_preference - room.floor_level))
+
+def capacity_score(group: Group, room: Room) -> float:
+    return group.size / room.capacity
+
+def change_score(previous: Optional[Room], room: Room) -> float:
+    if previous is None or previous.id == room.id:
+        return 1.0
+    return 0.5 if previous.site == room.site else 0.0
+
+def group_scores(group: Group, room: Room, previous: Optional[Room], weights: Weights) -> Tuple[float, float, float]:
+    """
+    group_scores
+        Weighted floor, capacity-fit and room-change terms of one placement.
+
+    Parameters:
+        group (Group) - The placed group
+        room (Room) - Its room
+        previous (Room, optional) - Room of the cohort's previous session, None if there is none
+        weights (Weights) - Term weights
+
+    Return Value:
+        Tuple[float, float, float] - The three weighted terms
+    """
+    return (weights.floor * floor_score(group, room),
+            weights.capacity_fit * capacity_score(group, room),
+            weights.room_changes * change_score(previous, room))
+
+def cohort_predecessors(groups: List[Group]) -> Dict[str, Group]:
+    """
+    cohort_predecessors
+        Maps each group to the previous session (by start time) of its cohort.
+    """
+    by_cohort: Dict[str, List[Group]] = {}
+    for group in groups:
+        if group.cohort:
+            by_cohort.setdefault(group.cohort, []).append(group)
+
+    previous = {}
+    for sessions in by_cohort.values():
+        sessions.sort(key=lambda g: (g.start, g.id))
+        for before, after in zip(sessions, sessions[1:]):
+            previous[after.id] = before
+    return previous
+
+def score_breakdown(groups: List[Group], placement: Dict[str, Room], weights: Weights) -> List[Dict[str, str]]:
+    """
+    score_breakdown
+        Lists the weighted score terms of every placed group.
+
+    Parameters:
+        groups (List[Group]) - The placed groups
+        placement (Dict[str, Room]) - Room of every group, keyed by group ID
+        weights (Weights) - Term weights
+
+    Return Value:
+        List[Dict[str, str]] - One row per group: GroupID, RoomID, Floor, CapacityFit, RoomChange, Score
+    """
+    previous = cohort_predecessors(groups)
+    rows = []
+    for group in groups:
+        room = placement[group.id]
+        before = previous.get(group.id)
+        terms = group_scores(group, room, placement[before.id] if before else None, weights)
+        rows.append({
+            "GroupID": group.id,
+            "RoomID": room.id,
+            "Floor": f"{terms[0]:.3f}",
+            "CapacityFit": f"{terms[1]:.3f}",
+            "RoomChange": f"{terms[2]:.3f}",
+            "Score": f"{sum(terms):.3f}"
+        })
+    return rows
+
+def optimize_assignment(groups: List[Group], rooms: List[Room], time_gap: int,
+                        weights: Weights = Weights(), max_passes: int = 20) -> Optional[OptimizeResult]:
+    """
+    optimize_assignment
+        Finds an assignment that satisfies every hard constraint and maximizes the weighted
+        soft-constraint score (see the module summary).
+
+    Parameters:
+        groups (List[Group]) - Groups to assign
+        rooms (List[Room]) - Available rooms (schedules are replaced by the result)
+        time_gap (int) - Minimum time gap (in minutes) required between group schedules
+        weights (Weights) - Term weights
+        max_passes (int) - Upper bound on local-search passes over all groups
+
+    Return Value:
+        Optional[OptimizeResult] - The rooms holding the assignment with its total score, per-group
+                                   breakdown and number of improving moves, or None if no assignment
+                                   satisfies the hard constraints
+    """
+    order = canonical_order(groups)
+    candidates = {}
+    for group in order:
+        options = [room for room in rooms if is_compatible(group, room, soft_floor=True)]
+        candidates[group.id] = sorted(options, key=lambda room: -sum(group_scores(group, room, None, weights)))
+
+    if not passes_matching_bound(order, candidates, time_gap):
+        return None
+    if assign_groups_iterative(order, rooms, time_gap, candidates=candidates,
+                               symmetry=build_symmetry(order, rooms)) is None:
+        return None
+
+    search = _LocalSearch(order, candidates, time_gap, weights,
+                          {group.id: room for room in rooms for _, _, group in room.schedule})
+    moves = search.improve(max_passes)
+
+    for room in rooms:
+        room.clear_schedule()
+    for group in order:
+        search.placement[group.id].add_booking(group.start, group.end, group)
+
+    score = sum(search.group_score(group) for group in order)
+    return OptimizeResult(rooms, score, score_breakdown(order, search.placement, weights), moves)
+
+class _LocalSearch:
+    def __init__(self, groups: List[Group], candidates: Dict[str, List[Room]], time_gap: int,
+                 weights: Weights, placement: Dict[str, Room]):
+        self.groups = groups
+        self.by_id = {group.id: group for group in groups}
+        self.candidates = candidates
+        self.candidate_ids = {gid: {room.id for room in rooms} for gid, rooms in candidates.items()}
+        self.time_gap = time_gap
+        self.weights = weights
+        self.placement = placement
+        self.occupants: Dict[str, List[Group]] = {}
+        for group in groups:
+            self.occupants.setdefault(placement[group.id].id, []).append(group)
+
+        self.previous = cohort_predecessors(groups)
+        self.following = {before.id: self.by_id[after_id] for after_id, before in self.previous.items()}
+
+    def group_score(self, group: Group) -> float:
+        before = self.previous.get(group.id)
+        return sum(group_scores(group, self.placement[group.id],
+                                self.placement[before.id] if before else None, self.weights))
+
+    def delta(self, changes: Dict[str, Room]) -> float:
+        """
+        delta
+            Score change of moving the groups in `changes`, from the terms that depend on their rooms.
+        """
+        affected = set(changes)
+        affected.update(self.following[gid].id for gid in changes if gid in self.following)
+
+        before = sum(self.group_score(self.by_id[gid]) for gid in affected)
+        saved = {gid: self.placement[gid] for gid in changes}
+        self.placement.update(changes)
+        after = sum(self.group_score(self.by_id[gid]) for gid in affected)
+        self.placement.update(saved)
+        return after - before
+
+    def blockers(self, group: Group, room: Room) -> List[Group]:
+        return [other for other in self.occupants.get(room.id, [])
+                if other is not group and groups_conflict(group, other, self.time_gap)]
+
+    def can_take(self, group: Group, room: Room, leaving: Group) -> bool:
+        # Whether `group` fits in `room` once `leaving` has moved out of it
+        return room.id in self.candidate_ids[group.id] and \
+               all(other is leaving for other in self.blockers(group, room))
+
+    def best_move(self, group: Group) -> Optional[Dict[str, Room]]:
+        """
+        best_move
+            The best improving relocation or swap for the group, or None if there is none.
+        """
+        current = self.placement[group.id]
+        best, best_delta = None, EPSILON
+        for room in self.candidates[group.id]:
+            if room.id == current.id:
+                continue
+            blocking = self.blockers(group, room)
+            if not blocking:
+                changes = {group.id: room}
+            elif len(blocking) == 1 and self.can_take(blocking[0], current, leaving=group):
+                changes = {group.id: room, blocking[0].id: current}  # swap rooms with the blocking group
+            else:
+                continue
+            gain = self.delta(changes)
+            if gain > best_delta:
+                best, best_delta = changes, gain
+        return best
+
+    def apply(self, changes: Dict[str, Room]):
+        for gid, room in changes.items():
+            group = self.by_id[gid]
+            old = self.placement[gid]
+            self.occupants[old.id] = [other for other in self.occupants[old.id] if other is not group]
+            self.occupants.setdefault(room.id, []).append(group)
+            self.placement[gid] = room
+
+    def improve(self, max_passes: int) -> int:
+        """
+        improve
+            Applies the best move of each group in turn until a full pass finds no improvement.
+
+        Return Value:
+            int - The number of moves applied
+        """
+        moves = 0
+        for _ in range(max_passes):
+            improved = False
+            for group in self.groups:
+                changes = self.best_move(group)
+                if changes:
+                    self.apply(changes)
+                    moves += 1
+                    improved = True
+            if not improved:
+                break
+        return moves
@@ -0,0 +1,337 @@
+"""
+Module Name: sites.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Multi-site (multi-building / multi-campus) solving: travel-time rules between sites
+for cohorts, and a solver that splits the problem into one shard per site.
+
+Module Summary:
+Rooms carry a `Site`, and a group may be pinned to one with its own `Site` column. A cohort that
+changes site between consecutive sessions needs the travel gap given for that pair of sites in a
+transition rules file (columns FromSite,ToSite,Gap in minutes; a rule also covers the way back
+unless that direction has its own row). Pairs of sites without a rule are not restricted, so without
+a rules file the result matches the single-site solver.
+
+Room assignment inside one site never affects another site, so once every group has a site the
+problem splits into independent shards, which are solved in parallel worker processes. Only the
+floating groups (compatible rooms on several sites) need coordination:
+1. Pinned groups, and groups whose compatible rooms all lie on one site, are fixed to that site.
+2. Floating groups get a site in time order, preferring the site of their cohort's previous session
+   and then the least loaded site, skipping sites the cohort cannot reach in time.
+3. The shards are solved. If one fails, the next site selection is tried; verdicts are cached per
+   (site, groups), and a selection that gives a site a superset of a failed shard is skipped.
+4. After `max_attempts` failed selections (or many skipped ones) the whole input is solved jointly, with the travel rules
+   checked inside the search, so the answer is exact either way.
+
+Key Functions:
+- solve_sharded: Solves a multi-site input
+- TransitionRules / load_transition_rules: Travel gaps between sites
+- solve_jointly: Single search over all sites, checking travel gaps during the search
+
+Dependencies:
+- solver.py, symmetry.py and ordering.py for the shard solves
+- concurrent.futures (imported only when shards run in parallel)
+
+Known/Suspected Errors:
+- Travel gaps are checked between the first occurrences of recurring sessions.
+"""
+
+import os
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+from .group import Group
+from .room import Room
+from .solver import assign_groups_iterative, build_candidates, passes_matching_bound
+from .symmetry import build_symmetry, canonical_order
+from .scoring import cohort_predecessors
+
+@dataclass
+class TransitionRules:
+    gaps: Dict[Tuple[str, str], int] = field(default_factory=dict)
+
+    def gap(self, from_site: str, to_site: str) -> int:
+        """
+        gap
+            Minutes a cohort needs to get from one site to the other (0 within a site).
+        """
+        if from_site == to_site:
+            return 0
+        return self.gaps.get((from_site, to_site), self.gaps.get((to_site, from_site), 0))
+
+    def allows(self, first: Group, first_site: str, second: Group, second_site: str) -> bool:
+        """
+        allows
+            Checks that a cohort can get from its session `first` to its next session `second`.
+            Only pairs of sites with a rule are checked.
+        """
+        if first_site == second_site or ((first_site, second_site) not in self.gaps
+                                         and (second_site, first_site) not in self.gaps):
+            return True
+        return second.start - first.end >= timedelta(minutes=self.gap(first_site, second_site))
+
+def load_transition_rules(filename: str) -> TransitionRules:
+    """
+    load_transition_rules
+        Reads a transition rules CSV with the columns FromSite,ToSite,Gap.
+
+    Parameters:
+        filename (str) - path to the rules file
+
+    Return Value:
+        TransitionRules - the travel gaps per pair of sites
+
+    Exceptions:
+        FileNotFoundError - if the file does not exist
+        InputValidationError - listing every invalid row
+    """
+    from .input_reader import read_csv
+    from .validators import InputValidationError, parse_int
+
+    rules, errors = TransitionRules(), []
+    for index, row in enumerate(read_csv(filename)):
+        try:
+            from_site, to_site = row["FromSite"].strip(), row["ToSite"].strip()
+            if not from_site or not to_site:
+                raise ValueError("FromSite and ToSite must not be empty")
+            rules.gaps[(from_site, to_site)] = parse_int(row["Gap"], "Gap", 0)
+        except (KeyError, ValueError, AttributeError) as e:
+            errors.append(f"Invalid transition rule (line {index + 2}): {e}")
+    if errors:
+        raise InputValidationError(errors)
+    return rules
+
+def solve_sharded(groups: List[Group], rooms: List[Room], time_gap: int,
+                  rules: Optional[TransitionRules] = None, strategy: Optional[str] = None,
+                  workers: Optional[int] = None, max_attempts: int = 8) -> Optional[List[Room]]:
+    """
+    solve_sharded
+        Assigns groups to rooms across several sites (see the module summary).
+
+    Parameters:
+        groups (List[Group]) - Groups to assign
+        rooms (List[Room]) - Available rooms of every site (modified in-place)
+        time_gap (int) - Minimum time gap (in minutes) required between bookings of a room
+        rules (TransitionRules, optional) - Travel gaps for cohorts changing site
+        strategy (str, optional) - Room ordering strategy for every solve (see ordering.py)
+        workers (int, optional) - Worker processes for the shards (defaults to the CPU count)
+        max_attempts (int) - Site selections to try before falling back to a joint solve
+
+    Return Value:
+        Optional[List[Room]] - The rooms holding the assignment, or None if none exists
+
+    Exceptions:
+        ValueError - if the ordering strategy is unknown
+    """
+    rules = rules or TransitionRules()
+    workers = workers or os.cpu_count() or 1
+    candidates = build_candidates(groups, rooms)
+    sites = list(dict.fromkeys(room.site for room in rooms))
+    domains = {group.id: [site for site in sites if any(room.site == site for room in candidates[group.id])]
+               for group in groups}
+    if any(not domain for domain in domains.values()):
+        return None
+
+    links = cohort_links(groups)
+    fixed = {group.id: domains[group.id][0] for group in groups if len(domains[group.id]) == 1}
+    floating = [group for group in groups if group.id not in fixed]
+    by_id = {group.id: group for group in groups}
+    for group in groups:
+        if group.id in fixed and not _reachable(group, fixed[group.id], fixed, links, by_id, rules):
+            return None  # two pinned sessions of a cohort are too close for the travel between them
+
+    verdicts: Dict[Tuple[str, FrozenSet[str]], Optional[Dict[str, str]]] = {}
+    attempts = skipped = 0
+    for selection in _site_selections(groups, floating, domains, fixed, links, by_id, rules, candidates, time_gap):
+        shards = {site: [group for group in groups if selection[group.id] == site] for site in sites}
+        keys = {site: (site, frozenset(group.id for group in shard)) for site, shard in shards.items()}
+        if any(_known_to_fail(key, verdicts) for key in keys.values()):
+            skipped += 1
+            if skipped >= max_attempts * 100:
+                break
+            continue
+
+        pending = [site for site in sites if keys[site] not in verdicts]
+        tasks = [(shards[site], [room for room in rooms if room.site == site], time_gap, strategy) for site in pending]
+        for site, placement in zip(pending, _run_shards(tasks, workers)):
+            verdicts[keys[site]] = placement
+
+        if all(verdicts[key] is not None for key in keys.values()):
+            rooms_by_id = {room.id: room for room in rooms}
+            for group in canonical_order(groups):
+                room_id = next(verdicts[key][group.id] for key in keys.values() if group.id in verdicts[key])
+                rooms_by_id[room_id].add_booking(group.start, group.end, group)
+            return rooms
+
+        attempts += 1
+        if attempts >= max_attempts:
+            break
+    else:
+        return None  # every site selection was tried, and the shard solves are exact
+
+    return solve_jointly(groups, rooms, time_gap, rules, strategy, links)
+
+def cohort_links(groups: List[Group]) -> Dict[str, List[Tuple[str, bool]]]:
+    """
+    cohort_links
+        Maps each group to its cohort neighbours, flagged True when the neighbour is the earlier session.
+    """
+    links: Dict[str, List[Tuple[str, bool]]] = {group.id: [] for group in groups}
+    for later_id, earlier in cohort_predecessors(groups).items():
+        links[later_id].append((earlier.id, True))
+        links[earlier.id].append((later_id, False))
+    return links
+
+def _reachable(group: Group, site: str, sited: Dict[str, str], links, by_id: Dict[str, Group],
+               rules: TransitionRules) -> bool:
+    """
+    _reachable
+        Checks the travel rules between the group on `site` and its cohort neighbours that have a site.
+    """
+    for other_id, other_first in links[group.id]:
+        other_site = sited.get(other_id)
+        if other_site is None:
+            continue
+        if other_first and not rules.allows(by_id[other_id], other_site, group, site):
+            return False
+        if not other_first and not rules.allows(group, site, by_id[other_id], other_site):
+            return False
+    return True
+
+def _site_selections(groups: List[Group], floating: List[Group], domains: Dict[str, List[str]],
+                     fixed: Dict[str, str], links, by_id: Dict[str, Group], rules: TransitionRules,
+                     candidates: Dict[str, List[Room]], time_gap: int) -> Iterator[Dict[str, str]]:
+    """
+    _site_selections
+        Enumerates site choices for the floating groups that respect the travel rules, depth first
+        with an explicit stack, best-looking choice first.
+    """
+    buffer = timedelta(minutes=time_gap)
+    starts: Dict[str, List] = {site: [] for domain in domains.values() for site in domain}
+    ends: Dict[str, List] = {site: [] for site in starts}
+    for group in groups:
+        if group.id in fixed:
+            insort(starts[fixed[group.id]], group.start)
+            insort(ends[fixed[group.id]], group.end)
+
+    def preference(group: Group, site: str) -> Tuple:
+        # The cohort's previous site first, then the site with the fewest overlapping groups per room
+        previous = [fixed.get(other_id, sited.get(other_id)) for other_id, first in links[group.id] if first]
+        overlapping = bisect_left(starts[site], group.end + buffer) - bisect_right(ends[site], group.start - buffer)
+        site_rooms = sum(1 for room in candidates[group.id] if room.site == site)
+        return (site not in previous, overlapping / site_rooms)
+
+    sited: Dict[str, str] = dict(fixed)
+    floating = sorted(floating, key=lambda g: g.start)
+    stack: List[List[str]] = []  # remaining site options per floating group on the current path
+    while True:
+        depth = len(stack)
+        if depth == len(floating):
+            yield dict(sited)
+        else:
+            group = floating[depth]
+            options = [site for site in domains[group.id] if _reachable(group, site, sited, links, by_id, rules)]
+            options.sort(key=lambda site: preference(group, site), reverse=True)  # popped from the end
+            stack.append(options)
+
+        # Take the next option at the deepest level that has one left
+        while stack:
+            group = floating[len(stack) - 1]
+            if group.id in sited:
+                site = sited.pop(group.id)
+                starts[site].remove(group.start)
+                ends[site].remove(group.end)
+            if stack[-1]:
+                site = stack[-1].pop()
+                sited[group.id] = site
+                insort(starts[site], group.start)
+                insort(ends[site], group.end)
+                break
+            stack.pop()
+        if not stack:
+            return
+
+def _known_to_fail(key: Tuple[str, FrozenSet[str]], verdicts) -> bool:
+    # Adding groups to an infeasible shard keeps it infeasible
+    site, ids = key
+    return any(placement is None and known_site == site and known_ids <= ids
+               for (known_site, known_ids), placement in verdicts.items())
+
+def _run_shards(tasks: list, workers: int) -> List[Optional[Dict[str, str]]]:
+    """
+    _run_shards
+        Solves the shards, in worker processes when there are several shards and CPUs.
+    """
+    if workers > 1 and len(tasks) > 1:
+        from concurrent.futures import ProcessPoolExecutor  # pulls in multiprocessing; only needed here
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            return list(pool.map(_solve_shard, tasks))
+    return [_solve_shard(task) for task in tasks]
+
+def _solve_shard(task: Tuple[List[Group], List[Room], int, Optional[str]]) -> Optional[Dict[str, str]]:
+    """
+    _solve_shard
+        Worker: solves the groups of one site in that site's rooms.
+
+    Return Value:
+        Optional[Dict[str, str]] - room ID per group ID, or None if the shard is infeasible
+    """
+    groups, rooms, time_gap, strategy = task
+    if not groups:
+        return {}
+    order = canonical_order(groups)
+    if strategy:
+        from .ordering import order_candidates
+        candidates = order_candidates(order, rooms, time_gap, strategy)
+    else:
+        candidates = build_candidates(order, rooms)
+    if not passes_matching_bound(order, candidates, time_gap):
+        return None
+
+    result = assign_groups_iterative(order, rooms, time_gap, candidates=candidates, symmetry=build_symmetry(order, rooms))
+    placement = None if result is None else {group.id: room.id for room in rooms for _, _, group in room.schedule}
+    for room in rooms:
+        room.clear_schedule()  # the rooms are shared with the caller when shards run in-process
+    return placement
+
+def solve_jointly(groups: List[Group], rooms: List[Room], time_gap: int, rules: TransitionRules,
+                   strategy: Optional[str], links) -> Optional[List[Room]]:
+    """
+    solve_jointly
+        One search over every group and room, checking the travel rules as groups are placed. It is
+        the fallback of `solve_sharded`, and the exact check used by diagnose.py for multi-site input.
+
+    Parameters:
+        groups, rooms, time_gap, rules, strategy - As for `solve_sharded`
+        links (Dict) - Cohort neighbours from `cohort_links`
+
+    Return Value:
+        Optional[List[Room]] - The rooms holding the assignment, or None if none exists
+    """
+    order = canonical_order(groups)
+    if strategy:
+        from .ordering import order_candidates
+        candidates = order_candidates(order, rooms, time_gap, strategy)
+    else:
+        candidates = build_candidates(order, rooms)
+    if not passes_matching_bound(order, candidates, time_gap):
+        return None
+
+    position = {group.id: i for i, group in enumerate(order)}
+    earlier_links: List[List[Tuple[int, bool]]] = [[] for _ in order]  # checked when the later-placed one is placed
+    for i, group in enumerate(order):
+        for other_id, other_first in links[group.id]:
+            if position[other_id] < i:
+                earlier_links[i].append((position[other_id], other_first))
+
+    def travel_ok(depth: int, room: Room, chosen: List[Room]) -> bool:
+        for other, other_first in earlier_links[depth]:
+            first, second = (other, depth) if other_first else (depth, other)
+            first_site = chosen[other].site if other_first else room.site
+            second_site = room.site if other_first else chosen[other].site
+            if not rules.allows(order[first], first_site, order[second], second_site):
+                return False
+        return True
+
+    return assign_groups_iterative(order, rooms, time_gap, candidates=candidates,
+                                   symmetry=build_symmetry(order, rooms, ordered_cohorts=True), constraint=travel_ok)
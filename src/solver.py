@@ -5,10 +5,13 @@ File Purpose: Provides the core backtracking logic and preprocessing functions f
 based on constraints such as schedule, equipment, accessibility, and room capacity.
 """
 
-from typing import List, Dict, Optional
+import heapq
+from datetime import timedelta
+from typing import Callable, List, Dict, Optional, Tuple
 from .group import Group
 from .room import Room
-from .constraints import is_valid_assignment
+from .constraints import is_valid_assignment, is_compatible, check_time_overlap
+from .symmetry import Symmetry
 from datetime import datetime
 
 """
@@ -17,6 +20,11 @@ This module handles the core backtracking algorithm and data preparation logic f
 It includes:
 - `preprocess_data`: Converts raw dictionary input into typed `Group` and `Room` objects.
 - `assign_groups`: Recursive function using backtracking to assign each group to a valid room.
+- `assign_groups_iterative`: The same search with an explicit stack, so it has no recursion limit and its
+  state can be checkpointed and resumed.
+- `build_candidates`: Precomputes the statically compatible rooms for every group.
+- `passes_matching_bound`: Cheap necessary condition used to reject infeasible inputs before searching.
+- `find_matching_violation`: The same check, returning the groups that break it.
 - `format_output`: Prepares the final assignments in a structured output format.
 
 Dependencies:
@@ -30,7 +38,9 @@ Known/Suspected Errors:
 
 
 
-def assign_groups(groups: List[Group], rooms: List[Room], time_gap: int, index: int = 0) -> Optional[List[Room]]:
+def assign_groups(groups: List[Group], rooms: List[Room], time_gap: int, index: int = 0,
+                  candidates: Optional[Dict[str, List[Room]]] = None,
+                  symmetry: Optional[Symmetry] = None) -> Optional[List[Room]]:
     """
     assign_groups
         Recursively assigns each group to a valid room using backtracking and constraint validation.
@@ -40,6 +50,12 @@ def assign_groups(groups: List[Group], rooms: List[Room], time_gap: int, index:
         rooms (List[Room]) - List of available room objects (modified in-place)
         time_gap (int) - Minimum time gap (in minutes) required between group schedules
         index (int) - Internal index tracker used by the recursive call
+        candidates (Dict[str, List[Room]], optional) - Precomputed compatible rooms per group ID
+                       (see `build_candidates`). When given, only these rooms are tried, in the
+                       listed order, and only the schedule check is repeated.
+        symmetry (Symmetry, optional) - Room classes and identical-group runs from `build_symmetry`.
+                       When given, interchangeable rooms are tried once per step and identical
+                       groups only in one arrangement.
 
     Return Value:
         Optional[List[Room]] - Returns the modified list of rooms if a complete assignment is possible,
@@ -51,17 +67,218 @@ def assign_groups(groups: List[Group], rooms: List[Room], time_gap: int, index:
     group = groups[index]
     # print(f"[Info] Attempting to assign group {group.id} (Index {index})") -- uncomment for inspection
 
-    for room in rooms:
-        if is_valid_assignment(group, room, time_gap):
-            room.add_booking(group.start, group.end, group)
-            result = assign_groups(groups, rooms, time_gap, index + 1)
-            if result is not None:
-                return result
-            room.remove_last_booking()
-            # print(f"[Backtrack] Removed group {group.id} from room {room.id}") -- debugging uncomment if needed
+    if candidates is None:
+        options = (room for room in rooms if is_valid_assignment(group, room, time_gap))
+    else:
+        options = (room for room in candidates[group.id] if check_time_overlap(group, room, time_gap))
+
+    tried = set()
+    for room in options:
+        if symmetry is not None:
+            signature = symmetry.signature(room)
+            if signature in tried or not symmetry.allows(index, room):
+                continue  # a mirror image of an option already explored
+            tried.add(signature)
+            symmetry.record(index, room)
+
+        room.add_booking(group.start, group.end, group)
+        result = assign_groups(groups, rooms, time_gap, index + 1, candidates, symmetry)
+        if result is not None:
+            return result
+        room.remove_last_booking()
+        # print(f"[Backtrack] Removed group {group.id} from room {room.id}") -- debugging uncomment if needed
 
     return None  # No valid assignment found for this group
 
+def assign_groups_iterative(groups: List[Group], rooms: List[Room], time_gap: int,
+                            candidates: Optional[Dict[str, List[Room]]] = None,
+                            symmetry: Optional[Symmetry] = None,
+                            resume: Optional[Tuple[List[int], int]] = None,
+                            on_step: Optional[Callable[[List[int], int], None]] = None,
+                            constraint: Optional[Callable[[int, Room, List[Room]], bool]] = None) -> Optional[List[Room]]:
+    """
+    assign_groups_iterative
+        Explores exactly the same search tree, in the same order, as `assign_groups`, but keeps the
+        current path on an explicit stack instead of the call stack.
+
+    Parameters:
+        groups (List[Group]) - List of all group objects to assign
+        rooms (List[Room]) - List of available room objects (modified in-place)
+        time_gap (int) - Minimum time gap (in minutes) required between group schedules
+        candidates (Dict[str, List[Room]], optional) - As for `assign_groups`
+        symmetry (Symmetry, optional) - As for `assign_groups`
+        resume (Tuple[List[int], int], optional) - Search state to continue from, as passed to `on_step`
+        on_step (Callable, optional) - Called before each group placement attempt with the search state:
+                       the option index chosen for every placed group, and the option index the next
+                       group will be tried from. The state must not be modified.
+        constraint (Callable, optional) - Extra check linking groups across rooms (e.g. cohort travel
+                       times), called with the group's index, the room and the rooms chosen for the groups
+                       before it. It may only look at earlier groups, and must treat rooms of the same
+                       symmetry class alike when symmetry is used.
+
+    Return Value:
+        Optional[List[Room]] - The modified rooms if a complete assignment is possible, otherwise None.
+
+    Exceptions:
+        ValueError - If `resume` does not describe a valid partial assignment of these groups
+    """
+    options = [candidates[group.id] if candidates is not None else rooms for group in groups]
+    stack: List[int] = []   # option index chosen for each placed group
+    chosen: List[Room] = []  # the corresponding rooms
+    tried: List[set] = []   # symmetry signatures already explored at each depth
+    next_option = 0
+
+    def usable(depth: int, room: Room) -> bool:
+        group = groups[depth]
+        if constraint is not None and not constraint(depth, room, chosen):
+            return False
+        if candidates is None:
+            return is_valid_assignment(group, room, time_gap)
+        return check_time_overlap(group, room, time_gap)
+
+    def explored(depth: int, room: Room) -> bool:
+        # Applies the symmetry rules; returns True if the room mirrors an option already explored
+        if symmetry is None:
+            return False
+        signature = symmetry.signature(room)
+        if signature in tried[depth] or not symmetry.allows(depth, room):
+            return True
+        tried[depth].add(signature)
+        return False
+
+    def replay(depth: int, upto: int):
+        # Rebuilds the symmetry signatures of the options before `upto`, as the search saw them
+        for room in options[depth][:upto]:
+            if usable(depth, room):
+                explored(depth, room)
+
+    if resume is not None:
+        resumed_stack, next_option = resume
+        if len(resumed_stack) >= len(groups) or not 0 <= next_option <= len(options[len(resumed_stack)]):
+            raise ValueError("Search state does not match the groups being assigned")
+        for depth, choice in enumerate(resumed_stack):
+            tried.append(set())
+            replay(depth, choice)
+            if not 0 <= choice < len(options[depth]) or not usable(depth, options[depth][choice]):
+                raise ValueError(f"Search state places group {groups[depth].id} in a room it cannot use")
+            room = options[depth][choice]
+            if symmetry is not None:
+                symmetry.record(depth, room)
+            room.add_booking(groups[depth].start, groups[depth].end, groups[depth])
+            stack.append(choice)
+            chosen.append(room)
+        tried.append(set())
+        replay(len(stack), next_option)
+    else:
+        tried.append(set())
+
+    while True:
+        depth = len(stack)
+        if depth == len(groups):
+            return rooms  # All groups assigned successfully
+        if on_step is not None:
+            on_step(stack, next_option)
+
+        group = groups[depth]
+        for choice in range(next_option, len(options[depth])):
+            room = options[depth][choice]
+            if not usable(depth, room) or explored(depth, room):
+                continue
+            if symmetry is not None:
+                symmetry.record(depth, room)
+            room.add_booking(group.start, group.end, group)
+            stack.append(choice)
+            chosen.append(room)
+            tried.append(set())
+            next_option = 0
+            break
+        else:
+            # No valid room left for this group: backtrack to the previous one
+            if not stack:
+                return None
+            tried.pop()
+            choice = stack.pop()
+            chosen.pop().remove_last_booking()
+            next_option = choice + 1
+
+def build_candidates(groups: List[Group], rooms: List[Room]) -> Dict[str, List[Room]]:
+    """
+    build_candidates
+        Precomputes, for every group, the rooms that pass all schedule-independent constraints.
+        The lists keep the order of `rooms`, so passing them to `assign_groups` explores the
+        same search tree as the unfiltered call.
+
+    Parameters:
+        groups (List[Group]) - Groups to be assigned
+        rooms (List[Room]) - Available rooms, in the order they should be tried
+
+    Return Value:
+        Dict[str, List[Room]] - Compatible rooms keyed by group ID
+    """
+    return {group.id: [room for room in rooms if is_compatible(group, room)] for group in groups}
+
+def passes_matching_bound(groups: List[Group], candidates: Dict[str, List[Room]], time_gap: int) -> bool:
+    """
+    passes_matching_bound
+        Necessary condition for feasibility. All groups whose gap-extended intervals contain the
+        same instant conflict pairwise, so at every group start the active groups must be matchable
+        to distinct compatible rooms. Failing this proves no assignment exists; passing it proves nothing.
+
+    Parameters:
+        groups (List[Group]) - Groups to be assigned
+        candidates (Dict[str, List[Room]]) - Compatible rooms per group ID (see `build_candidates`)
+        time_gap (int) - Minimum time gap (in minutes) required between group schedules
+
+    Return Value:
+        bool - False if some instant has more conflicting groups than they have distinct rooms
+    """
+    return find_matching_violation(groups, candidates, time_gap) is None
+
+def find_matching_violation(groups: List[Group], candidates: Dict[str, List[Room]],
+                            time_gap: int) -> Optional[List[Group]]:
+    """
+    find_matching_violation
+        Runs the check of `passes_matching_bound` and reports where it fails.
+
+    Return Value:
+        Optional[List[Group]] - The groups active at the first instant that cannot all get their own
+                                compatible room (an infeasible subset), or None if the bound passes
+    """
+    buffer = timedelta(minutes=time_gap)
+    active = []  # heap of (gap-extended end, position, group)
+    ordered = sorted(groups, key=lambda g: g.start)
+
+    for position, group in enumerate(ordered):
+        while active and active[0][0] <= group.start:
+            heapq.heappop(active)
+        heapq.heappush(active, (group.end + buffer, position, group))
+
+        # Several groups may share this start; only check once all of them are active
+        if position + 1 < len(ordered) and ordered[position + 1].start == group.start:
+            continue
+        if not _has_perfect_matching([g for _, _, g in active], candidates):
+            return [g for _, _, g in sorted(active, key=lambda entry: entry[1])]
+    return None
+
+def _has_perfect_matching(groups: List[Group], candidates: Dict[str, List[Room]]) -> bool:
+    """
+    _has_perfect_matching
+        Checks whether every group can get its own compatible room (augmenting-path matching).
+    """
+    matched: Dict[str, Group] = {}  # room ID -> group
+
+    def augment(group: Group, visited: set) -> bool:
+        for room in candidates[group.id]:
+            if room.id in visited:
+                continue
+            visited.add(room.id)
+            if room.id not in matched or augment(matched[room.id], visited):
+                matched[room.id] = group
+                return True
+        return False
+
+    return all(augment(group, set()) for group in groups)
+
 def format_output(rooms: List[Room]) -> List[Dict[str, str]]:
     """
     format_output
@@ -71,7 +288,8 @@ def format_output(rooms: List[Room]) -> List[Dict[str, str]]:
         rooms (List[Room]) - List of rooms, each containing schedule data with assigned groups
 
     Return Value:
-        List[Dict[str, str]] - List of dictionaries containing GroupID, RoomID, Start and End time strings
+        List[Dict[str, str]] - List of dictionaries containing GroupID, RoomID, Start and End time strings,
+                               one per occurrence of recurring groups
     """
     return [
         {
@@ -81,5 +299,6 @@ def format_output(rooms: List[Room]) -> List[Dict[str, str]]:
             "End": end.strftime("%H:%M")
         }
         for room in rooms
-        for start, end, group in room.schedule
+        for _, _, group in room.schedule
+        for start, end in group.occurrences()
     ]
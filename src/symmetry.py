@@ -0,0 +1,125 @@
+"""
+Module Name: symmetry.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Symmetry breaking for the backtracking solver, so interchangeable rooms and identical
+groups are not explored once per copy.
+
+Module Summary:
+Two kinds of symmetry multiply the search without changing its outcome:
+- Rooms that match in every attribute the constraints look at (capacity, accessibility, equipment,
+  floor, site) and currently hold bookings at the same times are interchangeable. If one of them failed
+  for a group, its twins will fail too, so only one representative per class is tried at each step.
+- Groups that match in every attribute, time, recurrence pattern, site and cohort are interchangeable. Any
+  solution can be rearranged so that, within each run of identical groups, later groups use rooms
+  further down the room list, so the solver only explores that arrangement.
+Both rules only remove assignments that are mirror images of ones already explored, so
+`assign_groups` still finds a solution whenever one exists.
+
+Key Functions:
+- build_symmetry: Buckets rooms into classes and finds runs of identical groups
+- canonical_order: Reorders groups so identical groups are next to each other
+
+Dependencies:
+- group.py, room.py
+
+Known/Suspected Errors:
+- None known at this time.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+from .group import Group
+from .room import Room
+
+def room_key(room: Room) -> Tuple:
+    """
+    room_key
+        Attributes that decide whether two rooms are interchangeable for the constraints.
+    """
+    return (room.capacity, room.wheelchair_access, room.projector, room.computer, room.floor_level, room.site)
+
+def group_key(group: Group) -> Tuple:
+    """
+    group_key
+        Attributes that decide whether two groups are interchangeable.
+    """
+    recurrence = group.recurrence.sort_key if group.recurrence else ()
+    return (group.start, group.end, group.size, group.wheelchair_access,
+            group.projector, group.computer, group.floor_preference, recurrence, group.site, group.cohort)
+
+@dataclass
+class Symmetry:
+    room_class: Dict[str, Tuple]
+    room_position: Dict[str, int]
+    same_as_previous: List[bool]
+    chosen_position: List[Optional[int]] = field(default_factory=list)
+
+    def allows(self, index: int, room: Room) -> bool:
+        """
+        allows
+            Checks the ordering rule for identical groups: a group identical to the one assigned just
+            before it must use a room further down the room list.
+        """
+        if not self.same_as_previous[index]:
+            return True
+        return self.room_position[room.id] > self.chosen_position[index - 1]
+
+    def signature(self, room: Room) -> Tuple:
+        """
+        signature
+            Identifies a room up to symmetry: its class plus the times (and recurrence patterns)
+            it is currently booked.
+            Rooms without a twin keep their own ID so no schedule needs to be compared.
+        """
+        key = self.room_class.get(room.id)
+        if key is None:
+            return (room.id,)
+        return (key, tuple(sorted((start, end, group.recurrence) for start, end, group in room.schedule)))
+
+    def record(self, index: int, room: Room):
+        """
+        record
+            Remembers which room the group at `index` currently occupies.
+        """
+        self.chosen_position[index] = self.room_position[room.id]
+
+def build_symmetry(groups: List[Group], rooms: List[Room], ordered_cohorts: bool = False) -> Symmetry:
+    """
+    build_symmetry
+        Precomputes the room classes and identical-group runs for one solve.
+
+    Parameters:
+        groups (List[Group]) - Groups in the order the solver will assign them
+        rooms (List[Room]) - Available rooms
+        ordered_cohorts (bool) - Never treat groups with a cohort as identical. Needed when a search
+                       constraint links cohort sessions by their order (e.g. travel between sites),
+                       since swapping two such groups changes which one the next session follows.
+
+    Return Value:
+        Symmetry - to pass to `assign_groups` as `symmetry`
+    """
+    class_sizes: Dict[Tuple, int] = {}
+    for room in rooms:
+        class_sizes[room_key(room)] = class_sizes.get(room_key(room), 0) + 1
+
+    return Symmetry(
+        room_class={room.id: room_key(room) for room in rooms if class_sizes[room_key(room)] > 1},
+        room_position={room.id: i for i, room in enumerate(rooms)},
+        same_as_previous=[i > 0 and group_key(groups[i - 1]) == group_key(group)
+                          and not (ordered_cohorts and group.cohort) for i, group in enumerate(groups)],
+        chosen_position=[None] * len(groups)
+    )
+
+def canonical_order(groups: List[Group]) -> List[Group]:
+    """
+    canonical_order
+        Keeps the (start time, larger first) order of `preprocess_data` but places identical groups
+        next to each other, so every run of identical groups is covered by the ordering rule.
+
+    Parameters:
+        groups (List[Group]) - Groups to reorder
+
+    Return Value:
+        List[Group] - A new, reordered list
+    """
+    return sorted(groups, key=lambda g: (g.start, -g.size, group_key(g)))
@@ -13,6 +13,8 @@ Key Functions:
     - parse_bool
     - parse_int
     - parse_time
+    - check_duplicates
+    - InputValidationError (collects every problem found in one pass)
 
 Dependencies:
     - datetime (for parsing timestamps)
@@ -22,6 +24,24 @@ Known/Suspected Errors:
 """
 
 from datetime import datetime
+from typing import List
+
+class InputValidationError(ValueError):
+    """
+    InputValidationError
+        Raised once input validation has finished, carrying every error found rather than only the
+        first. It is a ValueError, so existing handlers keep working.
+
+    Attributes:
+        errors (List[str]) - One message per invalid row or duplicate set, in input order
+    """
+    def __init__(self, errors: List[str]):
+        self.errors = list(errors)
+        if len(self.errors) == 1:
+            message = self.errors[0]
+        else:
+            message = f"{len(self.errors)} validation errors:\n  " + "\n  ".join(self.errors)
+        super().__init__(message)
 
 def parse_bool(val: str, field: str) -> bool:
     """
@@ -0,0 +1,148 @@
+"""
+Module Name: windowed.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Memory-bounded solving for very long schedules (e.g. multi-year replays): groups are
+streamed in start order, solved in time windows, and written out as soon as no later group can
+be affected by them.
+
+Module Summary:
+A booking can only constrain groups that start before its last end plus the time gap. Groups are
+read in start order and collected into a window until the next group starts after every collected
+booking's reach. At that cut nothing overlaps, so the window is solved on its own (with full
+backtracking), every booking is written out, and the rooms are emptied again. Peak memory is set
+by the longest stretch of overlapping bookings, not by the length of the schedule.
+
+A schedule without such cuts (bookings chained around the clock) would make one huge window, so a
+window is also closed after `max_window` groups. The window is solved, the bookings that still
+reach the next group's start stay in their rooms as the live frontier, and the rest are written
+out. Later windows treat the frontier as fixed, so after such a split a failure no longer proves
+that the whole input is infeasible; `WindowedResult.exact` reports whether that happened.
+
+Key Functions:
+- solve_windowed: Solves a stream of groups and hands every finalized booking to a callback
+
+Dependencies:
+- solver.py, symmetry.py (and ordering.py with a strategy) for solving each window
+
+Known/Suspected Errors:
+- Duplicate group IDs are only detected within the groups held in memory at the same time.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, List, Optional
+from .group import Group
+from .room import Room
+from .solver import assign_groups_iterative, build_candidates, passes_matching_bound
+from .symmetry import build_symmetry, canonical_order
+
+@dataclass
+class WindowedResult:
+    feasible: bool = True
+    exact: bool = True              # False once a window was closed at `max_window` instead of at a cut
+    groups: int = 0
+    windows: int = 0
+    peak_live: int = 0              # most groups held in memory at once (window plus frontier)
+    failed_at: Optional[datetime] = None
+
+def solve_windowed(groups: Iterable[Group], rooms: List[Room], time_gap: int,
+                   emit: Callable[[Group, Room], None], max_window: int = 5000,
+                   strategy: Optional[str] = None) -> WindowedResult:
+    """
+    solve_windowed
+        Assigns a stream of groups window by window (see the module summary).
+
+    Parameters:
+        groups (Iterable[Group]) - Groups sorted by start time; may be a lazy iterator
+        rooms (List[Room]) - Available rooms (their schedules only ever hold the live bookings)
+        time_gap (int) - Minimum time gap (in minutes) required between group schedules
+        emit (Callable[[Group, Room], None]) - Receives every booking once it is final
+        max_window (int) - Groups after which a window is closed even without a cut
+        strategy (str, optional) - Room ordering strategy (see ordering.py)
+
+    Return Value:
+        WindowedResult - Whether every group was placed, whether that verdict is exact, and the
+                         window statistics. On failure, the bookings emitted so far are valid but
+                         incomplete.
+
+    Exceptions:
+        ValueError - If the groups are not sorted by start time, an ID repeats within the live
+                     groups, or the strategy is unknown
+    """
+    buffer = timedelta(minutes=time_gap)
+    result = WindowedResult()
+    window: List[Group] = []
+    live_ids = set()
+    reach = None  # latest end plus gap among the window and the frontier
+    previous = None
+
+    for group in groups:
+        if previous is not None and group.start < previous.start:
+            raise ValueError(f"Group {group.id} starts before group {previous.id}; input must be sorted by start")
+        previous = group
+        if window and (group.start >= reach or len(window) >= max_window):
+            result.exact = result.exact and group.start >= reach
+            if not _solve_window(window, rooms, time_gap, strategy, result):
+                return result
+            live_ids = _finalize(rooms, group.start, buffer, emit)
+            reach = max((g.last_end + buffer for room in rooms for _, _, g in room.schedule), default=None)
+            window = []
+
+        if group.id in live_ids:
+            raise ValueError(f"Duplicate Group ID found: {group.id}")
+        live_ids.add(group.id)
+        window.append(group)
+        reach = group.last_end + buffer if reach is None else max(reach, group.last_end + buffer)
+        result.groups += 1
+        result.peak_live = max(result.peak_live, len(live_ids))
+
+    if window and not _solve_window(window, rooms, time_gap, strategy, result):
+        return result
+    _finalize(rooms, None, buffer, emit)
+    return result
+
+def _solve_window(window: List[Group], rooms: List[Room], time_gap: int, strategy: Optional[str],
+                  result: WindowedResult) -> bool:
+    """
+    _solve_window
+        Places the window's groups around the frontier bookings already in the rooms.
+    """
+    result.windows += 1
+    order = canonical_order(window)
+    if strategy:
+        from .ordering import order_candidates
+        candidates = order_candidates(order, rooms, time_gap, strategy)
+    else:
+        candidates = build_candidates(order, rooms)
+
+    solved = passes_matching_bound(order, candidates, time_gap) and \
+        assign_groups_iterative(order, rooms, time_gap, candidates=candidates,
+                                symmetry=build_symmetry(order, rooms)) is not None
+    if not solved:
+        result.feasible = False
+        result.failed_at = order[0].start
+    return solved
+
+def _finalize(rooms: List[Room], next_start: Optional[datetime], buffer: timedelta,
+              emit: Callable[[Group, Room], None]) -> set:
+    """
+    _finalize
+        Emits and drops every booking that cannot reach `next_start` (all of them when it is None),
+        keeping the rest as the frontier.
+
+    Return Value:
+        set - IDs of the groups kept in the frontier
+    """
+    kept = set()
+    for room in rooms:
+        frontier = []
+        for start, end, group in room.schedule:
+            if next_start is not None and group.last_end + buffer > next_start:
+                frontier.append((start, end, group))
+                kept.add(group.id)
+            else:
+                emit(group, room)
+        room.clear_schedule()
+        for start, end, group in frontier:
+            room.add_booking(start, end, group)
+    return kept
@@ -0,0 +1,98 @@
+"""
+Module Name: test_checkpoint.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for the iterative solver and for checkpointing and resuming its search state.
+"""
+
+import os
+import signal
+import pytest
+from dataclasses import replace
+from datetime import timedelta
+from src.checkpoint import Checkpointer, SearchInterrupted, load_checkpoint, search_fingerprint
+from src.solver import assign_groups, assign_groups_iterative
+from src.symmetry import build_symmetry
+from test_helper import placement, sample_group, sample_room
+
+def backtracking_instance():
+    # The small early groups take the large rooms first, so the large later groups force backtracking
+    rooms = [sample_room(room_id=f"R{i}", capacity=capacity) for i, capacity in enumerate((30, 20, 10, 10))]
+    groups = [sample_group("10:00", "11:00", size=5 + i, group_id=f"S{i}") for i in range(2)] + \
+             [sample_group("10:30", "11:30", size=15 + 5 * i, group_id=f"L{i}") for i in range(2)]
+    return groups, rooms
+
+def test_iterative_solver_matches_recursive():
+    groups, rooms = backtracking_instance()
+    expected = placement(assign_groups(groups, rooms, 10))
+    groups, rooms = backtracking_instance()
+    assert placement(assign_groups_iterative(groups, rooms, 10)) == expected
+
+def test_iterative_solver_reports_infeasible():
+    groups = [sample_group("10:00", "11:00", group_id=f"G{i}") for i in range(3)]
+    rooms = [sample_room(room_id=f"R{i}") for i in range(2)]
+    assert assign_groups_iterative(groups, rooms, 10, symmetry=build_symmetry(groups, rooms)) is None
+
+def test_resuming_any_saved_state_gives_the_same_result():
+    groups, rooms = backtracking_instance()
+    states = []
+    expected = placement(assign_groups_iterative(
+        groups, rooms, 10, symmetry=build_symmetry(groups, rooms),
+        on_step=lambda stack, next_option: states.append((list(stack), next_option))))
+
+    assert len(states) > len(groups)  # the instance really backtracks
+    for state in states:
+        groups, rooms = backtracking_instance()
+        result = assign_groups_iterative(groups, rooms, 10, symmetry=build_symmetry(groups, rooms), resume=state)
+        assert placement(result) == expected
+
+def test_checkpoint_round_trip_and_fingerprint_check(tmp_path):
+    groups, rooms = backtracking_instance()
+    path = str(tmp_path / "search.bin")
+    fingerprint = search_fingerprint(groups, rooms, 10, None, symmetry=True)
+    Checkpointer(path, fingerprint).save([1, 0, 2], 3)
+
+    assert load_checkpoint(path, fingerprint) == ([1, 0, 2], 3)
+    with pytest.raises(ValueError, match="different input"):
+        load_checkpoint(path, search_fingerprint(groups, rooms, 15, None, symmetry=True))
+
+def test_sigterm_writes_a_final_checkpoint(tmp_path):
+    groups, rooms = backtracking_instance()
+    path = str(tmp_path / "search.bin")
+    fingerprint = search_fingerprint(groups, rooms, 10, None, symmetry=False)
+    checkpointer = Checkpointer(path, fingerprint, every_seconds=3600)
+    checkpointer.install_signal_handler()
+    try:
+        os.kill(os.getpid(), signal.SIGTERM)
+        with pytest.raises(SearchInterrupted):
+            assign_groups_iterative(groups, rooms, 10, on_step=checkpointer)
+    finally:
+        checkpointer.remove_signal_handler()
+
+    groups, rooms = backtracking_instance()
+    resumed = assign_groups_iterative(groups, rooms, 10, resume=load_checkpoint(path, fingerprint))
+    assert len(placement(resumed)) == len(groups)
+
+@pytest.mark.parametrize("edit", [lambda g: replace(g, _size=40), lambda g: replace(g, _end=g.end + timedelta(minutes=30))])
+def test_checkpoint_of_edited_groups_is_refused(tmp_path, edit):
+    groups, rooms = backtracking_instance()
+    path = str(tmp_path / "search.bin")
+    Checkpointer(path, search_fingerprint(groups, rooms, 10, None, symmetry=False)).save([0], 0)
+
+    edited = [edit(groups[0])] + groups[1:]
+    with pytest.raises(ValueError, match="different input"):
+        load_checkpoint(path, search_fingerprint(edited, rooms, 10, None, symmetry=False))
+
+def test_checkpoint_of_edited_rooms_is_refused(tmp_path):
+    groups, rooms = backtracking_instance()
+    path = str(tmp_path / "search.bin")
+    Checkpointer(path, search_fingerprint(groups, rooms, 10, None, symmetry=False)).save([0], 0)
+
+    edited = [replace(rooms[0], _projector=False)] + rooms[1:]
+    with pytest.raises(ValueError, match="different input"):
+        load_checkpoint(path, search_fingerprint(groups, edited, 10, None, symmetry=False))
+
+def test_resuming_an_invalid_placement_is_refused():
+    groups = [sample_group("10:00", "11:00", size=40, group_id=f"G{i}") for i in range(2)]
+    rooms = [sample_room(room_id="R1", capacity=10), sample_room(room_id="R2", capacity=50)]
+    with pytest.raises(ValueError, match="cannot use"):
+        assign_groups_iterative(groups, rooms, 10, resume=([0], 0))
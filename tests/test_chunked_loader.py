@@ -0,0 +1,39 @@
+"""
+Module Name: test_chunked_loader.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Checks that chunked, process-parallel parsing gives exactly the same objects and
+error messages as the serial path.
+"""
+
+from src.chunked_loader import load_rows_chunked, split_byte_ranges
+from src.input_reader import read_csv, parse_rows, parse_group
+
+HEADER = "GroupID,Size,WheelchairAccess,Projector,Computer,FloorPreference,Start,End\n"
+
+def write_groups(path, count, bad_every=0):
+    lines = [HEADER]
+    for i in range(count):
+        size = "oops" if bad_every and i % bad_every == 0 else str(10 + i % 30)
+        hour = 8 + i % 10
+        lines.append(f"G{i:05d},{size},FALSE,TRUE,FALSE,-1,2025-02-07 {hour:02d}:00,2025-02-07 {hour:02d}:50\n")
+    path.write_text("".join(lines), encoding="utf-8")
+    return str(path)
+
+def test_byte_ranges_cover_body_on_line_boundaries(tmp_path):
+    filename = write_groups(tmp_path / "groups.csv", 200)
+    fieldnames, ranges = split_byte_ranges(filename, 500)
+    data = open(filename, "rb").read()
+
+    assert fieldnames == HEADER.strip().split(",")
+    assert ranges[0][0] == len(HEADER) and ranges[-1][1] == len(data)
+    assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+    assert all(data[start - 1:start] == b"\n" for start, _ in ranges)
+
+def test_chunked_parse_matches_serial(tmp_path):
+    filename = write_groups(tmp_path / "groups.csv", 500, bad_every=97)
+    serial = parse_rows(read_csv(filename), parse_group)
+    chunked = load_rows_chunked(filename, parse_group, workers=2, chunk_bytes=1000)
+
+    assert chunked == serial
+    assert len(chunked[1]) == 6
+    assert "(line 99)" in chunked[1][1]
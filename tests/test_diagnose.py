@@ -0,0 +1,57 @@
+"""
+Module Name: test_diagnose.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for the extraction of minimal infeasible group sets.
+"""
+
+from src.diagnose import find_infeasible_core
+from src.solver import assign_groups
+from test_helper import sample_group, sample_room
+
+def core_ids(core):
+    return sorted(group.id for group in core.groups)
+
+def assert_minimal(core, rooms):
+    assert assign_groups(core.groups, rooms, 10) is None
+    for removed in core.groups:
+        rest = [group for group in core.groups if group is not removed]
+        assert assign_groups(rest, [sample_room(r.id, r.capacity, r.wheelchair_access, r.projector, r.computer,
+                                                r.floor_level) for r in rooms], 10) is not None
+
+def test_feasible_input_has_no_core():
+    rooms = [sample_room("R1"), sample_room("R2")]
+    groups = [sample_group("10:00", "11:00", group_id="G1"), sample_group("10:00", "11:00", group_id="G2")]
+    assert find_infeasible_core(groups, rooms, 10) is None
+
+def test_core_isolates_overbooked_window_from_unrelated_groups():
+    rooms = [sample_room("R1"), sample_room("R2", capacity=30)]
+    noise = [sample_group(f"{h:02d}:00", f"{h:02d}:30", group_id=f"N{h}") for h in range(12, 18)]
+    crowd = [sample_group("09:00", "10:00", group_id=f"C{i}") for i in range(3)]
+    core = find_infeasible_core(noise + crowd, rooms, 10)
+
+    assert core_ids(core) == ["C0", "C1", "C2"]
+    assert [room.id for room in core.rooms] == ["R1", "R2"]
+    assert (core.start.hour, core.end.hour) == (9, 10)
+    assert "only 2 such rooms" in core.reason
+    assert_minimal(core, rooms)
+
+def test_core_found_when_matching_bound_passes():
+    # No instant has more groups than rooms, but B cannot avoid both A's and C's only room
+    rooms = [sample_room("R1", projector=False), sample_room("R2", computer=False)]
+    groups = [sample_group("09:00", "10:00", computer=True, group_id="A"),
+              sample_group("09:30", "10:30", group_id="B"),
+              sample_group("10:15", "11:00", projector=True, group_id="C"),
+              sample_group("13:00", "14:00", group_id="D")]
+    core = find_infeasible_core(groups, rooms, 10)
+
+    assert core_ids(core) == ["A", "B", "C"]
+    assert "cannot share" in core.reason
+    assert_minimal(core, rooms)
+
+def test_group_without_any_compatible_room():
+    rooms = [sample_room("R1", capacity=10)]
+    groups = [sample_group("09:00", "10:00", group_id="G1"), sample_group("11:00", "12:00", size=50, group_id="BIG")]
+    core = find_infeasible_core(groups, rooms, 10)
+    assert core_ids(core) == ["BIG"]
+    assert core.rooms == []
+    assert core.reason.startswith("no room offers capacity 50+")
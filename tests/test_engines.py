@@ -0,0 +1,269 @@
+"""
+Module Name: test_engines.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Differential tests across every solver engine. Random instances are solved by each
+engine; every returned assignment is re-checked against constraints.py, every feasibility verdict
+must match the reference `assign_groups`, and the time spent per engine is recorded.
+
+Instances come in two tiers: small ones (about half of them infeasible) and medium ones built around
+a planted assignment, so they are always feasible. Both repeat room and group types so symmetry
+breaking has work to do, and both have cohorts and sites. Travel rules between sites are only
+applied by `solve_sharded` and `solve_jointly`, so those two are also compared with each other on
+the small tier with random rules; without rules they must agree with `assign_groups` like every
+other engine. The exhaustive plain searches only run on the small tier.
+
+Add new engines to ENGINES. Set ENGINE_INSTANCES=<n> to run more small instances (a third as many
+medium ones), and ENGINE_TIMINGS=<file.json> to save the timings of a run, e.g. to compare them
+against a previous run; they are also printed with `pytest -s`.
+"""
+
+import json
+import os
+import random
+import time
+import pytest
+from dataclasses import replace
+from datetime import timedelta
+from src.diagnose import find_infeasible_core
+from src.ordering import STRATEGIES, order_candidates
+from src.recurrence import Recurrence
+from src.scoring import optimize_assignment
+from src.sites import TransitionRules, cohort_links, solve_jointly, solve_sharded
+from src.solver import assign_groups, assign_groups_iterative, build_candidates, passes_matching_bound
+from src.symmetry import build_symmetry, canonical_order
+from src.windowed import solve_windowed
+from test_helper import assert_valid_assignment, placement, sample_group, sample_room
+
+SMALL_INSTANCES = int(os.environ.get("ENGINE_INSTANCES", "60"))
+MEDIUM_INSTANCES = max(1, SMALL_INSTANCES // 3)
+TIME_GAP = 10
+ENGINE_BUDGET_SECONDS = 20.0  # per engine and 60 small instances; catches search blow-ups, not small slowdowns
+SITES = ["North", "South", "East"]
+
+def symmetric(groups, rooms, gap):
+    order = canonical_order(groups)
+    return placement(assign_groups_iterative(order, rooms, gap, candidates=build_candidates(order, rooms),
+                                             symmetry=build_symmetry(order, rooms)))
+
+def ordered(strategy):
+    def engine(groups, rooms, gap):
+        order = canonical_order(groups)
+        return placement(assign_groups_iterative(order, rooms, gap,
+                                                 candidates=order_candidates(order, rooms, gap, strategy),
+                                                 symmetry=build_symmetry(order, rooms)))
+    return engine
+
+def optimized(groups, rooms, gap):
+    result = optimize_assignment(groups, rooms, gap)
+    return None if result is None else placement(result.rooms)
+
+def windowed(groups, rooms, gap):
+    placed = {}
+    result = solve_windowed(sorted(groups, key=lambda g: g.start), rooms, gap,
+                            lambda group, room: placed.__setitem__(group.id, room.id))
+    assert result.exact
+    return placed if result.feasible else None
+
+# name -> (engine(groups, rooms, time_gap) -> {group ID: room ID} or None, floor preference is soft,
+#          exhaustive: plain search without symmetry breaking or matching bound, only run on small instances)
+ENGINES = {
+    "reference": (lambda groups, rooms, gap: placement(assign_groups(groups, rooms, gap)), False, True),
+    "candidates": (lambda groups, rooms, gap: placement(
+        assign_groups(groups, rooms, gap, candidates=build_candidates(groups, rooms))), False, True),
+    "iterative": (lambda groups, rooms, gap: placement(assign_groups_iterative(groups, rooms, gap)), False, True),
+    "symmetry": (symmetric, False, False),
+    **{f"order:{name}": (ordered(name), False, False) for name in STRATEGIES},
+    "sharded": (lambda groups, rooms, gap: placement(solve_sharded(groups, rooms, gap, workers=1)), False, False),
+    "windowed": (windowed, False, False),
+    "optimizer": (optimized, True, False),
+}
+
+# name -> engine(groups, rooms, time_gap, rules); the engines that apply travel rules between sites
+RULE_ENGINES = {
+    "joint+rules": lambda groups, rooms, gap, rules: placement(
+        solve_jointly(groups, rooms, gap, rules, None, cohort_links(groups))),
+    "sharded+rules": lambda groups, rooms, gap, rules: placement(
+        solve_sharded(groups, rooms, gap, rules, workers=1, max_attempts=2)),
+}
+
+TIMINGS = {name: [] for name in list(ENGINES) + list(RULE_ENGINES)}
+
+def clock(minutes):
+    return f"{minutes // 60:02d}:{minutes % 60:02d}"
+
+def room_types(rng, count, sites):
+    # Each type is repeated, so most rooms have an interchangeable twin
+    rooms = []
+    for t in range(count):
+        template = replace(sample_room(capacity=rng.randint(10, 30), wheelchair=rng.random() < 0.8,
+                                       projector=rng.random() < 0.8, computer=rng.random() < 0.7,
+                                       floor=rng.randint(1, 3)), _site=rng.choice(sites))
+        rooms += [replace(template, _room_id=f"R{t}-{copy}") for copy in range(rng.randint(1, 3))]
+    return rooms
+
+def random_rules(rng, sites):
+    return TransitionRules({(a, b): rng.choice([15, 30, 60, 120]) for a in sites for b in sites
+                            if a < b and rng.random() < 0.7})
+
+def small_instance(rng):
+    """
+    small_instance
+        Up to about a dozen groups and nine rooms with mixed equipment, floors, sites, cohorts, recurrence
+        and overlapping times, tight enough that a good share of them are infeasible.
+    """
+    sites = [""] if rng.random() < 0.4 else SITES[:rng.randint(2, 3)]
+    rooms = room_types(rng, rng.randint(2, 3), sites)
+
+    groups = []
+    for t in range(rng.randint(2, 6)):
+        start = rng.randint(8 * 4, 15 * 4) * 15  # minutes after midnight, on the quarter hour
+        template = sample_group(clock(start), clock(start + rng.choice([30, 45, 60, 90])),
+                                size=rng.randint(1, 20), wheelchair=rng.random() < 0.1, projector=rng.random() < 0.2,
+                                computer=rng.random() < 0.1, floor=rng.choice([-1, -1, -1, -1, 1, 2]))
+        if rng.random() < 0.15:
+            template = replace(template, _recurrence=Recurrence(timedelta(days=rng.choice([1, 7])), rng.randint(2, 4)))
+        if len(sites) > 1 and rng.random() < 0.3:
+            template = replace(template, _site=rng.choice(sites))
+        template = replace(template, _cohort=rng.choice(["", "C1", "C2"]))
+        groups += [replace(template, _group_id=f"G{t}-{copy}") for copy in range(rng.choice([1, 1, 2, 3]))]
+    return groups, rooms, random_rules(rng, sites)
+
+def medium_instance(rng):
+    """
+    medium_instance
+        Roughly 10 to 40 groups over one or two mornings, planted into the rooms first and then given
+        requirements the planted room meets, so a solution always exists. Twin rooms often get
+        identical groups.
+    """
+    sites = [""] if rng.random() < 0.4 else SITES[:rng.randint(2, 3)]
+    rooms = room_types(rng, rng.randint(2, 4), sites)
+    twins = {}
+    for room in rooms:
+        twins.setdefault(room.id.split("-")[0], []).append(room)
+
+    groups = []
+    for kind, copies in twins.items():
+        room = copies[0]
+        for day in range(rng.randint(1, 2)):
+            minute = 8 * 60 + rng.choice([0, 15, 30])
+            while minute < 11 * 60:
+                end = minute + rng.choice([45, 60, 90])
+                template = sample_group(clock(minute), clock(end), size=rng.randint(1, room.capacity),
+                                        wheelchair=room.wheelchair_access and rng.random() < 0.3,
+                                        projector=room.projector and rng.random() < 0.4,
+                                        computer=room.computer and rng.random() < 0.3,
+                                        floor=rng.choice([-1, -1, -1, room.floor_level]))
+                template = replace(template, _start=template.start + timedelta(days=day),
+                                   _end=template.end + timedelta(days=day),
+                                   _site=room.site if rng.random() < 0.2 else "",
+                                   _cohort=rng.choice(["", "", "C1", "C2", "C3", "C4"]))
+                identical = rng.random() < 0.5
+                for copy in copies:
+                    if not identical:
+                        template = replace(template, _size=rng.randint(1, copy.capacity))
+                    groups.append(replace(template, _group_id=f"G{kind}-{day}-{minute}-{copy.id}"))
+                minute = end + TIME_GAP + rng.choice([0, 0, 15, 30])
+    return groups, rooms, random_rules(rng, sites)
+
+def random_instance(seed, medium=False):
+    rng = random.Random(seed)
+    groups, rooms, rules = (medium_instance if medium else small_instance)(rng)
+    return sorted(groups, key=lambda g: (g.start, -g.size)), sorted(rooms, key=lambda r: r.capacity), rules
+
+def fresh(rooms):
+    return [replace(room, _schedule=[]) for room in rooms]
+
+def bounded_verdict(groups, rooms):
+    # A feasibility verdict without the exhaustive plain search, for the extra checks beside the engines
+    order = canonical_order(groups)
+    return passes_matching_bound(order, build_candidates(order, rooms), TIME_GAP) and \
+        symmetric(order, fresh(rooms), TIME_GAP) is not None
+
+def run(name, engine, *args):
+    started = time.perf_counter()
+    result = engine(*args)
+    TIMINGS[name].append(time.perf_counter() - started)
+    return result
+
+def check_engines(groups, rooms, planted=False):
+    """
+    check_engines
+        Runs every engine on one instance and compares it with the reference verdict. For planted
+        instances the verdict is known to be feasible, and the exhaustive engines are skipped since
+        they can take exponential time on them.
+    """
+    if planted:
+        feasible = True
+    else:
+        expected = run("reference", ENGINES["reference"][0], list(groups), fresh(rooms), TIME_GAP)
+        feasible = expected is not None
+        if feasible:
+            assert_valid_assignment(groups, rooms, expected, TIME_GAP)
+
+    # The optimizer only has the floor as a preference, so compare it with a floor-free reference
+    relaxed_feasible = bounded_verdict([replace(group, _floor_preference=-1) for group in groups], rooms)
+
+    for name, (engine, soft_floor, exhaustive) in ENGINES.items():
+        if name == "reference" or (planted and exhaustive):
+            continue
+        result = run(name, engine, list(groups), fresh(rooms), TIME_GAP)
+        assert (result is not None) == (relaxed_feasible if soft_floor else feasible), name
+        if result is not None:
+            assert_valid_assignment(groups, rooms, result, TIME_GAP, soft_floor)
+
+    assert (find_infeasible_core(list(groups), fresh(rooms), TIME_GAP) is None) == feasible
+
+@pytest.fixture(scope="module", autouse=True)
+def report_timings():
+    yield
+    totals = {name: sum(samples) for name, samples in TIMINGS.items() if samples}
+    print(f"\nEngine timings over {SMALL_INSTANCES} small and {MEDIUM_INSTANCES} medium instances:")
+    for name, total in sorted(totals.items(), key=lambda item: item[1]):
+        print(f"  {name:<26} {total * 1000:9.2f} ms")
+    if os.environ.get("ENGINE_TIMINGS"):
+        with open(os.environ["ENGINE_TIMINGS"], "w") as file:
+            json.dump(totals, file, indent=2)
+
+@pytest.mark.parametrize("seed", range(SMALL_INSTANCES))
+def test_engines_agree_on_small_instances(seed):
+    groups, rooms, _ = random_instance(seed)
+    check_engines(groups, rooms)
+
+@pytest.mark.parametrize("seed", range(MEDIUM_INSTANCES))
+def test_engines_solve_medium_instances(seed):
+    groups, rooms, _ = random_instance(seed, medium=True)
+    check_engines(groups, rooms, planted=True)
+
+@pytest.mark.parametrize("seed", range(SMALL_INSTANCES))
+def test_travel_rule_engines_agree(seed):
+    groups, rooms, rules = random_instance(seed)
+    verdicts = set()
+    for name, engine in RULE_ENGINES.items():
+        result = run(name, engine, list(groups), fresh(rooms), TIME_GAP, rules)
+        verdicts.add(result is not None)
+        if result is not None:
+            assert_valid_assignment(groups, rooms, result, TIME_GAP, rules=rules)
+    assert len(verdicts) == 1
+
+    core = find_infeasible_core(list(groups), fresh(rooms), TIME_GAP, rules)
+    assert (core is None) == verdicts.pop()
+
+def test_instances_cover_both_verdicts_and_symmetry():
+    instances = [random_instance(seed) for seed in range(SMALL_INSTANCES)]
+    verdicts = {bounded_verdict(groups, rooms) for groups, rooms, _ in instances}
+    assert verdicts == {True, False}
+
+    instances += [random_instance(seed, medium=True) for seed in range(MEDIUM_INSTANCES)]
+    symmetries = [build_symmetry(canonical_order(groups), rooms) for groups, rooms, _ in instances]
+    assert any(symmetry.room_class for symmetry in symmetries)
+    assert any(any(symmetry.same_as_previous) for symmetry in symmetries)
+    assert any(group.cohort for groups, _, _ in instances for group in groups)
+    assert any(rules.gaps for _, _, rules in instances)
+
+def test_engines_stay_within_time_budget():
+    # Runs after the differential tests in file order; skipped when run on its own
+    if not TIMINGS["reference"]:
+        pytest.skip("no timings recorded")
+    budget = ENGINE_BUDGET_SECONDS * max(1.0, SMALL_INSTANCES / 60)
+    for name, samples in TIMINGS.items():
+        assert sum(samples) < budget, f"{name} took {sum(samples):.1f} s"
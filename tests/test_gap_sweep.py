@@ -0,0 +1,75 @@
+"""
+Module Name: test_gap_sweep.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for the time-gap sweep, the matching bound and candidate precomputation.
+"""
+
+import pytest
+from dataclasses import replace
+from datetime import timedelta
+from src.gap_sweep import sweep_time_gap, achieved_gap
+from src.solver import assign_groups, build_candidates, passes_matching_bound
+from test_helper import sample_group, sample_room
+
+def test_build_candidates_filters_static_constraints():
+    groups = [sample_group("10:00", "11:00", size=20, group_id="G1")]
+    rooms = [sample_room(room_id="R1", capacity=10), sample_room(room_id="R2", capacity=30)]
+    candidates = build_candidates(groups, rooms)
+    assert [r.id for r in candidates["G1"]] == ["R2"]
+
+def test_assign_groups_with_candidates_matches_plain_call():
+    groups = [sample_group("10:00", "11:00", group_id="G1"), sample_group("10:30", "11:30", group_id="G2")]
+    rooms = [sample_room(room_id="R1"), sample_room(room_id="R2")]
+    result = assign_groups(groups, rooms, 10, candidates=build_candidates(groups, rooms))
+    assert {g.id: r.id for r in result for _, _, g in r.schedule} == {"G1": "R1", "G2": "R2"}
+
+def test_matching_bound_rejects_too_many_concurrent_groups():
+    groups = [sample_group("10:00", "11:00", group_id="G1"), sample_group("11:05", "12:00", group_id="G2")]
+    rooms = [sample_room(room_id="R1")]
+    candidates = build_candidates(groups, rooms)
+    assert passes_matching_bound(groups, candidates, time_gap=5)
+    assert not passes_matching_bound(groups, candidates, time_gap=6)
+
+def test_sweep_finds_maximum_gap():
+    groups = [
+        sample_group("09:00", "10:00", group_id="G1"),
+        sample_group("10:20", "11:00", group_id="G2"),
+        sample_group("11:45", "12:00", group_id="G3"),
+    ]
+    rooms = [sample_room(room_id="R1")]
+    sweep = sweep_time_gap(groups, rooms)
+    assert sweep.best_gap == 20
+    assert achieved_gap(sweep.assignment) == 20
+    assert all(probe.seconds >= 0 for probe in sweep.probes)
+
+def test_sweep_reports_unbounded_gap_as_schedule_length():
+    groups = [sample_group("09:00", "10:00", group_id="G1"), sample_group("10:20", "11:00", group_id="G2")]
+    rooms = [sample_room(room_id="R1"), sample_room(room_id="R2")]
+    assert sweep_time_gap(groups, rooms).best_gap == 120
+
+def test_sweep_infeasible_input():
+    groups = [sample_group("10:00", "11:00", size=50, group_id="G1")]
+    rooms = [sample_room(room_id="R1", capacity=10)]
+    sweep = sweep_time_gap(groups, rooms)
+    assert sweep.best_gap is None and sweep.assignment is None
+
+@pytest.mark.parametrize("flag", [["--order", "rarity"], ["--transitions", "rules.csv"], ["--checkpoint", "search.ckpt"],
+                                  ["--resume", "search.ckpt"], ["--optimize"]])
+def test_cli_rejects_flags_the_sweep_ignores(flag, capsys):
+    from src.room_assign_tool import main
+
+    with pytest.raises(SystemExit):
+        main(["solve", "tests/test_rooms.csv", "tests/test_groups.csv", "--gap-sweep", *flag])
+    assert "--gap-sweep cannot be combined" in capsys.readouterr().out
+
+def test_sweep_handles_more_groups_than_the_recursion_limit():
+    # 1,500 back-to-back groups in two rooms; a recursive search would need one frame per group
+    groups = []
+    for i in range(1500):
+        group = sample_group("08:00", "08:30", group_id=f"G{i:04d}")
+        shift = timedelta(minutes=40 * (i // 2))
+        groups.append(replace(group, _start=group.start + shift, _end=group.end + shift))
+    rooms = [sample_room(room_id="R1"), sample_room(room_id="R2")]
+    sweep = sweep_time_gap(groups, rooms)
+    assert sweep.best_gap == 10
+    assert len({g.id for room in sweep.assignment for _, _, g in room.schedule}) == 1500
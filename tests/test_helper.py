@@ -1,6 +1,9 @@
 from src.room import Room
 from src.group import Group
+from dataclasses import replace
 from datetime import datetime
+from src.constraints import (check_equipment, check_floor_preference, check_room_capacity, check_site,
+                             check_time_overlap, check_wheelchair_access)
 
 def sample_group(start: str, end: str, size=5, wheelchair=False, projector=False, computer=False, floor=-1, group_id="G1"):
     # for simplification
@@ -26,4 +29,35 @@ def sample_room(room_id="R1", capacity=10, wheelchair=True, projector=True, comp
         _projector=projector,
         _computer=computer,
         _floor_level=floor
-    )
\ No newline at end of file
+    )
+
+def placement(rooms):
+    # group ID -> room ID of a solver result (None when there is no assignment)
+    return None if rooms is None else {group.id: room.id for room in rooms for _, _, group in room.schedule}
+
+def assert_valid_assignment(groups, rooms, assignment, time_gap, soft_floor=False, rules=None):
+    # Re-checks a {group ID: room ID} assignment from scratch: every group placed exactly once, every
+    # check in constraints.py against the other groups of its room, and the cohort travel rules if given
+    assert len({group.id for group in groups}) == len(groups), "a group was placed twice"
+    assert sorted(assignment) == sorted(group.id for group in groups)
+    room_of = {room.id: room for room in rooms}
+    by_room = {}
+    for group in groups:
+        by_room.setdefault(assignment[group.id], []).append(group)
+
+    for group in groups:
+        room = room_of[assignment[group.id]]
+        assert check_site(group, room) and check_room_capacity(group, room)
+        assert check_wheelchair_access(group, room) and check_equipment(group, room)
+        assert soft_floor or check_floor_preference(group, room)
+        others = replace(room, _schedule=[(g.start, g.end, g) for g in by_room[room.id] if g is not group])
+        assert check_time_overlap(group, others, time_gap), f"{group.id} conflicts in {room.id}"
+
+    if rules is not None:
+        from src.sites import cohort_links
+        by_id = {group.id: group for group in groups}
+        for later, links in cohort_links(groups).items():
+            for earlier, first in links:
+                if first:
+                    assert rules.allows(by_id[earlier], room_of[assignment[earlier]].site,
+                                        by_id[later], room_of[assignment[later]].site), f"{earlier} -> {later}"
\ No newline at end of file
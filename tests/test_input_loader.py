@@ -6,9 +6,11 @@ File Purpose:
     Includes validation of successful parsing and graceful error handling of malformed input.
 """
 
+import asyncio
 import unittest
 from datetime import datetime
-from src.input_reader import read_csv, preprocess_data
+from src.input_reader import read_csv, preprocess_data, load_input_async
+from src.validators import InputValidationError
 from src.group import Group
 from src.room import Room
 
@@ -91,6 +93,27 @@ class TestInputLoader(unittest.TestCase):
             preprocess_data(raw_groups, raw_rooms)
         self.assertIn("Invalid datetime 'tomorrow morning'", str(cm.exception))
 
+    def test_all_errors_are_collected_with_line_numbers(self):
+        good = read_csv(self.groups_path)[0]
+        raw_groups = [
+            dict(good, Size="NaN"),
+            dict(good, GroupID="G_OK"),
+            dict(good, GroupID="G_BOOL", Projector="sometimes"),
+            dict(good, GroupID="G_OK"),
+        ]
+        raw_rooms = read_csv(self.rooms_path)
+        with self.assertRaises(InputValidationError) as cm:
+            preprocess_data(raw_groups, raw_rooms)
+        self.assertEqual(len(cm.exception.errors), 3)
+        self.assertIn("G0001 (line 2)", cm.exception.errors[0])
+        self.assertIn("G_BOOL (line 4)", cm.exception.errors[1])
+        self.assertIn("Duplicate Group IDs found: ['G_OK']", cm.exception.errors[2])
+
+    def test_async_loader_matches_serial_path(self):
+        serial = preprocess_data(read_csv(self.groups_path), read_csv(self.rooms_path))
+        concurrent = asyncio.run(load_input_async(self.rooms_path, self.groups_path))
+        self.assertEqual(serial, concurrent)
+
 
 if __name__ == "__main__":
     unittest.main()
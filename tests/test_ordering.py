@@ -0,0 +1,54 @@
+"""
+Module Name: test_ordering.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for the value-ordering strategies used to build solver candidate lists.
+"""
+
+import pytest
+from src.ordering import order_candidates, STRATEGIES
+from src.solver import assign_groups
+from test_helper import sample_group, sample_room
+
+def lab_and_plain_room():
+    return [
+        sample_room(room_id="LAB", capacity=10, wheelchair=True, projector=True, computer=True),
+        sample_room(room_id="PLAIN", capacity=20, wheelchair=False, projector=False, computer=False),
+    ]
+
+def test_rarity_keeps_special_rooms_for_groups_that_need_them():
+    groups = [
+        sample_group("10:00", "11:00", group_id="G1"),
+        sample_group("10:30", "11:30", group_id="G2", wheelchair=True, computer=True),
+    ]
+    candidates = order_candidates(groups, lab_and_plain_room(), 10, "rarity")
+    assert [r.id for r in candidates["G1"]] == ["PLAIN", "LAB"]
+    assert [r.id for r in candidates["G2"]] == ["LAB"]
+
+def test_least_constraining_avoids_rooms_wanted_by_conflicting_groups():
+    groups = [
+        sample_group("10:00", "11:00", group_id="G1"),
+        sample_group("10:30", "11:30", group_id="G2", projector=True),
+    ]
+    candidates = order_candidates(groups, lab_and_plain_room(), 10, "least-constraining")
+    assert [r.id for r in candidates["G1"]] == ["PLAIN", "LAB"]
+
+def test_tightest_fit_prefers_least_spare_capacity():
+    groups = [sample_group("10:00", "11:00", size=15, group_id="G1")]
+    rooms = [sample_room(room_id="BIG", capacity=40), sample_room(room_id="SNUG", capacity=16)]
+    assert [r.id for r in order_candidates(groups, rooms, 10, "tightest-fit")["G1"]] == ["SNUG", "BIG"]
+
+@pytest.mark.parametrize("strategy", list(STRATEGIES))
+def test_every_strategy_finds_a_solution(strategy):
+    groups = [
+        sample_group("10:00", "11:00", group_id="G1"),
+        sample_group("10:30", "11:30", group_id="G2", wheelchair=True, computer=True),
+        sample_group("11:45", "12:30", group_id="G3", size=15),
+    ]
+    rooms = lab_and_plain_room()
+    result = assign_groups(groups, rooms, 10, candidates=order_candidates(groups, rooms, 10, strategy))
+    assert result is not None
+    assert sum(len(r.schedule) for r in result) == 3
+
+def test_unknown_strategy_raises():
+    with pytest.raises(ValueError):
+        order_candidates([], [], 10, "random")
@@ -0,0 +1,42 @@
+"""
+Module Name: test_profiling.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for the optional phase profiler.
+"""
+
+import os
+from src.profiling import make_profiler, phase, PROFILE_ENV, _call_pairs
+from src.solver import assign_groups
+from test_helper import sample_group, sample_room
+
+def solve_small():
+    groups = [sample_group(f"{h:02d}:00", f"{h:02d}:30", group_id=f"G{h}") for h in range(8, 18)]
+    return assign_groups(groups, [sample_room(room_id="R1")], 10)
+
+def test_disabled_profiler_is_a_shared_no_op(monkeypatch):
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    profiler = make_profiler(None)
+    assert profiler is None
+    assert phase(profiler, "solve") is phase(profiler, "load")
+
+def test_environment_variable_enables_profiling(monkeypatch, tmp_path):
+    monkeypatch.setenv(PROFILE_ENV, str(tmp_path))
+    assert make_profiler(None).directory == str(tmp_path)
+
+def test_phase_writes_prof_and_collapsed_files(tmp_path):
+    profiler = make_profiler(str(tmp_path))
+    with phase(profiler, "solve"):
+        assert solve_small() is not None
+
+    names = sorted(os.listdir(tmp_path))
+    assert names == [f"solve-{os.getpid()}.collapsed", f"solve-{os.getpid()}.prof"]
+    for line in (tmp_path / names[0]).read_text().splitlines():
+        stack, count = line.rsplit(" ", 1)
+        assert stack and int(count) > 0
+
+def test_call_pair_fallback_uses_cprofile_edges():
+    import cProfile
+    profile = cProfile.Profile()
+    profile.runcall(solve_small)
+    pairs = _call_pairs(profile)
+    assert any(stack.endswith(";solver.py:assign_groups") for stack in pairs)
@@ -0,0 +1,87 @@
+"""
+Module Name: test_recurrence.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for recurrence parsing and pattern-based conflict checks, compared against
+brute-force expansion of the occurrences.
+"""
+
+import random
+from datetime import datetime, timedelta
+import pytest
+from src.constraints import check_time_overlap
+from src.group import Group
+from src.input_reader import parse_group
+from src.output_writer import write_output
+from src.recurrence import Recurrence, parse_recurrence, bookings_conflict
+from src.solver import assign_groups
+from test_helper import sample_room
+
+MONDAY = datetime(2025, 3, 3, 10, 0)
+
+def recurring_group(group_id, start, minutes, recurrence):
+    return Group(group_id, start, start + timedelta(minutes=minutes), 5, False, False, False, -1, recurrence)
+
+def brute_force_conflict(a: Group, b: Group, buffer: timedelta) -> bool:
+    return any(sa < eb + buffer and ea > sb - buffer
+               for sa, ea in a.occurrences() for sb, eb in b.occurrences())
+
+def test_parse_weekly_until_with_exdates():
+    rec = parse_recurrence("FREQ=WEEKLY;UNTIL=2025-04-14;EXDATE=2025-03-17,2025-03-24", "Recurrence", MONDAY)
+    assert rec == Recurrence(timedelta(days=7), 7, frozenset({2, 3}))
+    assert parse_recurrence("", "Recurrence", MONDAY) is None
+    assert parse_recurrence("freq=daily;interval=2;count=3", "Recurrence", MONDAY).period == timedelta(days=2)
+
+@pytest.mark.parametrize("rule, message", [
+    ("FREQ=MONTHLY;COUNT=3", "Invalid FREQ"),
+    ("FREQ=WEEKLY", "exactly one of UNTIL or COUNT"),
+    ("FREQ=WEEKLY;COUNT=0", "Invalid COUNT"),
+    ("FREQ=WEEKLY;COUNT=4;EXDATE=2025-03-05", "not an occurrence date"),
+    ("FREQ=WEEKLY;UNTIL=2025-01-01", "before the first occurrence"),
+    ("FREQ=WEEKLY;COUNT=1;EXDATE=2025-03-03", "skips every occurrence"),
+])
+def test_invalid_rules_raise(rule, message):
+    with pytest.raises(ValueError, match=message):
+        parse_recurrence(rule, "Recurrence", MONDAY)
+
+def test_pattern_conflicts_match_brute_force():
+    rng = random.Random(3649)
+    buffer = timedelta(minutes=10)
+    for _ in range(400):
+        groups = []
+        for group_id in ("A", "B"):
+            start = MONDAY + timedelta(days=rng.randrange(21), minutes=30 * rng.randrange(20))
+            recurrence = None
+            if rng.random() < 0.8:
+                count = rng.randrange(1, 12)
+                skipped = frozenset(k for k in range(count) if rng.random() < 0.3)
+                if len(skipped) == count:
+                    skipped = frozenset()
+                recurrence = Recurrence(timedelta(days=rng.choice((1, 2, 7, 14, 21))), count, skipped)
+            groups.append(recurring_group(group_id, start, rng.choice((50, 90, 180)), recurrence))
+        a, b = groups
+        expected = brute_force_conflict(a, b, buffer)
+        assert bookings_conflict(a.start, a.end, a.recurrence, b.start, b.end, b.recurrence, buffer) == expected
+        assert bookings_conflict(b.start, b.end, b.recurrence, a.start, a.end, a.recurrence, buffer) == expected
+
+def test_exception_date_frees_the_room():
+    weekly = recurring_group("W", MONDAY, 60, Recurrence(timedelta(days=7), 4, frozenset({2})))
+    one_off = recurring_group("X", MONDAY + timedelta(days=14), 60, None)
+    room = sample_room()
+    room.add_booking(weekly.start, weekly.end, weekly)
+    assert check_time_overlap(one_off, room, 10)
+    assert not check_time_overlap(recurring_group("Y", MONDAY + timedelta(days=21), 60, None), room, 10)
+
+def test_recurring_groups_share_a_room_and_expand_in_output(tmp_path):
+    row = {"GroupID": "C1", "Size": "5", "WheelchairAccess": "FALSE", "Projector": "FALSE", "Computer": "FALSE",
+           "FloorPreference": "-1", "Start": "2025-03-03 10:00", "End": "2025-03-03 11:00",
+           "Recurrence": "FREQ=WEEKLY;COUNT=3"}
+    weekly = parse_group(row, 0)
+    other = parse_group(dict(row, GroupID="C2", Start="2025-03-04 10:00", End="2025-03-04 11:00"), 1)
+    result = assign_groups([weekly, other], [sample_room(room_id="R1")], 10)
+    assert result is not None and len(result[0].schedule) == 2
+
+    output = tmp_path / "out.csv"
+    write_output(str(output), result)
+    lines = output.read_text().splitlines()
+    assert len(lines) == 1 + 6
+    assert "C1,R1,2025-03-17 10:00:00,2025-03-17 11:00:00" in lines
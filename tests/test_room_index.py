@@ -0,0 +1,56 @@
+"""
+Module Name: test_room_index.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for free-room and next-free-slot queries on the room index.
+"""
+
+from datetime import datetime
+from src.constraints import check_time_overlap
+from src.room_index import RoomIndex, RoomRequirements
+from test_helper import sample_group, sample_room
+
+def at(hhmm: str) -> datetime:
+    return sample_group(hhmm, "23:59").start
+
+def build_index():
+    rooms = [
+        sample_room(room_id="R1", capacity=10, projector=False, floor=1),
+        sample_room(room_id="R2", capacity=30, floor=2),
+        sample_room(room_id="R3", capacity=30, wheelchair=False, floor=2),
+    ]
+    booked = sample_group("10:00", "11:00")
+    rooms[1].add_booking(booked.start, booked.end, booked)
+    return RoomIndex(rooms)
+
+def test_feature_index_matches_requirements():
+    index = build_index()
+    assert [r.id for r in index.compatible_rooms(RoomRequirements())] == ["R1", "R2", "R3"]
+    assert [r.id for r in index.compatible_rooms(RoomRequirements(size=20, projector=True))] == ["R2", "R3"]
+    assert [r.id for r in index.compatible_rooms(RoomRequirements(wheelchair_access=True, floor_preference=2))] == ["R2"]
+
+def test_free_rooms_respects_bookings_and_gap():
+    index = build_index()
+    needs = RoomRequirements(size=20)
+    assert [r.id for r in index.free_rooms(at("11:10"), at("12:00"), 10, needs)] == ["R2", "R3"]
+    assert [r.id for r in index.free_rooms(at("11:05"), at("12:00"), 10, needs)] == ["R3"]
+
+def test_free_rooms_agrees_with_check_time_overlap():
+    room = sample_room()
+    for start, end in (("09:00", "10:00"), ("12:00", "13:00")):
+        booked = sample_group(start, end)
+        room.add_booking(booked.start, booked.end, booked)
+    index = RoomIndex([room])
+    for start, end in (("10:05", "11:55"), ("10:15", "11:45"), ("08:00", "08:55"), ("13:00", "14:00")):
+        probe = sample_group(start, end)
+        assert bool(index.free_rooms(probe.start, probe.end, 10)) == check_time_overlap(probe, room, 10)
+
+def test_next_free_slot_skips_busy_time():
+    index = build_index()
+    room, start, end = index.next_free_slot(90, at("09:00"), 10, RoomRequirements(wheelchair_access=True, floor_preference=2))
+    assert (room.id, start, end) == ("R2", at("11:10"), at("12:40"))
+
+def test_added_bookings_are_indexed():
+    index = build_index()
+    index.add_booking("R3", at("11:00"), at("12:00"))
+    assert [r.id for r in index.free_rooms(at("11:30"), at("11:45"), 0, RoomRequirements(size=20))] == ["R2"]
+    assert index.next_free_slot(30, at("09:00"), 0, RoomRequirements(size=50)) is None
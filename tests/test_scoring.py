@@ -0,0 +1,70 @@
+"""
+Module Name: test_scoring.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for the soft-constraint scores and the optimizing engine.
+"""
+
+import random
+import pytest
+from dataclasses import replace
+from src.scoring import Weights, optimize_assignment, parse_weights, score_breakdown, _LocalSearch
+from src.solver import assign_groups
+from test_helper import placement, sample_group, sample_room
+
+def test_full_preferred_floor_falls_back_to_nearest_floor():
+    rooms = [sample_room("R1", floor=1), sample_room("R2", floor=2), sample_room("R3", floor=4)]
+    groups = [sample_group("10:00", "11:00", floor=1, group_id="G1"),
+              sample_group("10:00", "11:00", floor=1, group_id="G2")]
+    assert assign_groups(groups, rooms, 10) is None  # infeasible while the floor is a hard constraint
+
+    result = optimize_assignment(groups, rooms, 10, Weights(floor=1, capacity_fit=0, room_changes=0))
+    assert sorted(placement(result.rooms).values()) == ["R1", "R2"]
+    assert result.score == pytest.approx(1.5)
+
+def test_hard_constraints_are_never_relaxed():
+    rooms = [sample_room("R1", capacity=5, floor=2), sample_room("R2", capacity=20, floor=1)]
+    groups = [sample_group("10:00", "11:00", size=10, floor=2)]
+    assert placement(optimize_assignment(groups, rooms, 10).rooms) == {"G1": "R2"}
+    assert optimize_assignment(groups + [sample_group("10:30", "11:30", size=10, group_id="G2")], rooms, 10) is None
+
+def test_local_search_keeps_cohort_in_one_room():
+    # Best-fit alone puts the second session in the snug room R1; with a room-change weight the
+    # optimizer moves the cohort's sessions together
+    rooms = [sample_room("R1", capacity=10), sample_room("R2", capacity=12)]
+    groups = [replace(sample_group("09:00", "10:00", size=11, group_id="A"), _cohort="C1"),
+              replace(sample_group("10:30", "11:30", size=10, group_id="B"), _cohort="C1")]
+    result = optimize_assignment(groups, rooms, 10, Weights(room_changes=5))
+    assert placement(result.rooms) == {"A": "R2", "B": "R2"}
+    assert result.moves == 1
+    assert [row["RoomChange"] for row in result.breakdown] == ["5.000", "5.000"]
+
+def test_incremental_delta_matches_full_rescore():
+    rng = random.Random(7)
+    rooms = [sample_room(f"R{i}", capacity=rng.randint(5, 30), floor=rng.randint(1, 3)) for i in range(6)]
+    groups = [replace(sample_group(f"{h:02d}:00", f"{h:02d}:50", size=rng.randint(1, 5),
+                                   floor=rng.choice([-1, 1, 2, 3]), group_id=f"G{i}"), _cohort=f"C{i % 3}")
+              for i, h in enumerate(rng.choices(range(8, 16), k=12))]
+    result = optimize_assignment(groups, rooms, 10)
+    search = _LocalSearch(groups, {g.id: rooms for g in groups}, 10, Weights(),
+                          {group.id: room for room in result.rooms for _, _, group in room.schedule})
+
+    def total():
+        return sum(float(row["Score"]) for row in score_breakdown(groups, search.placement, Weights()))
+
+    for _ in range(50):
+        changes = {group.id: rng.choice(rooms) for group in rng.sample(groups, 2)}
+        expected = total()
+        saved = dict(search.placement)
+        search.placement.update(changes)
+        expected = total() - expected
+        search.placement.clear()
+        search.placement.update(saved)
+        assert search.delta(changes) == pytest.approx(expected, abs=0.01)
+
+def test_parse_weights():
+    assert parse_weights("floor=2, room_changes=0.5") == Weights(floor=2, capacity_fit=1, room_changes=0.5)
+    assert parse_weights("") == Weights()
+    with pytest.raises(ValueError, match="Unknown weight"):
+        parse_weights("building=1")
+    with pytest.raises(ValueError, match="expected a number"):
+        parse_weights("floor=high")
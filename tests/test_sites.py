@@ -0,0 +1,138 @@
+"""
+Module Name: test_sites.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for site pinning, cohort travel rules and the per-site sharded solver.
+"""
+
+import random
+import pytest
+from dataclasses import replace
+from src.solver import assign_groups
+from src.sites import TransitionRules, load_transition_rules, solve_sharded, cohort_links, solve_jointly
+from src.validators import InputValidationError
+from test_helper import assert_valid_assignment, placement, sample_group, sample_room
+
+def on_site(room, site):
+    return replace(room, _site=site)
+
+def session(start, end, group_id, cohort="", site="", **kwargs):
+    return replace(sample_group(start, end, group_id=group_id, **kwargs), _cohort=cohort, _site=site)
+
+def test_pinned_groups_stay_on_their_site():
+    rooms = [on_site(sample_room("A1"), "North"), on_site(sample_room("B1"), "South")]
+    groups = [session("09:00", "10:00", "P", site="South"), session("09:00", "10:00", "F")]
+    result = solve_sharded(groups, rooms, 10, workers=1)
+    assert placement(result) == {"P": "B1", "F": "A1"}
+
+def test_cohort_needs_travel_gap_between_sites():
+    rooms = [on_site(sample_room("A1"), "North"), on_site(sample_room("B1"), "South")]
+    groups = [session("09:00", "10:00", "First", cohort="C", site="North"),
+              session("10:10", "11:00", "Busy", site="North"),
+              session("10:15", "11:00", "Second", cohort="C")]
+
+    far = TransitionRules({("North", "South"): 30})
+    assert solve_sharded(groups, rooms, 10, far, workers=1) is None
+
+    near = TransitionRules({("South", "North"): 15})  # a rule covers both directions
+    result = solve_sharded(groups, rooms, 10, near, workers=1)
+    assert placement(result)["Second"] == "B1"
+    assert_valid_assignment(groups, rooms, placement(result), 10, rules=near)
+
+def test_sharded_solver_agrees_with_joint_solve():
+    rng = random.Random(3)
+    rules = TransitionRules({("North", "South"): 20, ("South", "East"): 45})
+    for trial in range(25):
+        rooms = [on_site(sample_room(f"R{i}", capacity=rng.randint(5, 15), projector=rng.random() < 0.5),
+                         rng.choice(["North", "South", "East"])) for i in range(5)]
+        groups = [session(f"{h:02d}:{m:02d}", f"{h + 1:02d}:{m:02d}", f"G{i}", cohort=rng.choice(["", "C1", "C2"]),
+                          site=rng.choice(["", "", "North"]), size=rng.randint(1, 12), projector=rng.random() < 0.3)
+                  for i, (h, m) in enumerate((rng.randint(8, 12), rng.choice([0, 30])) for _ in range(7))]
+        groups = [g for g in groups if not g.site or any(room.site == g.site for room in rooms)]
+
+        joint = solve_jointly(groups, rooms, 10, rules, None, cohort_links(groups))
+        expected = joint is not None
+        for room in rooms:
+            room.clear_schedule()
+
+        result = solve_sharded(groups, rooms, 10, rules, workers=1, max_attempts=2)
+        assert (result is not None) == expected, f"trial {trial}"
+        if result is not None:
+            assert_valid_assignment(groups, rooms, placement(result), 10, rules=rules)
+        for room in rooms:
+            room.clear_schedule()
+
+def test_cohort_on_other_site_may_overlap_without_rules():
+    rooms = [on_site(sample_room("R0"), "A"), on_site(sample_room("R1"), "A"), on_site(sample_room("R2"), "B")]
+    groups = [session("09:30", "10:00", "G0", cohort="c2", site="B"), session("09:30", "10:00", "G1"),
+              session("09:30", "10:00", "G2", cohort="c2")]
+    result = solve_sharded(groups, rooms, 10, workers=1)
+    assert result is not None
+    assert_valid_assignment(groups, rooms, placement(result), 10, rules=TransitionRules())
+
+def test_sharded_solver_without_rules_agrees_with_single_search():
+    rng = random.Random(7)
+    for trial in range(40):
+        rooms = [on_site(sample_room(f"R{i}", capacity=rng.randint(5, 15), projector=rng.random() < 0.5),
+                         rng.choice(["North", "South"])) for i in range(4)]
+        groups = [session(f"{h:02d}:{m:02d}", f"{h + 1:02d}:{m:02d}", f"G{i}", cohort=rng.choice(["", "C1", "C2"]),
+                          site=rng.choice(["", "", "North"]), size=rng.randint(1, 12), projector=rng.random() < 0.3)
+                  for i, (h, m) in enumerate((rng.randint(8, 10), rng.choice([0, 30])) for _ in range(7))]
+        groups = [g for g in groups if not g.site or any(room.site == g.site for room in rooms)]
+
+        expected = assign_groups(groups, rooms, 10) is not None
+        for room in rooms:
+            room.clear_schedule()
+
+        result = solve_sharded(groups, rooms, 10, workers=1, max_attempts=2)
+        assert (result is not None) == expected, f"trial {trial}"
+        if result is not None:
+            assert_valid_assignment(groups, rooms, placement(result), 10, rules=TransitionRules())
+        for room in rooms:
+            room.clear_schedule()
+
+def test_shards_run_in_worker_processes():
+    rooms = [on_site(sample_room(f"{site}{i}"), site) for site in ("N", "S") for i in range(2)]
+    groups = [session("09:00", "10:00", f"{site}{i}", site=site) for site in ("N", "S") for i in range(2)]
+    result = solve_sharded(groups, rooms, 10, workers=2)
+    assert {group_id: room_id[0] for group_id, room_id in placement(result).items()} == \
+           {"N0": "N", "N1": "N", "S0": "S", "S1": "S"}
+
+def test_load_transition_rules(tmp_path):
+    path = tmp_path / "rules.csv"
+    path.write_text("FromSite,ToSite,Gap\nNorth,South,25\nSouth,East,x\n,East,5\n")
+    with pytest.raises(InputValidationError) as error:
+        load_transition_rules(str(path))
+    assert len(error.value.errors) == 2 and "(line 3)" in error.value.errors[0]
+
+    path.write_text("FromSite,ToSite,Gap\nNorth,South,25\n")
+    assert load_transition_rules(str(path)).gap("South", "North") == 25
+
+def test_diagnose_reports_travel_conflict():
+    from src.diagnose import find_infeasible_core
+
+    rooms = [on_site(sample_room("A1"), "North"), on_site(sample_room("B1"), "South")]
+    groups = [session("09:00", "10:00", "First", cohort="C", site="North"),
+              session("10:10", "11:00", "Busy", site="North"),
+              session("10:15", "11:00", "Second", cohort="C"),
+              session("14:00", "15:00", "Later")]
+    core = find_infeasible_core(groups, rooms, 10, TransitionRules({("North", "South"): 30}))
+    assert sorted(group.id for group in core.groups) == ["Busy", "First", "Second"]
+    assert core.reason.endswith("travel time between sites")
+
+def test_joint_solve_keeps_identical_cohort_sessions_apart():
+    # X1 and X2 look identical, but only the one cohort_predecessors puts last must reach Y in time
+    rooms = [on_site(sample_room("RN", capacity=10), "N"), on_site(sample_room("RS", capacity=11), "S"),
+             on_site(sample_room("RE", capacity=12, projector=False), "E")]
+    groups = [session("09:00", "10:00", "X1", cohort="C", projector=True),
+              session("09:00", "10:00", "X2", cohort="C", projector=True),
+              session("10:15", "11:00", "Y", cohort="C", site="E")]
+    rules = TransitionRules({("S", "E"): 60})
+
+    result = solve_jointly(groups, rooms, 10, rules, None, cohort_links(groups))
+    assert placement(result) == {"X1": "RS", "X2": "RN", "Y": "RE"}
+    assert_valid_assignment(groups, rooms, placement(result), 10, rules=rules)
+
+    from src.diagnose import find_infeasible_core
+    for room in rooms:
+        room.clear_schedule()
+    assert find_infeasible_core(groups, rooms, 10, rules) is None
@@ -0,0 +1,41 @@
+"""
+Module Name: test_startup.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Startup-time benchmark for the CLI. Runs `validate` under `python -X importtime` and
+checks that heavy modules stay unloaded and that the tool's own imports fit in a time budget.
+"""
+
+import subprocess
+import sys
+
+IMPORT_BUDGET_MS = 150  # cumulative import time of the tool's own modules on the validate path
+HEAVY_MODULES = ("asyncio", "multiprocessing", "concurrent.futures", "numpy",
+                 "src.solver", "src.room_index", "src.ordering", "src.gap_sweep")
+
+def import_times(*cli_args):
+    """
+    Runs the CLI with -X importtime and returns {module: cumulative microseconds}.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-m", "src.room_assign_tool", *cli_args],
+        capture_output=True, text=True, check=True
+    )
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = (int(cumulative), len(name) - len(name.lstrip()))
+    return completed.stdout, times
+
+def test_validate_path_starts_within_budget():
+    stdout, times = import_times("validate", "tests/test_rooms.csv", "tests/test_groups.csv")
+    assert "Input is valid" in stdout
+
+    loaded_heavy = [name for name in times if any(name == m or name.startswith(m + ".") for m in HEAVY_MODULES)]
+    assert loaded_heavy == []
+
+    # Top-level imports are the ones with the smallest indentation in the importtime tree
+    top_level = min(indent for _, indent in times.values())
+    own_ms = sum(us for name, (us, indent) in times.items() if indent == top_level and name.startswith("src")) / 1000
+    assert own_ms < IMPORT_BUDGET_MS, f"tool imports took {own_ms:.1f} ms"
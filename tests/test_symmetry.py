@@ -0,0 +1,52 @@
+"""
+Module Name: test_symmetry.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for room equivalence classes and identical-group symmetry breaking.
+"""
+
+from src.solver import assign_groups
+from src.symmetry import build_symmetry, canonical_order
+from test_helper import sample_group, sample_room
+
+def identical_rooms(count):
+    return [sample_room(room_id=f"R{i}") for i in range(count)]
+
+def identical_groups(count):
+    return [sample_group("10:00", "11:00", group_id=f"G{i}") for i in range(count)]
+
+def test_rooms_with_twins_share_a_class():
+    rooms = identical_rooms(2) + [sample_room(room_id="BIG", capacity=99)]
+    symmetry = build_symmetry([], rooms)
+    assert symmetry.signature(rooms[0]) == symmetry.signature(rooms[1])
+    assert symmetry.signature(rooms[2]) == ("BIG",)
+
+def test_booked_twin_is_no_longer_equivalent():
+    rooms = identical_rooms(2)
+    group = sample_group("10:00", "11:00")
+    rooms[0].add_booking(group.start, group.end, group)
+    symmetry = build_symmetry([group], rooms)
+    assert symmetry.signature(rooms[0]) != symmetry.signature(rooms[1])
+
+def test_canonical_order_groups_identical_groups_together():
+    groups = [
+        sample_group("10:00", "11:00", group_id="A", projector=True),
+        sample_group("10:00", "11:00", group_id="B"),
+        sample_group("10:00", "11:00", group_id="C", projector=True),
+    ]
+    ordered = canonical_order(groups)
+    assert [g.id for g in ordered] == ["B", "A", "C"]
+    assert build_symmetry(ordered, []).same_as_previous == [False, False, True]
+
+def test_symmetry_keeps_feasible_solutions():
+    groups = identical_groups(4) + [sample_group("11:30", "12:00", group_id="LATE", size=50)]
+    rooms = identical_rooms(4) + [sample_room(room_id="HALL", capacity=60)]
+    result = assign_groups(groups, rooms, 10, symmetry=build_symmetry(groups, rooms))
+    assert result is not None
+    placement = {g.id: r.id for r in result for _, _, g in r.schedule}
+    assert len(placement) == 5 and placement["LATE"] == "HALL"
+
+def test_symmetry_collapses_infeasible_search():
+    # Without symmetry breaking this explores 9! arrangements before giving up
+    groups = identical_groups(10)
+    rooms = identical_rooms(9)
+    assert assign_groups(groups, rooms, 10, symmetry=build_symmetry(groups, rooms)) is None
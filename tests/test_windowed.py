@@ -0,0 +1,100 @@
+"""
+Module Name: test_windowed.py
+Project Name: Room Assignment Tool (Imperative Solution)
+File Purpose: Tests for memory-bounded, windowed solving of streamed groups.
+"""
+
+import random
+import pytest
+from datetime import timedelta
+from dataclasses import replace
+from src.solver import assign_groups
+from src.windowed import solve_windowed
+from test_helper import assert_valid_assignment, sample_group, sample_room
+
+def day_groups(days, per_day, rng):
+    # `per_day` overlapping morning groups on each day, so every day is its own window
+    for day in range(days):
+        for i in range(per_day):
+            hour = 9 + i * 3 // per_day
+            group = sample_group(f"{hour:02d}:00", f"{hour + 1:02d}:30", size=rng.randint(1, 10),
+                                 group_id=f"D{day}-{i}")
+            shift = timedelta(days=day)
+            yield replace(group, _start=group.start + shift, _end=group.end + shift)
+
+def collect():
+    placed = []
+    return placed, lambda group, room: placed.append((group, room))
+
+def assert_valid(placed, rooms, time_gap):
+    assert_valid_assignment([group for group, _ in placed], rooms, {group.id: room.id for group, room in placed}, time_gap)
+
+def test_peak_memory_follows_concurrency_not_length():
+    rooms = [sample_room(f"R{i}") for i in range(4)]
+    placed, emit = collect()
+    result = solve_windowed(day_groups(500, 4, random.Random(1)), rooms, 10, emit)
+
+    assert result.feasible and result.exact
+    assert (result.groups, result.windows, result.peak_live) == (2000, 500, 4)
+    assert len(placed) == 2000
+    assert all(room.schedule == [] for room in rooms)
+    assert_valid(placed, rooms, 10)
+
+def test_verdict_matches_full_solve_when_windows_are_cut():
+    rng = random.Random(5)
+    for _ in range(20):
+        groups = sorted(day_groups(3, rng.randint(2, 5), rng), key=lambda g: g.start)
+        rooms = [sample_room(f"R{i}", capacity=rng.randint(4, 10)) for i in range(3)]
+        expected = assign_groups(groups, rooms, 10) is not None
+        for room in rooms:
+            room.clear_schedule()
+
+        placed, emit = collect()
+        result = solve_windowed(iter(groups), rooms, 10, emit)
+        assert result.feasible == expected and result.exact
+        if expected:
+            assert_valid(placed, rooms, 10)
+
+def test_chained_schedule_is_split_at_max_window():
+    # Back-to-back bookings never leave a cut; the frontier carries the overlap between windows
+    rooms = [sample_room("R1"), sample_room("R2")]
+    groups = []
+    for i in range(40):
+        group = sample_group("09:00", "10:00", group_id=f"G{i}")
+        shift = timedelta(minutes=35 * i)
+        groups.append(replace(group, _start=group.start + shift, _end=group.end + shift))
+
+    placed, emit = collect()
+    result = solve_windowed(groups, rooms, 5, emit, max_window=6)
+    assert result.feasible and not result.exact
+    assert result.windows == 7 and result.peak_live <= 8
+    assert len(placed) == 40
+    assert_valid(placed, rooms, 5)
+
+def test_unsorted_stream_is_rejected():
+    groups = [sample_group("10:00", "11:00", group_id="A"), sample_group("09:00", "09:30", group_id="B")]
+    with pytest.raises(ValueError, match="sorted by start"):
+        solve_windowed(groups, [sample_room()], 10, lambda group, room: None)
+
+def test_cli_keeps_previous_output_when_windowed_solve_fails(tmp_path, monkeypatch, capsys):
+    from src.room_assign_tool import main
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "rooms.csv").write_text("RoomID,Capacity,WheelchairAccess,Projector,Computer,FloorLevel\n"
+                                        "R1,30,TRUE,TRUE,TRUE,1\n")
+    header = "GroupID,Size,WheelchairAccess,Projector,Computer,FloorPreference,Start,End\n"
+    (tmp_path / "groups.csv").write_text(header + "G1,10,FALSE,FALSE,FALSE,-1,2025-02-07 08:00,2025-02-07 09:00\n"
+                                                  "G2,10,FALSE,FALSE,FALSE,-1,2025-02-08 08:00,2025-02-08 09:00\n"
+                                                  "G3,10,FALSE,FALSE,FALSE,-1,2025-02-08 08:30,2025-02-08 09:30\n")
+    (tmp_path / "assignments.csv").write_text("previous\n")
+
+    with pytest.raises(SystemExit):
+        main(["solve", "rooms.csv", "groups.csv", "10", "--windowed"])
+    assert "incomplete" in capsys.readouterr().out
+    assert (tmp_path / "assignments.csv").read_text() == "previous\n"
+    assert "G1,R1" in (tmp_path / "assignments.csv.partial").read_text()
+
+    (tmp_path / "groups.csv").write_text(header + "G1,10,FALSE,FALSE,FALSE,-1,2025-02-07 08:00,2025-02-07 09:00\n")
+    main(["solve", "rooms.csv", "groups.csv", "10", "--windowed"])
+    assert "G1,R1" in (tmp_path / "assignments.csv").read_text()
+    assert not (tmp_path / "assignments.csv.partial").exists()